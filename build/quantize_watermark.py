@@ -0,0 +1,116 @@
+"""Hilfsskript: Erzeugt ein INT8-quantisiertes ONNX-Watermark-Modell fuer CPU-Inferenz.
+
+Verwendung:
+    python build/quantize_watermark.py <Kalibrierungs-Ordner> [--limit 200]
+
+Exportiert models/best.pt nach ONNX (FP32) und quantisiert es statisch mit
+~200 repraesentativen Watermark-Bildern zu models/best_int8.onnx.
+WatermarkDetector nutzt diese Datei automatisch fuer CPU-Inferenz und als
+Fallback bei GPU-Fehlern.
+
+Benoetigt zusaetzlich: onnx, onnxruntime (nur zum Bauen, nicht zur Laufzeit).
+"""
+
+import argparse
+import os
+import sys
+
+import numpy as np
+
+# Projekt-Root in den Pfad aufnehmen
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, project_root)
+
+INPUT_SIZE = 640
+
+
+def _letterbox(image: np.ndarray, size: int = INPUT_SIZE) -> np.ndarray:
+    """Skaliert seitenverhaeltnistreu und fuellt auf size x size auf (wie YOLO)."""
+    import cv2
+
+    h, w = image.shape[:2]
+    scale = size / max(h, w)
+    new_w, new_h = int(round(w * scale)), int(round(h * scale))
+    resized = cv2.resize(image, (new_w, new_h), interpolation=cv2.INTER_LINEAR)
+    canvas = np.full((size, size, 3), 114, dtype=np.uint8)
+    top = (size - new_h) // 2
+    left = (size - new_w) // 2
+    canvas[top : top + new_h, left : left + new_w] = resized
+    return canvas
+
+
+def _make_reader(onnx_path: str, image_paths: list[str]):
+    """Erzeugt einen CalibrationDataReader ueber die Kalibrierungsbilder."""
+    import onnxruntime as ort
+    from onnxruntime.quantization import CalibrationDataReader
+
+    from src.utils.file_manager import FileManager
+
+    input_name = ort.InferenceSession(
+        onnx_path, providers=["CPUExecutionProvider"]
+    ).get_inputs()[0].name
+
+    class _Reader(CalibrationDataReader):
+        def __init__(self) -> None:
+            self._paths = iter(image_paths)
+
+        def get_next(self) -> dict | None:
+            for path in self._paths:
+                image = FileManager.load_image(path)
+                if image is None:
+                    continue
+                rgb = _letterbox(image)[:, :, ::-1]
+                tensor = np.ascontiguousarray(rgb.transpose(2, 0, 1), dtype=np.float32)
+                return {input_name: tensor[None] / 255.0}
+            return None
+
+    return _Reader()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("calibration_dir", help="Ordner mit Beispielbildern")
+    parser.add_argument("--model", default="models/best.pt")
+    parser.add_argument("--limit", type=int, default=200)
+    args = parser.parse_args()
+
+    from onnxruntime.quantization import QuantFormat, QuantType, quantize_static
+    from ultralytics import YOLO
+
+    from src.core.watermark import WatermarkDetector
+    from src.utils.file_manager import FileManager
+
+    model_path = os.path.join(project_root, args.model)
+    if not os.path.exists(model_path):
+        print(f"FEHLER: Modell nicht gefunden: {model_path}")
+        sys.exit(1)
+
+    image_paths = FileManager.scan_directory(args.calibration_dir)[: args.limit]
+    if not image_paths:
+        print(f"FEHLER: Keine Bilder in: {args.calibration_dir}")
+        sys.exit(1)
+
+    # Schritt 1: FP32-ONNX mit fester Eingabegroesse exportieren
+    fp32_path = YOLO(model_path).export(
+        format="onnx", imgsz=INPUT_SIZE, dynamic=False, simplify=True
+    )
+    int8_path = (
+        os.path.splitext(model_path)[0] + WatermarkDetector.INT8_MODEL_SUFFIX
+    )
+
+    # Schritt 2: Statische Quantisierung (QDQ, per-channel Gewichte)
+    quantize_static(
+        fp32_path,
+        int8_path,
+        _make_reader(fp32_path, image_paths),
+        quant_format=QuantFormat.QDQ,
+        per_channel=True,
+        weight_type=QuantType.QInt8,
+        activation_type=QuantType.QUInt8,
+    )
+    print(f"INT8-Modell erstellt: {int8_path}")
+    print(f"  Kalibrierungsbilder: {len(image_paths)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -2,11 +2,20 @@
 
 import numpy as np
 
-from src.core.detector import BoundingBox
+from src.core.detector import BoundingBox, BoundingBoxes
 from src.utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+# Numba ist optional: ohne Installation rechnet die Attribut-Schleife in Python
+# Numba is optional: without it the attribute-based Python loop is used
+try:
+    from numba import njit
+
+    HAVE_NUMBA = True
+except ImportError:  # pragma: no cover - abhaengig von der Umgebung
+    HAVE_NUMBA = False
+
 
 class CropRegion:
     """Definiert einen Crop-Bereich."""
@@ -29,35 +38,108 @@ class CropRegion:
         return f"CropRegion({self.x1}, {self.y1}, {self.x2}, {self.y2})"
 
 
-class CropEngine:
-    """Berechnet Crop-Regionen und schneidet Bilder zu."""
+def _crop_bounds_from_boxes(
+    person_boxes: list[BoundingBox],
+    watermark_boxes: list[BoundingBox] | None,
+    img_h: int,
+    img_w: int,
+    padding_percent: float,
+    watermark_percent: float,
+) -> tuple[int, int, int, int]:
+    """Box-Arithmetik von calculate_crop_region direkt auf den BoundingBoxen.
 
-    @staticmethod
-    def calculate_crop_region(
-        image_shape: tuple[int, ...],
-        person_boxes: list[BoundingBox],
-        padding_percent: float = 10.0,
-        watermark_boxes: list[BoundingBox] | None = None,
-        watermark_percent: float = 0.0,
-    ) -> CropRegion | None:
-        """Berechnet die optimale Crop-Region.
+    Ohne Numba der schnellste Weg: kein Umpacken in Arrays, Attributzugriff
+    statt Indexierung einzelner NumPy-Skalare.
+    """
+    if person_boxes:
+        # Vereinige alle Person-BBoxen
+        min_x = min(b.x1 for b in person_boxes)
+        min_y = min(b.y1 for b in person_boxes)
+        max_x = max(b.x2 for b in person_boxes)
+        max_y = max(b.y2 for b in person_boxes)
 
-        Berücksichtigt Person-BBoxen, Padding und Watermark-Vermeidung.
-        Watermarks außerhalb des ursprünglichen Crop-Bereichs werden ignoriert.
-        Wenn keine Person erkannt wird, wird das gesamte Bild als Basis
-        genommen und nur das Watermark entfernt.
+        # Padding hinzufügen
+        pad_x = int((max_x - min_x) * padding_percent / 100)
+        pad_y = int((max_y - min_y) * padding_percent / 100)
 
-        If no persons are detected, uses the full image as base and only
-        removes watermarks.
-        """
-        img_h, img_w = image_shape[:2]
+        crop_x1 = max(0, min_x - pad_x)
+        crop_y1 = max(0, min_y - pad_y)
+        crop_x2 = min(img_w, max_x + pad_x)
+        crop_y2 = min(img_h, max_y + pad_y)
+    else:
+        crop_x1, crop_y1, crop_x2, crop_y2 = 0, 0, img_w, img_h
+
+    # Watermark-Vermeidung: manueller Modus (Prozent vom unteren Rand)
+    if watermark_percent > 0:
+        wm_top = int(img_h * (1 - watermark_percent / 100))
+        if crop_y2 > wm_top:
+            crop_y2 = wm_top
 
-        if person_boxes:
+    # Watermark-Vermeidung: Auto-Modus, gleiche Regeln wie _calc_crop_bounds
+    # Auto mode, same dominant-axis rules as _calc_crop_bounds
+    for wb in watermark_boxes or ():
+        # Prüfe ob Watermark den Crop-Bereich schneidet oder darin liegt
+        overlaps_x = wb.x1 < crop_x2 and wb.x2 > crop_x1
+        overlaps_y = wb.y1 < crop_y2 and wb.y2 > crop_y1
+
+        if overlaps_x and overlaps_y:
+            wm_center_y = (wb.y1 + wb.y2) / 2
+            wm_center_x = (wb.x1 + wb.x2) / 2
+            crop_mid_y = (crop_y1 + crop_y2) / 2
+            crop_mid_x = (crop_x1 + crop_x2) / 2
+            crop_h = max(crop_y2 - crop_y1, 1)
+            crop_w = max(crop_x2 - crop_x1, 1)
+
+            dist_y = abs(wm_center_y - crop_mid_y) / crop_h
+            dist_x = abs(wm_center_x - crop_mid_x) / crop_w
+
+            if dist_y >= dist_x:
+                if wm_center_y > crop_mid_y:
+                    crop_y2 = min(crop_y2, wb.y1)
+                else:
+                    crop_y1 = max(crop_y1, wb.y2)
+            else:
+                if wm_center_x > crop_mid_x:
+                    crop_x2 = min(crop_x2, wb.x1)
+                else:
+                    crop_x1 = max(crop_x1, wb.x2)
+
+    return crop_x1, crop_y1, crop_x2, crop_y2
+
+
+if HAVE_NUMBA:
+
+    def _boxes_to_array(boxes: list[BoundingBox] | BoundingBoxes | None) -> np.ndarray:
+        """Packt BoundingBoxen in ein (N, 4) int64-Array (x1, y1, x2, y2)."""
+        return BoundingBoxes.from_list(boxes).coords
+
+    # Kein fastmath: Ergebnisse muessen exakt der Python-Schleife entsprechen
+    # No fastmath: results must match the Python loop exactly
+    @njit(cache=True)
+    def _calc_crop_bounds(
+        persons: np.ndarray,
+        watermarks: np.ndarray,
+        img_h: int,
+        img_w: int,
+        padding_percent: float,
+        watermark_percent: float,
+    ) -> tuple[int, int, int, int]:
+        """Box-Arithmetik von calculate_crop_region auf (N, 4)-Arrays.
+
+        Explizite Schleifen statt Reduktionen, damit Numba daraus engen
+        Skalar-Code erzeugt. Validierung und Logging bleiben im Wrapper.
+        """
+        if persons.shape[0] > 0:
             # Vereinige alle Person-BBoxen
-            min_x = min(b.x1 for b in person_boxes)
-            min_y = min(b.y1 for b in person_boxes)
-            max_x = max(b.x2 for b in person_boxes)
-            max_y = max(b.y2 for b in person_boxes)
+            min_x = persons[0, 0]
+            min_y = persons[0, 1]
+            max_x = persons[0, 2]
+            max_y = persons[0, 3]
+            for i in range(1, persons.shape[0]):
+                min_x = min(min_x, persons[i, 0])
+                min_y = min(min_y, persons[i, 1])
+                max_x = max(max_x, persons[i, 2])
+                max_y = max(max_y, persons[i, 3])
 
             # Padding hinzufügen
             pad_x = int((max_x - min_x) * padding_percent / 100)
@@ -68,11 +150,6 @@ class CropEngine:
             crop_x2 = min(img_w, max_x + pad_x)
             crop_y2 = min(img_h, max_y + pad_y)
         else:
-            # Keine Person erkannt → gesamtes Bild als Basis, nur WM entfernen
-            # No person detected → use full image as base, only remove WM
-            has_wm = (watermark_boxes and len(watermark_boxes) > 0) or watermark_percent > 0
-            if not has_wm:
-                return None
             crop_x1, crop_y1, crop_x2, crop_y2 = 0, 0, img_w, img_h
 
         # Watermark-Vermeidung: manueller Modus (Prozent vom unteren Rand)
@@ -89,39 +166,97 @@ class CropEngine:
         # Determines if WM is primarily top/bottom or left/right and
         # only adjusts the dominant axis. Prevents bottom text watermarks
         # from also cropping the sides.
-        if watermark_boxes:
-            for wb in watermark_boxes:
-                # Prüfe ob Watermark den Crop-Bereich schneidet oder darin liegt
-                overlaps_x = wb.x1 < crop_x2 and wb.x2 > crop_x1
-                overlaps_y = wb.y1 < crop_y2 and wb.y2 > crop_y1
-
-                if overlaps_x and overlaps_y:
-                    wm_center_y = (wb.y1 + wb.y2) / 2
-                    wm_center_x = (wb.x1 + wb.x2) / 2
-                    crop_mid_y = (crop_y1 + crop_y2) / 2
-                    crop_mid_x = (crop_x1 + crop_x2) / 2
-                    crop_h = max(crop_y2 - crop_y1, 1)
-                    crop_w = max(crop_x2 - crop_x1, 1)
-
-                    # Normalisierte Distanz vom Crop-Zentrum bestimmt dominante Achse
-                    # Normalized distance from crop center determines dominant axis
-                    dist_y = abs(wm_center_y - crop_mid_y) / crop_h
-                    dist_x = abs(wm_center_x - crop_mid_x) / crop_w
-
-                    if dist_y >= dist_x:
-                        # WM ist primaer oben/unten → nur Y anpassen
-                        # WM is primarily top/bottom → only adjust Y
-                        if wm_center_y > crop_mid_y:
-                            crop_y2 = min(crop_y2, wb.y1)
-                        else:
-                            crop_y1 = max(crop_y1, wb.y2)
+        for i in range(watermarks.shape[0]):
+            wx1 = watermarks[i, 0]
+            wy1 = watermarks[i, 1]
+            wx2 = watermarks[i, 2]
+            wy2 = watermarks[i, 3]
+            # Prüfe ob Watermark den Crop-Bereich schneidet oder darin liegt
+            overlaps_x = wx1 < crop_x2 and wx2 > crop_x1
+            overlaps_y = wy1 < crop_y2 and wy2 > crop_y1
+
+            if overlaps_x and overlaps_y:
+                wm_center_y = (wy1 + wy2) / 2
+                wm_center_x = (wx1 + wx2) / 2
+                crop_mid_y = (crop_y1 + crop_y2) / 2
+                crop_mid_x = (crop_x1 + crop_x2) / 2
+                crop_h = max(crop_y2 - crop_y1, 1)
+                crop_w = max(crop_x2 - crop_x1, 1)
+
+                # Normalisierte Distanz vom Crop-Zentrum bestimmt dominante Achse
+                # Normalized distance from crop center determines dominant axis
+                dist_y = abs(wm_center_y - crop_mid_y) / crop_h
+                dist_x = abs(wm_center_x - crop_mid_x) / crop_w
+
+                if dist_y >= dist_x:
+                    # WM ist primaer oben/unten → nur Y anpassen
+                    # WM is primarily top/bottom → only adjust Y
+                    if wm_center_y > crop_mid_y:
+                        crop_y2 = min(crop_y2, wy1)
+                    else:
+                        crop_y1 = max(crop_y1, wy2)
+                else:
+                    # WM ist primaer links/rechts → nur X anpassen
+                    # WM is primarily left/right → only adjust X
+                    if wm_center_x > crop_mid_x:
+                        crop_x2 = min(crop_x2, wx1)
                     else:
-                        # WM ist primaer links/rechts → nur X anpassen
-                        # WM is primarily left/right → only adjust X
-                        if wm_center_x > crop_mid_x:
-                            crop_x2 = min(crop_x2, wb.x1)
-                        else:
-                            crop_x1 = max(crop_x1, wb.x2)
+                        crop_x1 = max(crop_x1, wx2)
+
+        return crop_x1, crop_y1, crop_x2, crop_y2
+
+
+class CropEngine:
+    """Berechnet Crop-Regionen und schneidet Bilder zu."""
+
+    @staticmethod
+    def calculate_crop_region(
+        image_shape: tuple[int, ...],
+        person_boxes: list[BoundingBox],
+        padding_percent: float = 10.0,
+        watermark_boxes: list[BoundingBox] | None = None,
+        watermark_percent: float = 0.0,
+    ) -> CropRegion | None:
+        """Berechnet die optimale Crop-Region.
+
+        Berücksichtigt Person-BBoxen, Padding und Watermark-Vermeidung.
+        Watermarks außerhalb des ursprünglichen Crop-Bereichs werden ignoriert.
+        Wenn keine Person erkannt wird, wird das gesamte Bild als Basis
+        genommen und nur das Watermark entfernt.
+
+        If no persons are detected, uses the full image as base and only
+        removes watermarks.
+        """
+        img_h, img_w = image_shape[:2]
+
+        if not person_boxes:
+            # Keine Person erkannt → gesamtes Bild als Basis, nur WM entfernen
+            # No person detected → use full image as base, only remove WM
+            has_wm = (watermark_boxes and len(watermark_boxes) > 0) or watermark_percent > 0
+            if not has_wm:
+                return None
+
+        if HAVE_NUMBA:
+            crop_x1, crop_y1, crop_x2, crop_y2 = (
+                int(v)
+                for v in _calc_crop_bounds(
+                    _boxes_to_array(person_boxes),
+                    _boxes_to_array(watermark_boxes),
+                    int(img_h),
+                    int(img_w),
+                    float(padding_percent),
+                    float(watermark_percent),
+                )
+            )
+        else:
+            crop_x1, crop_y1, crop_x2, crop_y2 = _crop_bounds_from_boxes(
+                person_boxes,
+                watermark_boxes,
+                img_h,
+                img_w,
+                padding_percent,
+                watermark_percent,
+            )
 
         # Sicherstellen, dass der Crop-Bereich gültig ist
         if crop_x2 <= crop_x1 or crop_y2 <= crop_y1:
@@ -139,3 +274,48 @@ class CropEngine:
     def crop_image(image: np.ndarray, region: CropRegion) -> np.ndarray:
         """Schneidet das Bild anhand der CropRegion zu."""
         return image[region.y1 : region.y2, region.x1 : region.x2].copy()
+
+    @staticmethod
+    def crop_view(image: np.ndarray, region: CropRegion) -> np.ndarray:
+        """Zuschnitt als View ohne Kopie (nur für Vorschauen, teilt den Speicher)."""
+        return image[region.y1 : region.y2, region.x1 : region.x2]
+
+    @staticmethod
+    def crop_into(image: np.ndarray, region: CropRegion, out: np.ndarray) -> np.ndarray:
+        """Kopiert die Region in einen vorallozierten Puffer und gibt ihn zurück.
+
+        Für wiederholte Crops gleicher Größe (z. B. feste ROI): spart die
+        Allokation von crop_image. ``out`` muss Shape und dtype der Region haben.
+        """
+        np.copyto(out, image[region.y1 : region.y2, region.x1 : region.x2])
+        return out
+
+    @staticmethod
+    def crop_images_batch(
+        image: np.ndarray, regions: list[CropRegion], copy: bool = False
+    ) -> list[np.ndarray]:
+        """Schneidet mehrere Regionen aus einem Bild; Grenzen einmal vektorisiert geklemmt.
+
+        ``copy=False`` liefert Views wie crop_view. ``copy=True`` liefert
+        eigenständige Arrays, alle aus einem gemeinsam allozierten Puffer.
+        """
+        if not regions:
+            return []
+        h, w = image.shape[:2]
+        bounds = np.array([(r.x1, r.y1, r.x2, r.y2) for r in regions], dtype=np.int64)
+        np.clip(bounds, 0, [w, h, w, h], out=bounds)
+        # Leere statt negativer Ausschnitte / empty instead of negative crops
+        np.maximum(bounds[:, 2:], bounds[:, :2], out=bounds[:, 2:])
+        views = [image[y1:y2, x1:x2] for x1, y1, x2, y2 in bounds.tolist()]
+        if not copy:
+            return views
+
+        buffer = np.empty(sum(v.size for v in views), dtype=image.dtype)
+        crops = []
+        offset = 0
+        for view in views:
+            crop = buffer[offset : offset + view.size].reshape(view.shape)
+            crop[...] = view
+            crops.append(crop)
+            offset += view.size
+        return crops
@@ -13,6 +13,29 @@ from src.utils.logger import get_logger
 logger = get_logger(__name__)
 
 _detection_lock = threading.Lock()
+_cuda_backends_configured = False
+
+
+def _configure_cuda_backends() -> None:
+    """Setzt TF32- und cuDNN-Flags einmalig vor der ersten GPU-Inferenz.
+
+    TF32 für Matmul/Convolution und cuDNN-Benchmark (feste Eingabegrößen);
+    ohne torch oder CUDA passiert nichts.
+    """
+    global _cuda_backends_configured
+    if _cuda_backends_configured:
+        return
+    _cuda_backends_configured = True
+    try:
+        import torch
+
+        if not torch.cuda.is_available():
+            return
+        torch.backends.cuda.matmul.allow_tf32 = True
+        torch.backends.cudnn.allow_tf32 = True
+        torch.backends.cudnn.benchmark = True
+    except Exception as e:
+        logger.debug("CUDA-Backend-Flags nicht gesetzt: %s", e)
 
 
 def _get_model_path(relative_path: str) -> str:
@@ -35,9 +58,13 @@ def _get_model_path(relative_path: str) -> str:
     )
 
 
-@dataclass
+@dataclass(slots=True)
 class BoundingBox:
-    """Bounding Box mit Confidence."""
+    """Bounding Box mit Confidence.
+
+    slots=True: kein Instanz-__dict__, schnellerer Feldzugriff in den
+    Listen-Schleifen; Massen-Arithmetik läuft über BoundingBoxes.
+    """
 
     x1: int
     y1: int
@@ -62,20 +89,92 @@ class BoundingBox:
         return self.width * self.height
 
 
+@dataclass(frozen=True)
+class BoundingBoxes:
+    """Box-Liste als Struct-of-Arrays: coords (N, 4) int64, conf (N,) float64.
+
+    Für vektorisierte Arithmetik (Skalierung, Crop-Grenzen); Index-Zugriff und
+    Iteration liefern BoundingBox-Objekte, to_list() die übliche Liste.
+    """
+
+    coords: np.ndarray
+    conf: np.ndarray
+
+    @classmethod
+    def from_arrays(cls, xyxy: Any, conf: Any) -> "BoundingBoxes":
+        """Aus (N, 4)-Koordinaten und (N,)-Konfidenzen; Koordinaten werden abgeschnitten."""
+        return cls(
+            np.asarray(xyxy).reshape(-1, 4).astype(np.int64),
+            np.asarray(conf, dtype=np.float64).reshape(-1),
+        )
+
+    @classmethod
+    def from_list(cls, boxes: "list[BoundingBox] | BoundingBoxes | None") -> "BoundingBoxes":
+        if isinstance(boxes, BoundingBoxes):
+            return boxes
+        if not boxes:
+            return cls.from_arrays(np.empty((0, 4)), np.empty(0))
+        return cls(
+            np.array([(b.x1, b.y1, b.x2, b.y2) for b in boxes], dtype=np.int64),
+            np.array([b.confidence for b in boxes], dtype=np.float64),
+        )
+
+    @classmethod
+    def concatenate(cls, parts: "list[BoundingBoxes]") -> "BoundingBoxes":
+        """Hängt mehrere Container aneinander (Reihenfolge bleibt erhalten)."""
+        if not parts:
+            return cls.from_list(None)
+        return cls(
+            np.concatenate([p.coords for p in parts]),
+            np.concatenate([p.conf for p in parts]),
+        )
+
+    def select(self, index: Any) -> "BoundingBoxes":
+        """Teilmenge per Bool-Maske oder Index-Array, ohne BoundingBox-Objekte."""
+        return BoundingBoxes(self.coords[index], self.conf[index])
+
+    def __len__(self) -> int:
+        return len(self.conf)
+
+    def __getitem__(self, index: int) -> BoundingBox:
+        x1, y1, x2, y2 = self.coords[index].tolist()
+        return BoundingBox(x1, y1, x2, y2, float(self.conf[index]))
+
+    def __iter__(self):
+        return iter(self.to_list())
+
+    def to_list(self) -> list[BoundingBox]:
+        return [
+            BoundingBox(x1, y1, x2, y2, conf)
+            for (x1, y1, x2, y2), conf in zip(self.coords.tolist(), self.conf.tolist())
+        ]
+
+
 class PersonDetector:
     """YOLOv8-basierte Personenerkennung."""
 
     PERSON_CLASS_ID = 0  # COCO Klasse 0 = Person
+    # Groesse des Dummy-Frames fuer den Warm-up-Pass / Warm-up dummy frame size
+    WARMUP_SIZE = 640
+    # Geladene Models pro (Pfad, Device), geteilt zwischen Instanzen (Vorschau
+    # und Batch); Inferenz ist ohnehin ueber _detection_lock serialisiert
+    # Loaded models per (path, device), shared by all detector instances
+    _model_cache: dict[tuple[str, str], Any] = {}
+    _model_cache_lock = threading.Lock()
 
     def __init__(
         self,
         model_path: str = "models/yolov8n.pt",
         confidence: float = 0.5,
         use_gpu: bool = True,
+        half: bool | None = None,
     ):
         self._model_path = model_path
         self._confidence = confidence
         self._use_gpu = use_gpu
+        # FP16 nur auf CUDA; None = Standard (an, sobald die GPU genutzt wird)
+        # FP16 only ever applies on CUDA; None keeps the default (on with GPU)
+        self._half = True if half is None else half
         self._model: Any | None = None
         self._last_error: str | None = None
 
@@ -96,19 +195,58 @@ class PersonDetector:
             )
             return False
 
+        device = "cuda" if self._use_gpu else "cpu"
+        key = (os.path.abspath(model_path), device)
+        with self._model_cache_lock:
+            cached = self._model_cache.get(key)
+        if cached is not None:
+            self._model = cached
+            logger.debug("Model aus Cache: %s (device: %s)", model_path, device)
+            return True
+
         try:
             from ultralytics import YOLO
 
             self._model = YOLO(model_path)
-            device = "cuda" if self._use_gpu else "cpu"
-            # Warm-up-Inference um GPU-Init zu triggern
+            if self._use_gpu:
+                _configure_cuda_backends()
             logger.info("Model geladen: %s (device: %s)", model_path, device)
+            # Warm-up-Inference um GPU-Init zu triggern (laeuft im Loader-Thread)
+            # Warm-up inference triggers GPU init (runs in the loader thread)
+            self._warmup()
+            with self._model_cache_lock:
+                self._model = self._model_cache.setdefault(key, self._model)
             return True
         except Exception as e:
             self._last_error = str(e)
             logger.error("Fehler beim Laden des Models: %s", e, exc_info=True)
             return False
 
+    def _warmup(self) -> None:
+        """Dummy-Inferenz direkt nach dem Laden (CUDA-Init, cuDNN-Autotune).
+
+        Runs two forward passes on a blank frame so the first preview does
+        not pay the cold-start cost. Failures are non-fatal.
+        """
+        if self._model is None:
+            return
+        device = "cuda" if self._use_gpu else "cpu"
+        dummy = np.zeros((self.WARMUP_SIZE, self.WARMUP_SIZE, 3), dtype=np.uint8)
+        try:
+            with _detection_lock:
+                for _ in range(2):
+                    self._model(
+                        dummy,
+                        conf=0.99,
+                        device=device,
+                        half=self._half and device == "cuda",
+                        classes=[self.PERSON_CLASS_ID],
+                        verbose=False,
+                    )
+            logger.debug("Person-Model aufgewaermt (device: %s)", device)
+        except Exception as e:
+            logger.warning("Person-Warm-up fehlgeschlagen: %s", e)
+
     @property
     def last_error(self) -> str | None:
         """Gibt die letzte Fehlermeldung beim Model-Laden zurück."""
@@ -118,22 +256,36 @@ class PersonDetector:
         self, image: np.ndarray, confidence: float | None = None
     ) -> list[BoundingBox]:
         """Erkennt Personen im Bild. Thread-safe durch Lock."""
+        return self.detect_batch([image], confidence)[0]
+
+    def detect_batch(
+        self, images: list[np.ndarray], confidence: float | None = None
+    ) -> list[list[BoundingBox]]:
+        """Erkennt Personen in mehreren Bildern mit einem Forward-Pass.
+
+        Ultralytics letterboxt unterschiedlich große Bilder selbst; das
+        Ergebnis enthält genau eine Box-Liste pro Eingabebild.
+        """
+        if not images:
+            return []
         if self._model is None:
             if not self.load_model():
-                return []
+                return [[] for _ in images]
         if self._model is None:
-            return []
+            return [[] for _ in images]
 
         conf = confidence or self._confidence
         device = "cuda" if self._use_gpu else "cpu"
         model = self._model
+        source: Any = images[0] if len(images) == 1 else images
 
         with _detection_lock:
             try:
                 results = model(
-                    image,
+                    source,
                     conf=conf,
                     device=device,
+                    half=self._half and device == "cuda",
                     classes=[self.PERSON_CLASS_ID],
                     verbose=False,
                 )
@@ -141,33 +293,37 @@ class PersonDetector:
                 # GPU-Fallback auf CPU
                 logger.warning("GPU-Fehler, Fallback auf CPU")
                 results = model(
-                    image,
+                    source,
                     conf=conf,
                     device="cpu",
                     classes=[self.PERSON_CLASS_ID],
                     verbose=False,
                 )
 
-        boxes = []
-        for result in results:
-            for box in result.boxes:
-                x1, y1, x2, y2 = box.xyxy[0].cpu().numpy().astype(int)
-                conf_val = float(box.conf[0].cpu().numpy())
-                boxes.append(
-                    BoundingBox(
-                        x1=int(x1),
-                        y1=int(y1),
-                        x2=int(x2),
-                        y2=int(y2),
-                        confidence=conf_val,
-                    )
-                )
-
-        logger.debug("%d Personen erkannt (conf >= %.2f)", len(boxes), conf)
-        return boxes
+        # Ein Device→Host-Transfer pro Ergebnis statt zwei pro Box
+        # One device→host transfer per result instead of two per box
+        per_image = [
+            BoundingBoxes.from_arrays(
+                result.boxes.xyxy.cpu().numpy(), result.boxes.conf.cpu().numpy()
+            ).to_list()
+            for result in results
+        ]
+        # Jeder Eingabe genau ein Ergebnis / Exactly one result per input
+        per_image.extend([] for _ in range(len(images) - len(per_image)))
+
+        logger.debug(
+            "%d Personen in %d Bild(ern) erkannt (conf >= %.2f)",
+            sum(len(boxes) for boxes in per_image),
+            len(images),
+            conf,
+        )
+        return per_image
 
     def set_confidence(self, confidence: float) -> None:
         self._confidence = confidence
 
     def set_gpu(self, use_gpu: bool) -> None:
         self._use_gpu = use_gpu
+
+    def set_half(self, half: bool) -> None:
+        self._half = half
@@ -2,9 +2,12 @@
 
 import os
 import threading
+from collections.abc import Callable
+from dataclasses import dataclass
 from pathlib import Path
+from typing import Any
 
-from PyQt6.QtCore import QThread, pyqtSignal
+from PyQt6.QtCore import QObject, QRunnable, QThread, pyqtSignal
 
 from src.core.cropper import CropEngine
 from src.core.detector import BoundingBox, PersonDetector
@@ -16,6 +19,28 @@ from src.utils.stats import StatsCollector
 logger = get_logger(__name__)
 
 
+@dataclass(frozen=True, slots=True)
+class ProcessingConfig:
+    """Einstellungen eines Verarbeitungslaufs (unveränderlich, vom UI erzeugt)."""
+
+    confidence_threshold: float = 0.5
+    padding_percent: float = 10.0
+    jpeg_quality: int = 95
+    max_workers: int = 4
+    use_gpu: bool = True
+    watermark_mode: str = "manual"  # "manual", "auto" oder "disabled"
+    watermark_percent: float = 0.0
+    watermark_confidence: float = 0.30
+    watermark_strict_filter: bool = True
+    watermark_enhanced_detection: bool = False
+    watermark_template_enabled: bool = False
+    watermark_type: str = "logo"  # "logo" oder "text"
+    person_model: str = "models/yolov8n.pt"
+    watermark_model: str = "models/best.pt"
+    person_detection_enabled: bool = True
+    multi_detection_action: str = "ask"
+
+
 class ModelLoaderThread(QThread):
     """Lädt YOLO-Modelle im Hintergrund beim App-Start (kein UI-Freeze).
 
@@ -186,7 +211,8 @@ class ProcessingThread(QThread):
 
     progress = pyqtSignal(int, int, str)  # current, total, filename
     image_processed = pyqtSignal(dict)  # result dict
-    preview_ready = pyqtSignal(str, object, object, list, list)  # path, original, cropped, person_boxes, watermark_boxes
+    # path, original, cropped, person_boxes, watermark_boxes, crop_region
+    preview_ready = pyqtSignal(str, object, object, list, list, object)
     batch_finished = pyqtSignal(dict)  # summary stats
     error_occurred = pyqtSignal(str)  # error message
     # Signal fuer Auswahl-Dialog / Signal for selection dialog
@@ -200,7 +226,7 @@ class ProcessingThread(QThread):
         self,
         image_paths: list[str],
         output_dir: str,
-        config: dict,
+        config: ProcessingConfig,
         parent=None,
     ):
         super().__init__(parent)
@@ -364,12 +390,12 @@ class ProcessingThread(QThread):
         self.stats.total = len(self._image_paths)
         self.stats.start()
 
-        multi_action = self._config.get("multi_detection_action", "ask")
+        multi_action = self._config.multi_detection_action
         if multi_action != "ask":
             self._auto_rule = multi_action
 
         # Detektoren initialisieren / Initialize detectors
-        person_enabled = self._config.get("person_detection_enabled", True)
+        person_enabled = self._config.person_detection_enabled
         if not person_enabled:
             self.error_occurred.emit(
                 "Personenerkennung darf nicht deaktiviert werden (Crop benoetigt Person-Boxen)."
@@ -377,9 +403,9 @@ class ProcessingThread(QThread):
             return
 
         person_detector = PersonDetector(
-            model_path=self._config.get("person_model", "models/yolov8n.pt"),
-            confidence=self._config.get("confidence_threshold", 0.5),
-            use_gpu=self._config.get("use_gpu", True),
+            model_path=self._config.person_model,
+            confidence=self._config.confidence_threshold,
+            use_gpu=self._config.use_gpu,
         )
         if not person_detector.load_model():
             detail = person_detector.last_error or "Unbekannter Fehler"
@@ -389,16 +415,14 @@ class ProcessingThread(QThread):
             return
 
         watermark_detector = None
-        if self._config.get("watermark_mode") == "auto":
+        if self._config.watermark_mode == "auto":
             watermark_detector = WatermarkDetector(
-                model_path=self._config.get("watermark_model", "models/best.pt"),
-                confidence=self._config.get("watermark_confidence", 0.30),
-                use_gpu=self._config.get("use_gpu", True),
-                strict_filter=self._config.get("watermark_strict_filter", True),
-                enhanced_detection=self._config.get(
-                    "watermark_enhanced_detection", False
-                ),
-                watermark_type=self._config.get("watermark_type", "logo"),
+                model_path=self._config.watermark_model,
+                confidence=self._config.watermark_confidence,
+                use_gpu=self._config.use_gpu,
+                strict_filter=self._config.watermark_strict_filter,
+                enhanced_detection=self._config.watermark_enhanced_detection,
+                watermark_type=self._config.watermark_type,
             )
             if not watermark_detector.load_model():
                 detail = watermark_detector.last_error or "Unbekannter Fehler"
@@ -415,17 +439,17 @@ class ProcessingThread(QThread):
             crop_engine=CropEngine(),
             file_manager=FileManager(),
             output_dir=self._output_dir,
-            jpeg_quality=self._config.get("jpeg_quality", 95),
-            padding_percent=self._config.get("padding_percent", 10.0),
-            watermark_mode=self._config.get("watermark_mode", "manual"),
-            watermark_percent=self._config.get("watermark_percent", 0.0),
+            jpeg_quality=self._config.jpeg_quality,
+            padding_percent=self._config.padding_percent,
+            watermark_mode=self._config.watermark_mode,
+            watermark_percent=self._config.watermark_percent,
         )
 
         # Template-Matching: nur wenn Checkbox aktiviert / Only when template checkbox enabled
         if (
             watermark_detector
             and self._image_paths
-            and self._config.get("watermark_template_enabled", False)
+            and self._config.watermark_template_enabled
         ):
             self._init_template(watermark_detector, self._image_paths[0])
 
@@ -465,6 +489,7 @@ class ProcessingThread(QThread):
                 self.stats.skipped += 1
             else:
                 self.stats.errors += 1
+            self.stats.tick()
 
             self.image_processed.emit(result)
 
@@ -615,8 +640,10 @@ class ProcessingThread(QThread):
                 watermark_percent=wm_percent if processor.watermark_mode == "manual" else 0,
             )
             if region:
-                cropped = processor.crop_engine.crop_image(original, region)
-                self.preview_ready.emit(path, original, cropped, boxes, wm_boxes)
+                cropped = processor.crop_engine.crop_view(original, region)
+                self.preview_ready.emit(
+                    path, original, cropped, boxes, wm_boxes, region
+                )
         except Exception as e:
             logger.debug("Preview-Fehler: %s", e)
 
@@ -639,19 +666,29 @@ class DetectionPreviewThread(QThread):
         self.detection_done.emit(self._image_path, image, boxes)
 
 
-class PreviewLoadThread(QThread):
-    """Thread für vollständiges Preview-Laden mit Fortschrittsanzeige.
-
-    Führt asynchron aus: Bild laden → Personen erkennen → Wasserzeichen erkennen → Zuschneiden.
-    Emittiert Fortschritt nach jedem Schritt.
-    """
+class PreviewLoadSignals(QObject):
+    """Signale eines PreviewLoadTask (QRunnable kann selbst keine Signale haben)."""
 
     # step, total_steps, description
     progress = pyqtSignal(int, int, str)
-    # index, original, cropped, person_boxes, wm_boxes, filename
-    preview_done = pyqtSignal(int, object, object, list, list, str)
+    # index, original (nur bei Mehrfach-Erkennung, sonst None), rendered,
+    # person_boxes, wm_boxes, filename, crop_region
+    preview_done = pyqtSignal(int, object, object, list, list, str, object)
     error_occurred = pyqtSignal(str)  # error message
 
+
+class PreviewLoadTask(QRunnable):
+    """Task für vollständiges Preview-Laden mit Fortschrittsanzeige.
+
+    Führt im QThreadPool aus: Bild laden → Personen erkennen → Wasserzeichen erkennen
+    → Zuschneiden → Vorschau rendern. ``renderer`` erhält (original, cropped,
+    person_boxes, wm_boxes, crop_region) und liefert anzeigefertige Bilder, damit
+    Skalierung und Overlays nicht im GUI-Thread laufen. Das vollaufgelöste
+    Original wird nur bei Mehrfach-Erkennung (Auswahl-Dialog) mitgeschickt.
+    Emittiert Fortschritt nach jedem Schritt über ``signals``. Wird ``cancel_event``
+    gesetzt, bricht der Task zwischen den Schritten ab und emittiert nichts mehr.
+    """
+
     def __init__(
         self,
         image_path: str,
@@ -661,10 +698,14 @@ class PreviewLoadThread(QThread):
         wm_mode: str,
         padding_percent: float,
         wm_percent: float,
+        renderer: Callable[..., Any],
         person_detection_enabled: bool = True,
-        parent=None,
+        cancel_event: threading.Event | None = None,
     ):
-        super().__init__(parent)
+        super().__init__()
+        # Signal-Objekt lebt im GUI-Thread → Emits aus dem Pool werden gequeued
+        # Signal object lives in the GUI thread → emits from the pool are queued
+        self.signals = PreviewLoadSignals()
         self._image_path = image_path
         self._index = index
         self._person_detector = person_detector
@@ -672,9 +713,16 @@ class PreviewLoadThread(QThread):
         self._wm_mode = wm_mode
         self._padding_percent = padding_percent
         self._wm_percent = wm_percent
+        self._renderer = renderer
         self._person_enabled = person_detection_enabled
+        self._cancel_event = cancel_event or threading.Event()
+
+    def _cancelled(self) -> bool:
+        return self._cancel_event.is_set()
 
     def run(self) -> None:
+        if self._cancelled():
+            return
         try:
             filename = Path(self._image_path).name
             total_steps = 4 if (self._wm_mode == "auto" and self._wm_detector) else 3
@@ -683,10 +731,12 @@ class PreviewLoadThread(QThread):
 
             # Schritt 1: Bild laden
             step = 1
-            self.progress.emit(step, total_steps, f"Lade {filename}...")
+            self.signals.progress.emit(step, total_steps, f"Lade {filename}...")
             image = FileManager.load_image(self._image_path)
+            if self._cancelled():
+                return
             if image is None:
-                self.error_occurred.emit(
+                self.signals.error_occurred.emit(
                     f"{filename} konnte nicht geladen werden"
                 )
                 return
@@ -696,21 +746,25 @@ class PreviewLoadThread(QThread):
             person_boxes = []
             if self._person_enabled:
                 step += 1
-                self.progress.emit(step, total_steps, f"Personen erkennen: {filename}...")
+                self.signals.progress.emit(step, total_steps, f"Personen erkennen: {filename}...")
                 person_boxes = self._person_detector.detect(image)
+                if self._cancelled():
+                    return
 
             # Wasserzeichen erkennen (falls Auto)
             wm_boxes = []
             if self._wm_mode == "auto" and self._wm_detector:
                 step += 1
-                self.progress.emit(step, total_steps, f"Wasserzeichen erkennen: {filename}...")
+                self.signals.progress.emit(step, total_steps, f"Wasserzeichen erkennen: {filename}...")
                 wm_boxes = self._wm_detector.detect(image)
+                if self._cancelled():
+                    return
 
             # Letzter Schritt: Zuschneiden
             # Crop auch ohne Person wenn Watermark vorhanden (ganzes Bild minus WM)
             # Crop even without person when watermark present (full image minus WM)
             step += 1
-            self.progress.emit(step, total_steps, f"Zuschneiden: {filename}...")
+            self.signals.progress.emit(step, total_steps, f"Zuschneiden: {filename}...")
             crop_region = None
             cropped = None
             wm_pct = self._wm_percent if self._wm_mode == "manual" else 0
@@ -724,12 +778,59 @@ class PreviewLoadThread(QThread):
                     watermark_percent=wm_pct,
                 )
                 if crop_region:
-                    cropped = CropEngine.crop_image(image, crop_region)
+                    # Nur für die Vorschau → View statt Kopie; bei Mehrfach-Erkennung
+                    # ersetzt die Auswahl diesen Zuschnitt ohnehin
+                    # Preview only → view instead of copy; with multi-detection the
+                    # user's selection replaces this crop anyway
+                    cropped = CropEngine.crop_view(image, crop_region)
 
-            self.preview_done.emit(
-                self._index, image, cropped, person_boxes, wm_boxes, filename
+            if self._cancelled():
+                return
+            rendered = self._renderer(
+                image, cropped, person_boxes, wm_boxes, crop_region
+            )
+            if self._cancelled():
+                return
+            # Vollbild nur für den Auswahl-Dialog über die Thread-Grenze geben
+            # Only hand the full-res image across threads for the selection dialog
+            needs_original = len(person_boxes) > 1 or len(wm_boxes) > 1
+            self.signals.preview_done.emit(
+                self._index,
+                image if needs_original else None,
+                rendered,
+                person_boxes,
+                wm_boxes,
+                filename,
+                crop_region,
             )
 
         except Exception as e:
-            logger.error("Preview-Thread Fehler: %s", e, exc_info=True)
-            self.error_occurred.emit(str(e))
+            logger.error("Preview-Task Fehler: %s", e, exc_info=True)
+            self.signals.error_occurred.emit(str(e))
+
+
+class DirectoryScanSignals(QObject):
+    """Signale eines DirectoryScanTask."""
+
+    scan_progress = pyqtSignal(int)  # bisher gefundene Bilder
+    scan_complete = pyqtSignal(str, list)  # directory, image paths
+
+
+class DirectoryScanTask(QRunnable):
+    """Scannt einen Ordner im QThreadPool, damit die UI bei großen Ordnern
+    (z.B. Netzlaufwerke) nicht blockiert."""
+
+    def __init__(self, directory: str):
+        super().__init__()
+        self.signals = DirectoryScanSignals()
+        self._directory = directory
+
+    def run(self) -> None:
+        try:
+            paths = FileManager.scan_directory(
+                self._directory, progress_callback=self.signals.scan_progress.emit
+            )
+        except OSError as e:
+            logger.error("Ordner-Scan fehlgeschlagen: %s — %s", self._directory, e)
+            paths = []
+        self.signals.scan_complete.emit(self._directory, paths)
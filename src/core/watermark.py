@@ -4,20 +4,42 @@ Zweistufige Wasserzeichen-Erkennung: YOLO-Modell (mit TTA und Preprocessing)
 als Primaererkennung, OpenCV-Template-Matching als Fallback fuer bekannte Logos.
 """
 
+import logging
 import os
+import queue
 import threading
+from collections.abc import Callable
+from concurrent.futures import Future
 from typing import Any
 
 import cv2
 import numpy as np
 
-from src.core.detector import BoundingBox, _get_model_path
+from src.core.detector import (
+    BoundingBox,
+    BoundingBoxes,
+    _configure_cuda_backends,
+    _get_model_path,
+)
 from src.utils.logger import get_logger
 
 logger = get_logger(__name__)
 
 _watermark_lock = threading.Lock()
 
+# CLAHE-Objekte sind nicht thread-sicher → eines pro Thread, wiederverwendet
+# CLAHE objects are not thread-safe → one per thread, reused across calls
+_clahe_local = threading.local()
+
+
+def _detection_clahe() -> cv2.CLAHE:
+    """CLAHE (clipLimit 3.0, 8x8) für die Erkennungs-Vorverarbeitung dieses Threads."""
+    clahe = getattr(_clahe_local, "clahe", None)
+    if clahe is None:
+        clahe = cv2.createCLAHE(clipLimit=3.0, tileGridSize=(8, 8))
+        _clahe_local.clahe = clahe
+    return clahe
+
 
 def _compute_iou(a: BoundingBox, b: BoundingBox) -> float:
     """Berechnet Intersection-over-Union zweier Bounding Boxes.
@@ -54,7 +76,7 @@ def _is_contained(a: BoundingBox, b: BoundingBox, threshold: float = 0.6) -> boo
 
 
 def _deduplicate_boxes(
-    boxes: list[BoundingBox], iou_threshold: float = 0.5
+    boxes: list[BoundingBox] | BoundingBoxes, iou_threshold: float = 0.5
 ) -> list[BoundingBox]:
     """Entfernt Duplikate per NMS + Containment-Check (hoechste Confidence gewinnt).
 
@@ -63,25 +85,107 @@ def _deduplicate_boxes(
     - IoU exceeds the threshold (standard NMS), OR
     - One box is largely contained within another (>60% of smaller box area)
     This prevents multiple watermarks stacking on top of each other.
+    A BoundingBoxes container is used as-is; only kept boxes become objects.
     """
+    if isinstance(boxes, BoundingBoxes):
+        if len(boxes) <= 1:
+            return boxes.to_list()
+        return boxes.select(_deduplicate_indices(boxes, iou_threshold)).to_list()
     if len(boxes) <= 1:
         return boxes
-    sorted_boxes = sorted(boxes, key=lambda b: b.confidence, reverse=True)
-    keep: list[BoundingBox] = []
-    for box in sorted_boxes:
-        is_duplicate = False
-        for kept in keep:
-            if _compute_iou(box, kept) >= iou_threshold:
-                is_duplicate = True
-                break
-            # Containment-Check: kleine Box in grosser → Duplikat
-            # Containment check: small box inside large one → duplicate
-            if _is_contained(box, kept, threshold=0.6):
-                is_duplicate = True
-                break
-        if not is_duplicate:
-            keep.append(box)
-    return keep
+    kept = _deduplicate_indices(BoundingBoxes.from_list(boxes), iou_threshold)
+    return [boxes[j] for j in kept]
+
+
+def _deduplicate_indices(boxes: BoundingBoxes, iou_threshold: float) -> np.ndarray:
+    """Indizes der behaltenen Boxen, absteigend nach Confidence (siehe oben)."""
+    # Stabil wie sorted(..., reverse=True): gleiche Confidence behält die Reihenfolge
+    # Stable like sorted(..., reverse=True): equal confidence keeps input order
+    order = np.argsort(-boxes.conf, kind="stable")
+    duplicate = _duplicate_matrix(boxes.coords[order], iou_threshold, 0.6)
+
+    kept = np.zeros(len(order), dtype=bool)
+    for i in range(len(order)):
+        if not (duplicate[i] & kept).any():
+            kept[i] = True
+    return order[kept]
+
+
+def _duplicate_matrix(
+    coords: np.ndarray, iou_threshold: float, contain_threshold: float
+) -> np.ndarray:
+    """Paarweise (N, N)-Matrix: IoU >= Schwelle oder Containment (wie die Skalarfunktionen).
+
+    Ganzzahlige Flächen, float64-Division: identisch zu _compute_iou/_is_contained.
+    """
+    x1, y1, x2, y2 = (coords[:, k] for k in range(4))
+    iw = np.maximum(0, np.minimum(x2[:, None], x2[None, :]) - np.maximum(x1[:, None], x1[None, :]))
+    ih = np.maximum(0, np.minimum(y2[:, None], y2[None, :]) - np.maximum(y1[:, None], y1[None, :]))
+    inter = iw * ih
+    areas = (x2 - x1) * (y2 - y1)
+    union = areas[:, None] + areas[None, :] - inter
+    smaller = np.minimum(areas[:, None], areas[None, :])
+    overlap = inter > 0
+    with np.errstate(divide="ignore", invalid="ignore"):
+        iou_dup = overlap & (union > 0) & (inter / union >= iou_threshold)
+        contained = overlap & (smaller > 0) & (inter / smaller >= contain_threshold)
+    return iou_dup | contained
+
+
+class BatchCoalescer:
+    """Buendelt gleichzeitige Inferenz-Anfragen zu Micro-Batches.
+
+    Concurrent callers submit single images and block on a Future. A
+    background worker drains up to `max_batch` requests (waiting at most
+    `max_latency` seconds after the first one), groups them by their
+    inference key and runs one batched forward per group.
+    """
+
+    def __init__(
+        self,
+        run_batch: Callable[[list[np.ndarray], Any], list[Any]],
+        max_batch: int = 8,
+        max_latency: float = 0.010,
+    ):
+        self._run_batch = run_batch
+        self._max_batch = max(1, max_batch)
+        self._max_latency = max_latency
+        self._queue: queue.Queue[tuple[np.ndarray, Any, Future]] = queue.Queue()
+        self._worker = threading.Thread(
+            target=self._loop, name="WatermarkBatchCoalescer", daemon=True
+        )
+        self._worker.start()
+
+    def submit(self, image: np.ndarray, key: Any) -> Any:
+        """Reiht ein Bild ein und wartet auf dessen Einzelergebnis."""
+        future: Future = Future()
+        self._queue.put((image, key, future))
+        return future.result()
+
+    def _loop(self) -> None:
+        while True:
+            pending = [self._queue.get()]
+            try:
+                while len(pending) < self._max_batch:
+                    pending.append(self._queue.get(timeout=self._max_latency))
+            except queue.Empty:
+                pass
+
+            # Nur Anfragen mit gleichem Schluessel teilen sich einen Forward-Pass
+            # Only requests with identical key share one forward pass
+            groups: dict[Any, list[tuple[np.ndarray, Future]]] = {}
+            for image, key, future in pending:
+                groups.setdefault(key, []).append((image, future))
+
+            for key, items in groups.items():
+                try:
+                    outputs = self._run_batch([img for img, _ in items], key)
+                except Exception as e:
+                    for _, future in items:
+                        future.set_exception(e)
+                    continue
+                for (_, future), output in zip(items, outputs):
+                    future.set_result(output)
 
 
 class TemplateWatermarkMatcher:
@@ -99,6 +203,14 @@ class TemplateWatermarkMatcher:
     EDGE_MATCH_THRESHOLD = 0.42
     CLAHE_MATCH_THRESHOLD = 0.50
 
+    # Grob-zu-fein: ab dieser Template-Kantenlaenge erst auf halber Aufloesung
+    # suchen, dann nur Fenster um die Grob-Treffer voll aufloesen
+    # Coarse-to-fine: templates at least this large are searched at half
+    # resolution first; full resolution only runs in windows around the hits
+    PYRAMID_MIN_TEMPLATE = 40
+    PYRAMID_COARSE_FACTOR = 0.8  # Grob-Schwelle relativ zur Schwelle
+    PYRAMID_PAD = 4  # Fensterrand in Vollaufloesungs-Pixeln
+
     # Randbereich-Filter: Logos erscheinen am Bildrand, nicht in der Mitte
     # Edge region filter: logos appear at image edges, not in the center
     EDGE_MARGIN_BOTTOM = 0.40  # Untere 40%
@@ -160,6 +272,8 @@ class TemplateWatermarkMatcher:
         1. Grayscale — standard opaque watermarks
         2. Edge-based — semi-transparent watermarks
         3. CLAHE-normalized — handles different lighting/exposure
+        Grayscale and CLAHE passes search coarse-to-fine (see _match_at_scales);
+        Canny edges do not survive downsampling and stay full-resolution.
         Results are deduplicated across all passes.
         """
         if self._template_gray is None or self._template_edges is None:
@@ -179,6 +293,7 @@ class TemplateWatermarkMatcher:
                 img_h,
                 img_w,
                 self._match_threshold,
+                pyramid=True,
             )
         )
 
@@ -204,6 +319,7 @@ class TemplateWatermarkMatcher:
                     img_h,
                     img_w,
                     self.CLAHE_MATCH_THRESHOLD,
+                    pyramid=True,
                 )
             )
 
@@ -224,16 +340,16 @@ class TemplateWatermarkMatcher:
         if not boxes:
             return boxes
 
-        kept: list[BoundingBox] = []
-        for box in boxes:
-            # Box-Kanten pruefen (nicht Mittelpunkt) / Check box edges
-            in_bottom = box.y2 > img_h * (1 - self.EDGE_MARGIN_BOTTOM)
-            in_top = box.y1 < img_h * self.EDGE_MARGIN_TOP
-            in_left = box.x1 < img_w * self.EDGE_MARGIN_SIDE
-            in_right = box.x2 > img_w * (1 - self.EDGE_MARGIN_SIDE)
-
-            if in_bottom or in_top or in_left or in_right:
-                kept.append(box)
+        # Box-Kanten pruefen (nicht Mittelpunkt), alle Treffer auf einmal
+        # Check box edges (not centers) for all matches in one array pass
+        x1, y1, x2, y2 = BoundingBoxes.from_list(boxes).coords.T
+        in_edge = (
+            (y2 > img_h * (1 - self.EDGE_MARGIN_BOTTOM))
+            | (y1 < img_h * self.EDGE_MARGIN_TOP)
+            | (x1 < img_w * self.EDGE_MARGIN_SIDE)
+            | (x2 > img_w * (1 - self.EDGE_MARGIN_SIDE))
+        )
+        kept = [box for box, keep in zip(boxes, in_edge.tolist()) if keep]
 
         filtered_count = len(boxes) - len(kept)
         if filtered_count > 0:
@@ -251,13 +367,21 @@ class TemplateWatermarkMatcher:
         img_h: int,
         img_w: int,
         threshold: float,
+        pyramid: bool = False,
     ) -> list[BoundingBox]:
         """Multi-Scale-Matching einer Repraesentierung (Gray oder Edges).
 
         Runs cv2.matchTemplate at multiple scales and returns boxes above threshold.
+        With pyramid=True, scaled templates of at least PYRAMID_MIN_TEMPLATE px
+        are first matched on a pyrDown level; full-resolution matching then only
+        runs in windows around coarse scores >= threshold * PYRAMID_COARSE_FACTOR.
         """
         t_h, t_w = template.shape[:2]
         boxes: list[BoundingBox] = []
+        # Konstantes Bild: jede Skalierung liefert NaN / Constant image: all NaN
+        if float(np.asarray(image).std()) < 1.0:
+            return boxes
+        coarse_image = cv2.pyrDown(image) if pyramid else None
 
         for scale in self.SCALES:
             new_w = int(t_w * scale)
@@ -271,29 +395,85 @@ class TemplateWatermarkMatcher:
 
             # Konstante Bilder/Templates erzeugen NaN bei TM_CCOEFF_NORMED
             # Constant images/templates produce NaN with TM_CCOEFF_NORMED
-            if float(np.asarray(scaled).std()) < 1.0 or float(np.asarray(image).std()) < 1.0:
+            if float(np.asarray(scaled).std()) < 1.0:
                 continue
 
-            result = cv2.matchTemplate(image, scaled, cv2.TM_CCOEFF_NORMED)
-
-            # NaN-Werte filtern / Filter NaN values
-            result_arr = np.nan_to_num(np.asarray(result), nan=0.0)
-
-            locations = np.where(result_arr >= threshold)  # type: ignore[operator]
-            for pt_y, pt_x in zip(*locations):
-                conf = float(result_arr[int(pt_y), int(pt_x)].item())
-                boxes.append(
-                    BoundingBox(
-                        x1=int(pt_x),
-                        y1=int(pt_y),
-                        x2=int(pt_x + new_w),
-                        y2=int(pt_y + new_h),
-                        confidence=conf,
-                    )
+            if coarse_image is not None and min(new_w, new_h) >= self.PYRAMID_MIN_TEMPLATE:
+                boxes.extend(
+                    self._match_coarse_to_fine(image, coarse_image, scaled, threshold)
                 )
+                continue
+
+            boxes.extend(self._match_window(image, scaled, threshold, 0, 0))
 
         return boxes
 
+    def _match_coarse_to_fine(
+        self,
+        image: np.ndarray,
+        coarse_image: np.ndarray,
+        template: np.ndarray,
+        threshold: float,
+    ) -> list[BoundingBox]:
+        """Grobsuche auf pyrDown-Ebene, Verfeinerung in Fenstern um die Treffer.
+
+        Each connected cluster of coarse hits becomes one full-resolution
+        search window (padded by PYRAMID_PAD); overlapping windows may repeat
+        a box, which the final deduplication removes.
+        """
+        coarse_template = cv2.pyrDown(template)
+        if float(np.asarray(coarse_template).std()) < 1.0:
+            return self._match_window(image, template, threshold, 0, 0)
+
+        coarse = np.nan_to_num(
+            np.asarray(cv2.matchTemplate(coarse_image, coarse_template, cv2.TM_CCOEFF_NORMED)),
+            nan=0.0,
+        )
+        hits = (coarse >= threshold * self.PYRAMID_COARSE_FACTOR).astype(np.uint8)
+        if not hits.any():
+            return []
+
+        t_h, t_w = template.shape[:2]
+        res_h = image.shape[0] - t_h + 1
+        res_w = image.shape[1] - t_w + 1
+        pad = self.PYRAMID_PAD
+        boxes: list[BoundingBox] = []
+        n_labels, _, stats, _ = cv2.connectedComponentsWithStats(hits, connectivity=8)
+        for cx, cy, cw, ch, _area in stats[1:n_labels].tolist():
+            # Ergebnis-Fenster in Vollaufloesung / Result window at full resolution
+            rx1 = max(0, 2 * cx - pad)
+            ry1 = max(0, 2 * cy - pad)
+            rx2 = min(res_w, 2 * (cx + cw) + pad)
+            ry2 = min(res_h, 2 * (cy + ch) + pad)
+            if rx2 <= rx1 or ry2 <= ry1:
+                continue
+            roi = image[ry1:ry2 + t_h - 1, rx1:rx2 + t_w - 1]
+            boxes.extend(self._match_window(roi, template, threshold, rx1, ry1))
+        return boxes
+
+    @staticmethod
+    def _match_window(
+        image: np.ndarray,
+        template: np.ndarray,
+        threshold: float,
+        offset_x: int,
+        offset_y: int,
+    ) -> list[BoundingBox]:
+        """matchTemplate auf einem (Teil-)Bild; Boxen in Gesamtbild-Koordinaten."""
+        t_h, t_w = template.shape[:2]
+        result = cv2.matchTemplate(image, template, cv2.TM_CCOEFF_NORMED)
+
+        # NaN-Werte filtern / Filter NaN values
+        result_arr = np.nan_to_num(np.asarray(result), nan=0.0)
+
+        ys, xs = np.where(result_arr >= threshold)  # type: ignore[operator]
+        conf = result_arr[ys, xs]
+        xs = xs + offset_x
+        ys = ys + offset_y
+        return BoundingBoxes.from_arrays(
+            np.stack([xs, ys, xs + t_w, ys + t_h], axis=1), conf
+        ).to_list()
+
 
 class WatermarkDetector:
     """YOLO-basierte Wasserzeichen-Erkennung mit TTA, Preprocessing und Template-Fallback.
@@ -305,6 +485,17 @@ class WatermarkDetector:
     DEFAULT_MODEL_PATH = "models/best.pt"
     HF_REPO = "corzent/yolo11x_watermark_detection"
     HF_FILENAME = "best.pt"
+    # Groesse des Dummy-Frames fuer den Warm-up-Pass / Warm-up dummy frame size
+    WARMUP_SIZE = 640
+    # Optionales INT8-ONNX-Modell fuer CPU-Inferenz (build/quantize_watermark.py)
+    # Optional INT8 ONNX sibling of the .pt model, used for CPU inference
+    INT8_MODEL_SUFFIX = "_int8.onnx"
+    # Thumbnails unter 200x200 liefern nur False Positives → keine Inferenz
+    # Images below this pixel area skip watermark inference entirely
+    MIN_INFER_AREA = 200 * 200
+    # Ab dieser Helligkeits-Streuung bringt CLAHE nichts mehr → Pass ueberspringen
+    # Above this (subsampled green-channel) std CLAHE adds nothing; skip the pass
+    CLAHE_STD_THRESHOLD = 40.0
 
     # Rueckwaertskompatible Basis-Konstanten (Logo-Default)
     # Backward-compatible base constants (logo default)
@@ -343,12 +534,20 @@ class WatermarkDetector:
         strict_filter: bool = True,
         enhanced_detection: bool = False,
         watermark_type: str = "logo",
+        batch_coalescing: bool = False,
     ):
         self._model_path = model_path
         self._confidence = confidence
         self._use_gpu = use_gpu
         self._model: Any | None = None
+        self._cpu_model: Any | None = None
+        self._cpu_model_checked = False
         self._last_error: str | None = None
+        # Micro-Batching fuer parallele detect()-Aufrufer (lazy erzeugt)
+        # Micro-batching for concurrent detect() callers (created lazily)
+        self._batch_coalescing = batch_coalescing
+        self._coalescer: BatchCoalescer | None = None
+        self._coalescer_lock = threading.Lock()
         # Konfigurierbare Filter / Configurable filter settings
         self._strict_filter = strict_filter
         self._enhanced_detection = enhanced_detection
@@ -414,7 +613,10 @@ class WatermarkDetector:
             from ultralytics import YOLO
 
             self._model = YOLO(model_path)
+            if self._use_gpu:
+                _configure_cuda_backends()
             logger.info("Watermark-Model geladen: %s", model_path)
+            self._warmup()
             return True
         except Exception as e:
             self._last_error = str(e)
@@ -423,6 +625,51 @@ class WatermarkDetector:
             )
             return False
 
+    def _warmup(self) -> None:
+        """Dummy-Inferenz direkt nach dem Laden (cuDNN-Autotune, Kernel-JIT).
+
+        Runs two forward passes on a blank frame so the first real detect()
+        call does not pay the cold-start cost. Failures are non-fatal.
+        """
+        if self._model is None:
+            return
+        device = "cuda" if self._use_gpu else "cpu"
+        dummy = np.zeros((self.WARMUP_SIZE, self.WARMUP_SIZE, 3), dtype=np.uint8)
+        try:
+            import torch
+
+            # cuDNN-Benchmark setzt _configure_cuda_backends beim Laden
+            # cuDNN benchmark is enabled by _configure_cuda_backends on load
+            with _watermark_lock, torch.inference_mode():
+                for _ in range(2):
+                    self._model(
+                        dummy, conf=0.99, device=device, half=device == "cuda", verbose=False
+                    )
+            logger.debug("Watermark-Model aufgewaermt (device: %s)", device)
+        except Exception as e:
+            logger.warning("Watermark-Warm-up fehlgeschlagen: %s", e)
+
+    def _get_cpu_model(self) -> Any:
+        """Gibt das Modell fuer CPU-Inferenz zurueck (INT8-ONNX falls vorhanden).
+
+        The quantized ONNX variant is looked up next to the .pt file once;
+        without it the regular PyTorch model runs on CPU as before.
+        """
+        if not self._cpu_model_checked:
+            self._cpu_model_checked = True
+            int8_path = _get_model_path(
+                os.path.splitext(self._model_path)[0] + self.INT8_MODEL_SUFFIX
+            )
+            if os.path.exists(int8_path):
+                try:
+                    from ultralytics import YOLO
+
+                    self._cpu_model = YOLO(int8_path, task="detect")
+                    logger.info("INT8-CPU-Model geladen: %s", int8_path)
+                except Exception as e:
+                    logger.warning("INT8-Model konnte nicht geladen werden: %s", e)
+        return self._cpu_model if self._cpu_model is not None else self._model
+
     @property
     def last_error(self) -> str | None:
         """Gibt die letzte Fehlermeldung beim Model-Laden zurueck."""
@@ -460,16 +707,20 @@ class WatermarkDetector:
         p = self._params
         img_area = img_h * img_w
         box_area = box.area
+        # Debug-Formatierung (inkl. repr(box)) nur wenn tatsaechlich geloggt wird
+        # Skip %-formatting and repr(box) per rejected box at production levels
+        debug = logger.isEnabledFor(logging.DEBUG)
 
         # Zu grosse Boxen sind keine Watermarks / Too large = not a watermark
         if box_area > img_area * p["max_area_ratio"]:
-            logger.debug(
-                "WM-Box gefiltert (zu gross: %.1f%%, max=%.0f%%, typ=%s): %s",
-                box_area / img_area * 100,
-                p["max_area_ratio"] * 100,
-                self._watermark_type,
-                box,
-            )
+            if debug:
+                logger.debug(
+                    "WM-Box gefiltert (zu gross: %.1f%%, max=%.0f%%, typ=%s): %s",
+                    box_area / img_area * 100,
+                    p["max_area_ratio"] * 100,
+                    self._watermark_type,
+                    box,
+                )
             return False
 
         # Seitenverhaeltnis-Filter (Logo: quadratisch, Text: kein Filter)
@@ -478,89 +729,210 @@ class WatermarkDetector:
         box_h = max(box.y2 - box.y1, 1)
         aspect = box_w / box_h
         if aspect < p["min_aspect_ratio"] or aspect > p["max_aspect_ratio"]:
-            logger.debug(
-                "WM-Box gefiltert (Seitenverhaeltnis %.2f, erlaubt=%.1f-%.1f, typ=%s): %s",
-                aspect,
-                p["min_aspect_ratio"],
-                p["max_aspect_ratio"],
-                self._watermark_type,
-                box,
-            )
+            if debug:
+                logger.debug(
+                    "WM-Box gefiltert (Seitenverhaeltnis %.2f, erlaubt=%.1f-%.1f, typ=%s): %s",
+                    aspect,
+                    p["min_aspect_ratio"],
+                    p["max_aspect_ratio"],
+                    self._watermark_type,
+                    box,
+                )
             return False
 
         # Im strikten Modus: muss am Bildrand liegen
         # In strict mode: must be at image edge
         if self._strict_filter and not self._is_edge_region(box, img_h, img_w):
-            logger.debug(
-                "WM-Box gefiltert (nicht am Rand, strict=True, typ=%s): %s",
-                self._watermark_type,
-                box,
-            )
+            if debug:
+                logger.debug(
+                    "WM-Box gefiltert (nicht am Rand, strict=True, typ=%s): %s",
+                    self._watermark_type,
+                    box,
+                )
             return False
 
         return True
 
-    @staticmethod
-    def _preprocess_for_detection(image: np.ndarray) -> np.ndarray:
+    def _edge_mask(self, coords: np.ndarray, img_h: int, img_w: int) -> np.ndarray:
+        """Vektorisierte Variante von _is_edge_region fuer (N, 4)-Koordinaten."""
+        p = self._params
+        x1, y1, x2, y2 = coords.T
+        return (
+            (y2 > img_h * (1 - p["edge_margin_bottom"]))
+            | (y1 < img_h * p["edge_margin_top"])
+            | (x1 < img_w * p["edge_margin_side"])
+            | (x2 > img_w * (1 - p["edge_margin_side"]))
+        )
+
+    def _plausible_mask(self, coords: np.ndarray, img_h: int, img_w: int) -> np.ndarray:
+        """Vektorisierte Variante von _is_plausible_watermark fuer (N, 4)-Koordinaten.
+
+        Same area, aspect ratio and (strict) edge checks as the scalar predicate,
+        evaluated as a handful of array comparisons instead of one call per box.
+        """
+        p = self._params
+        x1, y1, x2, y2 = coords.T
+        w = x2 - x1
+        h = y2 - y1
+        aspect = np.maximum(w, 1) / np.maximum(h, 1)
+        mask = (
+            (w * h <= img_h * img_w * p["max_area_ratio"])
+            & (aspect >= p["min_aspect_ratio"])
+            & (aspect <= p["max_aspect_ratio"])
+        )
+        if self._strict_filter:
+            mask &= self._edge_mask(coords, img_h, img_w)
+        return mask
+
+    def _filter_plausible(
+        self, boxes: BoundingBoxes, img_h: int, img_w: int
+    ) -> BoundingBoxes:
+        """Behaelt nur plausible Watermark-Boxen (Reihenfolge bleibt erhalten).
+
+        Works on the packed arrays; BoundingBox objects are only built for the
+        survivors by the caller. The mask decides on every log level; DEBUG
+        only adds one line per rejected box.
+        """
+        if len(boxes) == 0:
+            return boxes
+        mask = self._plausible_mask(boxes.coords, img_h, img_w)
+        if logger.isEnabledFor(logging.DEBUG) and not mask.all():
+            self._log_rejected(boxes.select(~mask), img_h, img_w)
+        return boxes.select(mask)
+
+    def _log_rejected(self, rejected: BoundingBoxes, img_h: int, img_w: int) -> None:
+        """Loggt den Grund pro verworfener Box, berechnet wie in _plausible_mask."""
+        p = self._params
+        img_area = img_h * img_w
+        x1, y1, x2, y2 = rejected.coords.T
+        w = x2 - x1
+        h = y2 - y1
+        area = (w * h).tolist()
+        aspect = (np.maximum(w, 1) / np.maximum(h, 1)).tolist()
+        for i, box in enumerate(rejected.to_list()):
+            # Gleiche Reihenfolge der Pruefungen wie _is_plausible_watermark
+            # Same check order as _is_plausible_watermark
+            if area[i] > img_area * p["max_area_ratio"]:
+                logger.debug(
+                    "WM-Box gefiltert (zu gross: %.1f%%, max=%.0f%%, typ=%s): %s",
+                    area[i] / img_area * 100,
+                    p["max_area_ratio"] * 100,
+                    self._watermark_type,
+                    box,
+                )
+            elif not p["min_aspect_ratio"] <= aspect[i] <= p["max_aspect_ratio"]:
+                logger.debug(
+                    "WM-Box gefiltert (Seitenverhaeltnis %.2f, erlaubt=%.1f-%.1f, typ=%s): %s",
+                    aspect[i],
+                    p["min_aspect_ratio"],
+                    p["max_aspect_ratio"],
+                    self._watermark_type,
+                    box,
+                )
+            else:
+                logger.debug(
+                    "WM-Box gefiltert (nicht am Rand, strict=True, typ=%s): %s",
+                    self._watermark_type,
+                    box,
+                )
+
+    @classmethod
+    def _preprocess_for_detection(cls, image: np.ndarray) -> np.ndarray:
         """Kontrastverstaerkung fuer semi-transparente Watermarks.
 
         Applies CLAHE (Contrast Limited Adaptive Histogram Equalization) to
         make faint or semi-transparent watermarks more visible to YOLO.
+        High-contrast images (green-channel std of an 8x8-subsampled grid above
+        CLAHE_STD_THRESHOLD) are returned unchanged — the same object, so
+        callers can skip a redundant inference pass.
         """
+        if float(image[::8, ::8, 1].std()) > cls.CLAHE_STD_THRESHOLD:
+            return image
         lab = cv2.cvtColor(image, cv2.COLOR_BGR2LAB)
-        l_channel, a_channel, b_channel = cv2.split(lab)
-        clahe = cv2.createCLAHE(clipLimit=3.0, tileGridSize=(8, 8))
-        l_enhanced = clahe.apply(l_channel)
-        enhanced_lab = cv2.merge([l_enhanced, a_channel, b_channel])
-        return cv2.cvtColor(enhanced_lab, cv2.COLOR_LAB2BGR)
+        # Nur L ändern: direkt in die LAB-Ebene zurückschreiben statt split/merge
+        # Only L changes: write back into the LAB plane instead of split/merge
+        lab[..., 0] = _detection_clahe().apply(lab[..., 0])
+        return cv2.cvtColor(lab, cv2.COLOR_LAB2BGR, dst=lab)
 
     def _run_yolo_inference(
         self, image: np.ndarray, conf: float, use_tta: bool = False
-    ) -> list[BoundingBox]:
+    ) -> BoundingBoxes:
         """Fuehrt YOLO-Inferenz aus (optional mit TTA). Thread-safe.
 
         Runs YOLO inference with optional Test-Time Augmentation (augment=True)
-        for improved detection of small or rotated watermarks.
+        for improved detection of small or rotated watermarks. With batch
+        coalescing enabled, concurrent calls are merged into one forward pass.
         """
         if self._model is None:
-            return []
+            return BoundingBoxes.from_list(None)
+
+        if self._batch_coalescing:
+            with self._coalescer_lock:
+                if self._coalescer is None:
+                    self._coalescer = BatchCoalescer(self._run_batch)
+            return self._coalescer.submit(image, (conf, use_tta))
+
+        return self._run_batch([image], (conf, use_tta))[0]
 
+    def _run_batch(
+        self, images: list[np.ndarray], key: tuple[float, bool]
+    ) -> list[BoundingBoxes]:
+        """Ein Forward-Pass fuer mehrere Bilder, Ergebnis pro Bild (als Arrays)."""
+        conf, use_tta = key
         device = "cuda" if self._use_gpu else "cpu"
+        source: Any = images[0] if len(images) == 1 else images
 
         with _watermark_lock:
+            # TTA (augment) kann nur das PyTorch-Modell, sonst INT8 auf CPU
+            # TTA needs the PyTorch model; plain CPU passes may use INT8 ONNX
+            cpu_model = self._model if use_tta else self._get_cpu_model()
+            model = self._model if self._use_gpu else cpu_model
             try:
-                results = self._model(
-                    image,
+                results = model(
+                    source,
                     conf=conf,
                     device=device,
+                    half=device == "cuda",
                     verbose=False,
                     augment=use_tta,
                 )
             except RuntimeError:
                 logger.warning("GPU-Fehler bei Watermark-Detection, Fallback CPU")
-                results = self._model(
-                    image,
+                results = cpu_model(
+                    source,
                     conf=conf,
                     device="cpu",
                     verbose=False,
                     augment=use_tta,
                 )
 
-        boxes: list[BoundingBox] = []
+        per_image = [
+            BoundingBoxes.from_arrays(*self._results_to_arrays([result]))
+            for result in results
+        ]
+        # Jeder Aufrufer bekommt genau ein Ergebnis / One result per caller
+        per_image.extend(
+            BoundingBoxes.from_list(None) for _ in range(len(images) - len(per_image))
+        )
+        return per_image
+
+    @staticmethod
+    def _results_to_arrays(results: Any) -> tuple[np.ndarray, np.ndarray]:
+        """Sammelt YOLO-Ergebnisse als Structure-of-Arrays.
+
+        Returns (N, 4) int32 xyxy and (N,) float32 confidences with one
+        device→host copy per result instead of one per box.
+        """
+        xyxy_parts: list[np.ndarray] = []
+        conf_parts: list[np.ndarray] = []
         for result in results:
-            for box in result.boxes:
-                x1, y1, x2, y2 = box.xyxy[0].cpu().numpy().astype(int)
-                conf_val = float(box.conf[0].cpu().numpy())
-                boxes.append(
-                    BoundingBox(
-                        x1=int(x1),
-                        y1=int(y1),
-                        x2=int(x2),
-                        y2=int(y2),
-                        confidence=conf_val,
-                    )
-                )
-        return boxes
+            if result.boxes is None or len(result.boxes) == 0:
+                continue
+            xyxy_parts.append(result.boxes.xyxy.cpu().numpy().astype(np.int32))
+            conf_parts.append(result.boxes.conf.cpu().numpy().astype(np.float32))
+        if not xyxy_parts:
+            return np.zeros((0, 4), dtype=np.int32), np.zeros((0,), dtype=np.float32)
+        return np.concatenate(xyxy_parts, axis=0), np.concatenate(conf_parts, axis=0)
 
     def _detect_bottom_text_zoomed(self, image: np.ndarray) -> list[BoundingBox]:
         """Erkennt kleine Text-Wasserzeichen am unteren Bildrand per Zoom+YOLO.
@@ -596,43 +968,32 @@ class WatermarkDetector:
         zoomed_boxes = self._run_yolo_inference(zoomed, conf=0.15, use_tta=False)
 
         # Auch CLAHE-verstaerkten Zoom versuchen / Also try CLAHE-enhanced zoom
-        if not zoomed_boxes:
+        if len(zoomed_boxes) == 0:
             zoomed_enhanced = self._preprocess_for_detection(zoomed)
-            zoomed_boxes = self._run_yolo_inference(
-                zoomed_enhanced, conf=0.15, use_tta=False
-            )
+            if zoomed_enhanced is not zoomed:
+                zoomed_boxes = self._run_yolo_inference(
+                    zoomed_enhanced, conf=0.15, use_tta=False
+                )
 
-        if not zoomed_boxes:
+        if len(zoomed_boxes) == 0:
             return []
 
-        # Koordinaten zurueck auf Original-Bild mappen
-        # Map coordinates back to original image
-        result_boxes: list[BoundingBox] = []
-        for zb in zoomed_boxes:
-            orig_x1 = int(zb.x1 / scale_factor)
-            orig_y1 = crop_y + int(zb.y1 / scale_factor)
-            orig_x2 = int(zb.x2 / scale_factor)
-            orig_y2 = crop_y + int(zb.y2 / scale_factor)
-            # Koordinaten begrenzen / Clamp coordinates
-            orig_x1 = max(0, min(orig_x1, img_w))
-            orig_y1 = max(0, min(orig_y1, img_h))
-            orig_x2 = max(0, min(orig_x2, img_w))
-            orig_y2 = max(0, min(orig_y2, img_h))
-            if orig_x2 > orig_x1 and orig_y2 > orig_y1:
-                box = BoundingBox(
-                    x1=orig_x1,
-                    y1=orig_y1,
-                    x2=orig_x2,
-                    y2=orig_y2,
-                    confidence=zb.confidence,
-                )
-                # Plausibilitaet pruefen / Check plausibility
-                if self._is_plausible_watermark(box, img_h, img_w):
-                    result_boxes.append(box)
+        # Koordinaten zurueck auf Original-Bild mappen und begrenzen
+        # (Ganzzahl-Division == int(x / 3) fuer nicht-negative Pixel)
+        # Map coordinates back to the original image and clamp them
+        coords = zoomed_boxes.coords // scale_factor
+        coords[:, 1::2] += crop_y
+        np.clip(coords[:, 0::2], 0, img_w, out=coords[:, 0::2])
+        np.clip(coords[:, 1::2], 0, img_h, out=coords[:, 1::2])
+        valid = (coords[:, 2] > coords[:, 0]) & (coords[:, 3] > coords[:, 1])
+        mapped = BoundingBoxes(coords[valid], zoomed_boxes.conf[valid])
+
+        # Plausibilitaet pruefen / Check plausibility
+        plausible = self._filter_plausible(mapped, img_h, img_w)
 
+        result_boxes = _deduplicate_boxes(plausible, iou_threshold=0.5)
         if result_boxes:
-            result_boxes = _deduplicate_boxes(result_boxes, iou_threshold=0.5)
-            logger.info(
+            logger.debug(
                 "Bottom-Zoom: %d Text-WM(s) im unteren Bildbereich erkannt",
                 len(result_boxes),
             )
@@ -655,10 +1016,23 @@ class WatermarkDetector:
         6. Falls Text-Typ und keine Treffer: Bottom-Strip-Fallback
         7. Ergebnisse deduplizieren und zurueckgeben
         """
+        img_h, img_w = image.shape[:2]
+        if img_h * img_w < self.MIN_INFER_AREA:
+            logger.debug(
+                "Bild zu klein fuer Watermark-Erkennung: %dx%d", img_w, img_h
+            )
+            return []
+
         if self._model is None:
             if not self.load_model():
                 return []
 
+        # Nicht-zusammenhaengende Arrays (Slices, cv2.flip) einmalig kopieren,
+        # sonst kopiert ultralytics intern bei jedem Pass erneut
+        # Normalize non-contiguous/non-uint8 frames once before all YOLO passes
+        if not image.flags["C_CONTIGUOUS"] or image.dtype != np.uint8:
+            image = np.ascontiguousarray(image, dtype=np.uint8)
+
         base_conf = confidence or self._confidence
         # Typ-spezifischen Confidence-Faktor anwenden
         # Apply type-specific confidence factor (text needs lower threshold)
@@ -678,22 +1052,22 @@ class WatermarkDetector:
         raw_boxes = self._run_yolo_inference(image, conf, use_tta=use_tta)
         logger.debug("YOLO Pass 1: %d raw detections (conf=%.2f)", len(raw_boxes), conf)
 
-        # Pass 2: YOLO auf kontrastverstaerktem Bild (nur bei enhanced)
-        if self._enhanced_detection:
-            enhanced_img = self._preprocess_for_detection(image)
+        # Pass 2: YOLO auf kontrastverstaerktem Bild (nur bei enhanced und
+        # wenn CLAHE das Bild tatsaechlich veraendert)
+        # Pass 2 only when enhanced and CLAHE actually changed the image
+        enhanced_img = self._preprocess_for_detection(image) if self._enhanced_detection else image
+        if enhanced_img is not image:
             extra_boxes = self._run_yolo_inference(enhanced_img, conf, use_tta=False)
             logger.debug("YOLO Pass 2 (enhanced): %d extra detections", len(extra_boxes))
-            raw_boxes.extend(extra_boxes)
-            raw_boxes = _deduplicate_boxes(raw_boxes, iou_threshold=0.5)
+            raw_boxes = BoundingBoxes.concatenate([raw_boxes, extra_boxes])
+            raw_boxes = raw_boxes.select(_deduplicate_indices(raw_boxes, 0.5))
 
-        # Plausibilitaetsfilter anwenden
-        img_h, img_w = image.shape[:2]
-        filtered_boxes = [
-            b for b in raw_boxes if self._is_plausible_watermark(b, img_h, img_w)
-        ]
+        # Plausibilitaetsfilter auf den Arrays; Objekte nur fuer die Ueberlebenden
+        # Plausibility filter on the arrays; objects only for the survivors
+        filtered_boxes = self._filter_plausible(raw_boxes, img_h, img_w).to_list()
 
         if len(raw_boxes) != len(filtered_boxes):
-            logger.info(
+            logger.debug(
                 "Watermark-Filter: %d von %d Detections als False Positive entfernt",
                 len(raw_boxes) - len(filtered_boxes),
                 len(raw_boxes),
@@ -704,7 +1078,7 @@ class WatermarkDetector:
         if self._template_matcher and self._template_matcher.has_template:
             template_boxes = self._template_matcher.match(image)
             if template_boxes:
-                logger.info(
+                logger.debug(
                     "Template-Matching: %d Watermarks gefunden",
                     len(template_boxes),
                 )
@@ -718,7 +1092,7 @@ class WatermarkDetector:
             if zoom_boxes:
                 filtered_boxes.extend(zoom_boxes)
 
-        logger.info(
+        logger.debug(
             "%d Wasserzeichen erkannt (conf >= %.2f, typ=%s, enhanced=%s)",
             len(filtered_boxes),
             conf,
@@ -0,0 +1,47 @@
+"""Kompilierte Koordinaten-Arithmetik für Vorschau-Overlays.
+
+Mit Numba läuft die Box-Skalierung ab NUMBA_MIN_BOXES Boxen als kompilierte
+Schleife, sonst als vektorisierte NumPy-Operation (gleiches Ergebnis).
+"""
+
+import numpy as np
+
+try:
+    from numba import njit
+
+    HAVE_NUMBA = True
+except ImportError:  # pragma: no cover - abhaengig von der Umgebung
+    HAVE_NUMBA = False
+
+
+def _scale_boxes_numpy(coords: np.ndarray, sx: float, sy: float) -> np.ndarray:
+    scaled = coords * np.array([sx, sy, sx, sy])
+    return scaled.astype(np.int32)
+
+
+# Unter dieser Box-Anzahl kostet der Numba-Dispatch mehr als die Schleife spart
+# Below this box count the Numba dispatch costs more than the loop saves
+NUMBA_MIN_BOXES = 10
+
+if HAVE_NUMBA:
+
+    # Kein fastmath: Abschneiden muss exakt int(v * scale) entsprechen
+    # No fastmath: truncation must match int(v * scale) exactly
+    @njit(cache=True)
+    def _scale_boxes_jit(coords: np.ndarray, sx: float, sy: float) -> np.ndarray:
+        out = np.empty(coords.shape, dtype=np.int32)
+        for i in range(coords.shape[0]):
+            out[i, 0] = int(coords[i, 0] * sx)
+            out[i, 1] = int(coords[i, 1] * sy)
+            out[i, 2] = int(coords[i, 2] * sx)
+            out[i, 3] = int(coords[i, 3] * sy)
+        return out
+
+    def scale_boxes(coords: np.ndarray, sx: float, sy: float) -> np.ndarray:
+        """Skaliert float64[N, 4]-Koordinaten (x1, y1, x2, y2) auf int32[N, 4]."""
+        if coords.shape[0] < NUMBA_MIN_BOXES:
+            return _scale_boxes_numpy(coords, sx, sy)
+        return _scale_boxes_jit(coords, sx, sy)
+
+else:
+    scale_boxes = _scale_boxes_numpy
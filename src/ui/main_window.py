@@ -1,11 +1,16 @@
 """Hauptfenster der Smart Image Cropper App."""
 
 import os
+import threading
+import time
+from collections import OrderedDict
+from functools import lru_cache, partial
 from pathlib import Path
+from typing import TYPE_CHECKING
 
-from PyQt6.QtCore import Qt, QTimer
-from PyQt6.QtGui import QIcon, QKeySequence, QShortcut
-from PyQt6.QtSvgWidgets import QSvgWidget
+from PyQt6.QtCore import QEventLoop, Qt, QThreadPool, QTimer
+from PyQt6.QtGui import QAction, QIcon, QKeySequence, QPainter, QPixmap
+from PyQt6.QtSvg import QSvgRenderer
 from PyQt6.QtWidgets import (
     QCheckBox,
     QComboBox,
@@ -23,30 +28,105 @@ from PyQt6.QtWidgets import (
     QWidget,
 )
 
-from src.core.cropper import CropEngine
-from src.core.detector import PersonDetector
-from src.core.processor import ModelLoaderThread, PreviewLoadThread, ProcessingThread
-from src.core.watermark import WatermarkDetector
-from src.ui.preview_widget import PreviewWidget
-from src.ui.selection_dialog import DetectionSelectionDialog
-from src.ui.template_dialog import WatermarkTemplateDialog
+from src.ui.preview_widget import PreviewWidget, render_preview
 from src.ui.widgets import (
     ProgressCard,
     StyledButton,
     StyledDoubleSpinBox,
     StyledSlider,
     StyledSpinBox,
+    SvgLogo,
 )
 from src.utils.config import ConfigManager
 from src.utils.file_manager import FileManager
 from src.utils.logger import get_logger
 
+# Schwere Module (torch/ultralytics/Dialoge) werden erst bei Bedarf importiert,
+# damit das Fenster vor deren Initialisierung gezeichnet wird
+# Heavy modules are imported lazily inside the methods that need them
+if TYPE_CHECKING:
+    from src.core.detector import PersonDetector
+    from src.core.processor import (
+        ModelLoaderThread,
+        DirectoryScanSignals,
+        PreviewLoadSignals,
+        ProcessingThread,
+    )
+    from src.core.watermark import WatermarkDetector
+
 logger = get_logger(__name__)
 
+# Projekt-Root (src/ui/main_window.py → zwei Ebenen hoch)
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+# Verzeichnisse, die bei der Ressourcensuche nie durchsucht werden
+_RESOURCE_SKIP_DIRS = {"__pycache__", "node_modules", ".venv", "venv", "models"}
+# Combo-Index → Config-Wert fuer Wasserzeichen-Modus und -Typ
+# Combo index → config value for watermark mode and type
+_WM_MODES = ("manual", "auto", "disabled")
+_WM_TYPES = ("logo", "text")
+# Signale aus Worker-Threads/-Tasks immer explizit gequeued verbinden
+# Always connect worker thread/task signals as explicitly queued
+_QUEUED = Qt.ConnectionType.QueuedConnection
+
+
+@lru_cache(maxsize=128)
+def _find_resource(filename: str) -> str | None:
+    """Sucht eine Ressource-Datei relativ zum Projekt-Root (gecacht).
+
+    Checks a few known locations with direct stat calls first and only
+    falls back to a pruned scandir search when none of them match.
+    """
+    for candidate in (
+        PROJECT_ROOT / filename,
+        PROJECT_ROOT / "assets" / filename,
+        PROJECT_ROOT / "resources" / filename,
+        Path(filename),
+    ):
+        if candidate.is_file():
+            return str(candidate.resolve())
+
+    return _scan_for_file(str(PROJECT_ROOT), filename)
+
+
+def _scan_for_file(directory: str, filename: str) -> str | None:
+    """Rekursive Suche mit os.scandir, bricht beim ersten Treffer ab.
+
+    Recursive os.scandir search that stops at the first match. Unlike
+    os.walk it builds no per-directory name lists and never enters hidden
+    or excluded directories.
+    """
+    subdirs: list[str] = []
+    try:
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                name = entry.name
+                if name == filename and entry.is_file():
+                    return entry.path
+                if (
+                    not name.startswith(".")
+                    and name not in _RESOURCE_SKIP_DIRS
+                    and entry.is_dir(follow_symlinks=False)
+                ):
+                    subdirs.append(entry.path)
+    except OSError:
+        return None
+    for sub in subdirs:
+        hit = _scan_for_file(sub, filename)
+        if hit is not None:
+            return hit
+    return None
+
 
 class MainWindow(QMainWindow):
     """Hauptfenster: Sidebar mit Settings + Content mit Preview."""
 
+    # Max. Anzahl gecachter Verzeichnis-Scans
+    SCAN_CACHE_SIZE = 8
+    # Max. Anzahl vorab geladener Nachbar-Vorschauen (halten Original-Arrays)
+    PREFETCH_CACHE_SIZE = 4
+    # Mindestabstand zwischen Preview-Fortschrittsanzeigen (~30 Hz)
+    PREVIEW_PROGRESS_INTERVAL = 0.033
+
     def __init__(
         self,
         config: ConfigManager,
@@ -56,13 +136,64 @@ class MainWindow(QMainWindow):
         super().__init__(parent)
         self._config = config
         self._processing_thread: ProcessingThread | None = None
-        self._preview_thread: PreviewLoadThread | None = None
+        # Ein persistenter Worker fuer Vorschauen statt eines QThread pro Bild
+        # One persistent worker for previews instead of a QThread per image
+        self._preview_pool = QThreadPool(self)
+        self._preview_pool.setMaxThreadCount(1)
+        self._preview_cancel_event = threading.Event()
+        self._preview_signals: PreviewLoadSignals | None = None
+        self._preview_cache_key: tuple | None = None
+        # Während des Wartens auf die Modelle läuft eine lokale Event-Loop;
+        # Navigation in dieser Zeit merkt sich nur den zuletzt gewählten Index
+        # While waiting for the models a local event loop runs; navigation
+        # during that time only records the most recently requested index
+        self._waiting_for_models = False
+        self._deferred_preview_index: int | None = None
+        # Vorab geladene Nachbarbilder (Prev/Next): Cache-Key → preview_done-Argumente
+        # Prefetched neighbours (prev/next): cache key → preview_done arguments
+        self._prefetch_cache: OrderedDict[tuple, tuple] = OrderedDict()
+        self._prefetch_pending: dict[tuple, tuple[PreviewLoadSignals, threading.Event]] = {}
         self._image_paths: list[str] = []
+        # (Verzeichnis, mtime_ns) → Bildpfade; unveraenderte Ordner nicht neu scannen
+        # (directory, mtime_ns) → image paths; skip rescans of unchanged folders
+        self._scan_cache: OrderedDict[tuple[str, int], list[str]] = OrderedDict()
+        # Cache-Key des laufenden Hintergrund-Scans / key of the running background scan
+        self._scan_pending_key: tuple[str, int] | None = None
+        self._scan_signals: DirectoryScanSignals | None = None
         self._preview_detector: PersonDetector | None = None
         self._preview_wm_detector: WatermarkDetector | None = None
         self._models_loaded = False
         self._model_loader: ModelLoaderThread | None = None
         self._pending_image_count: int | None = None
+        # Aktueller WZ-Modus als String, gepflegt in _on_wm_mode_changed
+        # Current watermark mode string, kept in sync by _on_wm_mode_changed
+        self._wm_mode_str: str = _WM_MODES[0]
+
+        # Fortschritts-Signale puffern und hoechstens alle 50 ms anzeigen
+        # Buffer per-image progress signals, flush to widgets at most every 50 ms
+        self._pending_progress: tuple[int, int, str] | None = None
+        self._pending_stats: dict | None = None
+        self._last_preview_progress = 0.0
+        self._ui_update_timer = QTimer(self)
+        self._ui_update_timer.setInterval(50)
+        self._ui_update_timer.timeout.connect(self._flush_ui_state)
+
+        # Padding/WZ-Slider: erst nach 200 ms Ruhe neu zuschneiden (ohne Erkennung)
+        # Padding/WM sliders: re-crop only after 200 ms of quiet (no detection)
+        self._preview_detections: tuple[str, object, list, list] | None = None
+        self._slider_debounce = QTimer(self)
+        self._slider_debounce.setSingleShot(True)
+        self._slider_debounce.setInterval(200)
+        self._slider_debounce.timeout.connect(self._recompute_preview_only)
+
+        # Logo einmal parsen, fuer Fenster-Icon und Sidebar gemeinsam nutzen
+        # Parse the logo once, shared by window icon and sidebar
+        self._logo_renderer: QSvgRenderer | None = None
+        logo_path = _find_resource("logo no_bg-cropped.svg")
+        if logo_path:
+            renderer = QSvgRenderer(logo_path, self)
+            if renderer.isValid():
+                self._logo_renderer = renderer
 
         self._setup_window()
         self._setup_ui()
@@ -95,25 +226,13 @@ class MainWindow(QMainWindow):
         )
 
         # App Icon
-        icon_path = self._find_resource("logo no_bg-cropped.svg")
-        if icon_path:
-            self.setWindowIcon(QIcon(icon_path))
-
-    def _find_resource(self, filename: str) -> str | None:
-        """Sucht eine Ressource-Datei relativ zum Projekt-Root."""
-        for base in [os.path.dirname(os.path.abspath(__file__)), ".", ".."]:
-            for root, dirs, files in os.walk(base):
-                if filename in files:
-                    return os.path.join(root, filename)
-        # Direkt im Projektordner suchen
-        candidates = [
-            filename,
-            os.path.join("..", "..", filename),
-        ]
-        for c in candidates:
-            if os.path.exists(c):
-                return os.path.abspath(c)
-        return None
+        if self._logo_renderer is not None:
+            pixmap = QPixmap(256, 256)
+            pixmap.fill(Qt.GlobalColor.transparent)
+            painter = QPainter(pixmap)
+            self._logo_renderer.render(painter)
+            painter.end()
+            self.setWindowIcon(QIcon(pixmap))
 
     def _setup_ui(self) -> None:
         central = QWidget()
@@ -128,6 +247,25 @@ class MainWindow(QMainWindow):
         # === Content Area ===
         self._setup_content(main_layout)
 
+        # Einstellungen, die das Erkennungsergebnis ändern, verwerfen den Vorschau-Cache
+        # (Padding/WZ-Prozent sind Teil des Cache-Keys)
+        # Settings that change detection results invalidate the preview cache
+        # (padding/WM percent are part of the cache key)
+        for signal in (
+            self._confidence_spin.valueChanged,
+            self._wm_confidence_spin.valueChanged,
+            self._wm_mode.currentIndexChanged,
+            self._wm_type_combo.currentIndexChanged,
+            self._wm_strict_check.toggled,
+            self._wm_enhanced_check.toggled,
+            self._person_detect_check.toggled,
+        ):
+            signal.connect(self._preview.invalidate_cache)
+            signal.connect(self._invalidate_prefetch)
+        # Schiebereglerwerte ändern nur den Zuschnitt / slider values only change the crop
+        self._padding_slider.valueChanged.connect(self._slider_debounce.start)
+        self._wm_slider.valueChanged.connect(self._slider_debounce.start)
+
     def _setup_sidebar(self, parent_layout: QHBoxLayout) -> None:
         sidebar = QFrame()
         sidebar.setObjectName("sidebar")
@@ -147,9 +285,8 @@ class MainWindow(QMainWindow):
 
         # --- Header ---
         header = QHBoxLayout()
-        logo_path = self._find_resource("logo no_bg-cropped.svg")
-        if logo_path:
-            logo = QSvgWidget(logo_path)
+        if self._logo_renderer is not None:
+            logo = SvgLogo(self._logo_renderer)
             logo.setFixedSize(40, 40)
             header.addWidget(logo)
 
@@ -357,38 +494,59 @@ class MainWindow(QMainWindow):
         parent_layout.addWidget(content, 1)
 
     def _setup_shortcuts(self) -> None:
+        # Tastenkuerzel als QActions am Fenster (ein Dispatch-Pfad statt QShortcuts)
+        # Shortcuts as window-level QActions (one dispatch path instead of QShortcuts)
+        def add_action(keys: str, action: QAction) -> None:
+            action.setShortcut(QKeySequence(keys))
+            action.setShortcutContext(Qt.ShortcutContext.WindowShortcut)
+            self.addAction(action)
+
+        def add_handler(keys: str, text: str, handler) -> None:
+            action = QAction(text, self)
+            action.triggered.connect(handler)
+            add_action(keys, action)
+
         # Ctrl+O — Quellordner
-        QShortcut(QKeySequence("Ctrl+O"), self, self._select_input_dir)
+        add_handler("Ctrl+O", "Quellordner wählen", self._select_input_dir)
         # Space — Start/Stop
-        QShortcut(QKeySequence("Space"), self, self._toggle_processing)
+        add_handler("Space", "Start/Stop", self._toggle_processing)
         # Escape — Stop
-        QShortcut(QKeySequence("Escape"), self, self._stop_processing)
+        add_handler("Escape", "Stop", self._stop_processing)
         # Left/Right — Bild-Navigation
-        QShortcut(QKeySequence("Left"), self, self._preview._go_prev)
-        QShortcut(QKeySequence("Right"), self, self._preview._go_next)
+        add_action("Left", self._preview.prev_action)
+        add_action("Right", self._preview.next_action)
         # P — Vorschau laden
-        QShortcut(QKeySequence("P"), self, self._load_preview_for_current)
+        add_handler("P", "Vorschau laden", self._load_preview_for_current)
 
     def _load_settings(self) -> None:
         """Lädt gespeicherte Einstellungen in die UI."""
-        input_dir = self._config.get("input_directory", "")
-        if input_dir and os.path.isdir(input_dir):
-            self._input_edit.setText(input_dir)
-            self._scan_images(input_dir)
-            # Ausgabeordner immer automatisch aus Quellordner ableiten
-            self._output_edit.setText(os.path.join(input_dir, "cropped"))
-
-        self._confidence_spin.setValue(self._config.get("confidence_threshold", 0.5))
-        self._padding_slider.setValue(self._config.get("padding_percent", 10))
-        self._quality_spin.setValue(self._config.get("jpeg_quality", 95))
-        self._workers_spin.setValue(self._config.get("max_workers", 4))
-        self._gpu_check.setChecked(self._config.get("use_gpu", True))
-
-        person_enabled = self._config.get("person_detection_enabled", True)
+        # Einmal die Sicht holen statt pro Schluessel ueber ConfigManager.get zu gehen
+        # Fetch the view once instead of going through ConfigManager.get per key
+        cfg = self._config.get_all()
+        input_dir = cfg.get("input_directory", "")
+        try:
+            input_path = Path(input_dir) if input_dir else None
+            # Nur ein stat-Aufruf (wichtig bei Netzlaufwerken)
+            # Single stat call (matters on network drives)
+            if input_path is not None and input_path.is_dir():
+                self._input_edit.setText(str(input_path))
+                self._scan_images(str(input_path))
+                # Ausgabeordner immer automatisch aus Quellordner ableiten
+                self._output_edit.setText(str(input_path / "cropped"))
+        except OSError as e:
+            logger.warning("Quellordner nicht lesbar: %s — %s", input_dir, e)
+
+        self._confidence_spin.setValue(cfg.get("confidence_threshold", 0.5))
+        self._padding_slider.setValue(cfg.get("padding_percent", 10))
+        self._quality_spin.setValue(cfg.get("jpeg_quality", 95))
+        self._workers_spin.setValue(cfg.get("max_workers", 4))
+        self._gpu_check.setChecked(cfg.get("use_gpu", True))
+
+        person_enabled = cfg.get("person_detection_enabled", True)
         self._person_detect_check.setChecked(person_enabled)
         self._confidence_spin.setEnabled(person_enabled)
 
-        wm_mode = self._config.get("watermark_mode", "manual")
+        wm_mode = cfg.get("watermark_mode", "manual")
         if wm_mode == "manual":
             self._wm_mode.setCurrentIndex(0)
         elif wm_mode == "auto":
@@ -396,55 +554,46 @@ class MainWindow(QMainWindow):
         else:
             self._wm_mode.setCurrentIndex(2)
 
-        self._wm_slider.setValue(self._config.get("watermark_percent", 0))
+        self._wm_slider.setValue(cfg.get("watermark_percent", 0))
         self._wm_confidence_spin.setValue(
-            self._config.get("watermark_confidence", 0.35)
+            cfg.get("watermark_confidence", 0.35)
         )
         self._wm_enhanced_check.setChecked(
-            self._config.get("watermark_enhanced_detection", True)
+            cfg.get("watermark_enhanced_detection", True)
         )
         self._wm_strict_check.setChecked(
-            self._config.get("watermark_strict_filter", True)
+            cfg.get("watermark_strict_filter", True)
         )
         self._wm_template_check.setChecked(
-            self._config.get("watermark_template_enabled", False)
+            cfg.get("watermark_template_enabled", False)
         )
 
-        wm_type = self._config.get("watermark_type", "logo")
+        wm_type = cfg.get("watermark_type", "logo")
         self._wm_type_combo.setCurrentIndex(0 if wm_type == "logo" else 1)
 
     def _save_settings(self) -> None:
         """Speichert aktuelle UI-Einstellungen."""
-        self._config.set("input_directory", self._input_edit.text())
-        self._config.set("output_directory", self._output_edit.text())
-        self._config.set("confidence_threshold", self._confidence_spin.value())
-        self._config.set("padding_percent", self._padding_slider.value())
-        self._config.set("jpeg_quality", self._quality_spin.value())
-        self._config.set("max_workers", self._workers_spin.value())
-        self._config.set("use_gpu", self._gpu_check.isChecked())
-        self._config.set(
-            "person_detection_enabled", self._person_detect_check.isChecked()
-        )
-        self._config.set("watermark_percent", self._wm_slider.value())
-        self._config.set("watermark_confidence", self._wm_confidence_spin.value())
-        self._config.set(
-            "watermark_enhanced_detection", self._wm_enhanced_check.isChecked()
-        )
-        self._config.set(
-            "watermark_strict_filter", self._wm_strict_check.isChecked()
+        self._config.update(
+            {
+                "input_directory": self._input_edit.text(),
+                "output_directory": self._output_edit.text(),
+                "confidence_threshold": self._confidence_spin.value(),
+                "padding_percent": self._padding_slider.value(),
+                "jpeg_quality": self._quality_spin.value(),
+                "max_workers": self._workers_spin.value(),
+                "use_gpu": self._gpu_check.isChecked(),
+                "person_detection_enabled": self._person_detect_check.isChecked(),
+                "watermark_percent": self._wm_slider.value(),
+                "watermark_confidence": self._wm_confidence_spin.value(),
+                "watermark_enhanced_detection": self._wm_enhanced_check.isChecked(),
+                "watermark_strict_filter": self._wm_strict_check.isChecked(),
+                "watermark_template_enabled": self._wm_template_check.isChecked(),
+                "watermark_mode": self._wm_mode_str,
+                "watermark_type": _WM_TYPES[self._wm_type_combo.currentIndex()],
+                "window_width": self.width(),
+                "window_height": self.height(),
+            }
         )
-        self._config.set(
-            "watermark_template_enabled", self._wm_template_check.isChecked()
-        )
-
-        idx = self._wm_mode.currentIndex()
-        self._config.set("watermark_mode", ["manual", "auto", "disabled"][idx])
-        self._config.set(
-            "watermark_type", ["logo", "text"][self._wm_type_combo.currentIndex()]
-        )
-
-        self._config.set("window_width", self.width())
-        self._config.set("window_height", self.height())
         self._config.save()
 
     # === Model Preload ===
@@ -454,6 +603,8 @@ class MainWindow(QMainWindow):
 
         Starts loading both YOLO models in background thread on app startup.
         """
+        from src.core.processor import ModelLoaderThread
+
         self._eta_label.setText(
             "⏳ KI-Modelle werden geladen — Quellordner kann bereits gewählt werden"
         )
@@ -472,12 +623,12 @@ class MainWindow(QMainWindow):
             use_gpu=self._gpu_check.isChecked(),
             wm_strict_filter=self._wm_strict_check.isChecked(),
             wm_enhanced_detection=self._wm_enhanced_check.isChecked(),
-            wm_type=["logo", "text"][self._wm_type_combo.currentIndex()],
+            wm_type=_WM_TYPES[self._wm_type_combo.currentIndex()],
             parent=self,
         )
-        self._model_loader.progress_text.connect(self._on_model_load_progress)
-        self._model_loader.model_ready.connect(self._on_models_loaded)
-        self._model_loader.error_occurred.connect(self._on_model_load_error)
+        self._model_loader.progress_text.connect(self._on_model_load_progress, _QUEUED)
+        self._model_loader.model_ready.connect(self._on_models_loaded, _QUEUED)
+        self._model_loader.error_occurred.connect(self._on_model_load_error, _QUEUED)
         self._model_loader.start()
 
     def _on_model_load_progress(self, text: str) -> None:
@@ -553,7 +704,71 @@ class MainWindow(QMainWindow):
             self._output_edit.setText(output)
 
     def _scan_images(self, directory: str) -> None:
-        self._image_paths = FileManager.scan_directory(directory)
+        """Scannt den Quellordner; bei Cache-Miss asynchron im QThreadPool."""
+        try:
+            key = (directory, os.stat(directory).st_mtime_ns)
+        except OSError:
+            # Ordner fehlt → sofort leeres Ergebnis anzeigen
+            # Missing folder → show the empty result right away
+            self._scan_pending_key = None
+            self._scan_signals = None
+            self._apply_scan_result(FileManager.scan_directory(directory))
+            return
+
+        cached = self._scan_cache.get(key)
+        if cached is not None:
+            self._scan_cache.move_to_end(key)
+            self._scan_pending_key = None
+            self._scan_signals = None
+            self._apply_scan_result(list(cached))
+            return
+        if key == self._scan_pending_key:
+            return  # Gleicher Scan läuft bereits
+
+        from src.core.processor import DirectoryScanTask
+
+        self._scan_pending_key = key
+        self._image_paths = []
+        self._preview.set_image_count(0)
+        self._image_count_label.setText("Scanne Ordner...")
+        task = DirectoryScanTask(directory)
+        self._scan_signals = task.signals
+        task.signals.scan_progress.connect(self._on_scan_progress, _QUEUED)
+        task.signals.scan_complete.connect(self._on_scan_complete, _QUEUED)
+        QThreadPool.globalInstance().start(task)
+
+    def _is_current_scan_signal(self) -> bool:
+        """True, wenn das Signal vom zuletzt gestarteten Scan stammt.
+
+        Compares the sender instead of the directory: an older, slower scan of
+        the same folder (previous mtime) must not be cached under the new key.
+        """
+        return (
+            self._scan_pending_key is not None
+            and self.sender() is self._scan_signals
+        )
+
+    def _on_scan_progress(self, count: int) -> None:
+        if self._is_current_scan_signal():
+            self._image_count_label.setText(f"Scanne Ordner... {count} Bilder")
+
+    def _on_scan_complete(self, directory: str, paths: list) -> None:
+        # Ergebnis eines inzwischen ersetzten Scans verwerfen
+        # Drop results of a scan that has since been superseded
+        if not self._is_current_scan_signal():
+            return
+        key = self._scan_pending_key
+        self._scan_pending_key = None
+        self._scan_cache[key] = paths
+        if len(self._scan_cache) > self.SCAN_CACHE_SIZE:
+            self._scan_cache.popitem(last=False)
+        self._apply_scan_result(list(paths))
+
+    def _apply_scan_result(self, paths: list[str]) -> None:
+        # Vorab geladene Ergebnisse tragen Indizes der alten Liste
+        # Prefetched results carry indices of the previous list
+        self._invalidate_prefetch()
+        self._image_paths = paths
         count = len(self._image_paths)
         self._image_count_label.setText(
             f"{count} Bilder gefunden" if count > 0 else "Keine Bilder gefunden"
@@ -573,6 +788,7 @@ class MainWindow(QMainWindow):
     def _on_wm_mode_changed(self, index: int) -> None:
         # Slider nur bei manuellem Modus, Auto-Optionen nur bei Auto
         # Slider only in manual mode, auto options only in auto mode
+        self._wm_mode_str = _WM_MODES[index]
         is_manual = index == 0
         is_auto = index == 1
         self._wm_slider.setVisible(is_manual)
@@ -603,40 +819,39 @@ class MainWindow(QMainWindow):
 
         self._save_settings()
 
-        wm_idx = self._wm_mode.currentIndex()
-        wm_mode = ["manual", "auto", "disabled"][wm_idx]
-
-        config = {
-            "confidence_threshold": self._confidence_spin.value(),
-            "padding_percent": self._padding_slider.value(),
-            "jpeg_quality": self._quality_spin.value(),
-            "max_workers": self._workers_spin.value(),
-            "use_gpu": self._gpu_check.isChecked(),
-            "watermark_mode": wm_mode,
-            "watermark_percent": self._wm_slider.value(),
-            "watermark_confidence": self._wm_confidence_spin.value(),
-            "watermark_strict_filter": self._wm_strict_check.isChecked(),
-            "watermark_enhanced_detection": self._wm_enhanced_check.isChecked(),
-            "watermark_template_enabled": self._wm_template_check.isChecked(),
-            "watermark_type": ["logo", "text"][self._wm_type_combo.currentIndex()],
-            "person_model": "models/yolov8n.pt",
-            "watermark_model": "models/best.pt",
-            "person_detection_enabled": self._person_detect_check.isChecked(),
-            "multi_detection_action": self._config.get("multi_detection_action", "ask"),
-        }
+        from src.core.processor import ProcessingConfig, ProcessingThread
+
+        config = ProcessingConfig(
+            confidence_threshold=self._confidence_spin.value(),
+            padding_percent=self._padding_slider.value(),
+            jpeg_quality=self._quality_spin.value(),
+            max_workers=self._workers_spin.value(),
+            use_gpu=self._gpu_check.isChecked(),
+            watermark_mode=self._wm_mode_str,
+            watermark_percent=self._wm_slider.value(),
+            watermark_confidence=self._wm_confidence_spin.value(),
+            watermark_strict_filter=self._wm_strict_check.isChecked(),
+            watermark_enhanced_detection=self._wm_enhanced_check.isChecked(),
+            watermark_template_enabled=self._wm_template_check.isChecked(),
+            watermark_type=_WM_TYPES[self._wm_type_combo.currentIndex()],
+            person_model="models/yolov8n.pt",
+            watermark_model="models/best.pt",
+            person_detection_enabled=self._person_detect_check.isChecked(),
+            multi_detection_action=self._config.get("multi_detection_action", "ask"),
+        )
 
         self._processing_thread = ProcessingThread(
             image_paths=self._image_paths,
             output_dir=output_dir,
             config=config,
         )
-        self._processing_thread.progress.connect(self._on_progress)
-        self._processing_thread.image_processed.connect(self._on_image_processed)
-        self._processing_thread.preview_ready.connect(self._on_preview_ready)
-        self._processing_thread.batch_finished.connect(self._on_batch_finished)
-        self._processing_thread.error_occurred.connect(self._on_error)
-        self._processing_thread.selection_needed.connect(self._on_selection_needed)
-        self._processing_thread.template_needed.connect(self._on_template_needed)
+        self._processing_thread.progress.connect(self._on_progress, _QUEUED)
+        self._processing_thread.image_processed.connect(self._on_image_processed, _QUEUED)
+        self._processing_thread.preview_ready.connect(self._on_preview_ready, _QUEUED)
+        self._processing_thread.batch_finished.connect(self._on_batch_finished, _QUEUED)
+        self._processing_thread.error_occurred.connect(self._on_error, _QUEUED)
+        self._processing_thread.selection_needed.connect(self._on_selection_needed, _QUEUED)
+        self._processing_thread.template_needed.connect(self._on_template_needed, _QUEUED)
         self._processing_thread.start()
 
         self._start_btn.setEnabled(False)
@@ -651,55 +866,70 @@ class MainWindow(QMainWindow):
             self._eta_label.setText("Abbruch angefordert...")
 
     def _on_progress(self, current: int, total: int, filename: str) -> None:
-        self._progress_bar.setMaximum(total)
-        self._progress_bar.setValue(current)
-        self._progress_card.set_progress(current, total, filename)
+        self._pending_progress = (current, total, filename)
+        if not self._ui_update_timer.isActive():
+            self._ui_update_timer.start()
 
-        # ETA berechnen
+    def _on_image_processed(self, result: dict) -> None:
         if self._processing_thread:
             stats = self._processing_thread.stats
-            eta = stats.eta_seconds()
-            speed = stats.speed
-            if speed > 0:
-                eta_min = int(eta // 60)
-                eta_sec = int(eta % 60)
-                self._eta_label.setText(
-                    f"{speed:.1f} Bilder/s — ETA: {eta_min}:{eta_sec:02d}"
-                )
+            self._pending_stats = {
+                "processed": stats.processed,
+                "skipped": stats.skipped,
+                "errors": stats.errors,
+                "watermarks": stats.watermarks_found,
+                "speed": stats.speed,
+            }
+            if not self._ui_update_timer.isActive():
+                self._ui_update_timer.start()
+
+    def _flush_ui_state(self) -> None:
+        """Schreibt den zuletzt gepufferten Fortschritt in die Widgets.
+
+        Writes the latest buffered progress/stats to the widgets; stops the
+        timer once a tick finds nothing new.
+        """
+        if self._pending_progress is None and self._pending_stats is None:
+            self._ui_update_timer.stop()
+            return
 
-    def _on_image_processed(self, result: dict) -> None:
-        if self._processing_thread:
-            self._progress_card.set_stats(
-                {
-                    "processed": self._processing_thread.stats.processed,
-                    "skipped": self._processing_thread.stats.skipped,
-                    "errors": self._processing_thread.stats.errors,
-                    "watermarks": self._processing_thread.stats.watermarks_found,
-                    "speed": self._processing_thread.stats.speed,
-                }
-            )
+        if self._pending_progress is not None:
+            current, total, filename = self._pending_progress
+            self._pending_progress = None
+            self._progress_bar.setMaximum(total)
+            self._progress_bar.setValue(current)
+            self._progress_card.set_progress(current, total, filename)
+
+            # ETA berechnen
+            if self._processing_thread:
+                stats = self._processing_thread.stats
+                eta = stats.eta_seconds()
+                speed = stats.speed
+                if speed > 0:
+                    eta_min = int(eta // 60)
+                    eta_sec = int(eta % 60)
+                    self._eta_label.setText(
+                        f"{speed:.1f} Bilder/s — ETA: {eta_min}:{eta_sec:02d}"
+                    )
+
+        if self._pending_stats is not None:
+            self._progress_card.set_stats(self._pending_stats)
+            self._pending_stats = None
 
     def _on_preview_ready(
-        self, path, original, cropped, boxes, watermark_boxes
+        self, path, original, cropped, boxes, watermark_boxes, crop_region
     ) -> None:
+        # Crop-Region kommt fertig aus dem Worker-Thread
+        # Crop region is computed by the worker thread, not on the GUI thread
         filename = Path(path).name
-        # Crop-Region berechnen für Overlay
-        crop_region = None
-        if boxes:
-            wm_idx = self._wm_mode.currentIndex()
-            wm_mode = ["manual", "auto", "disabled"][wm_idx]
-            crop_region = CropEngine.calculate_crop_region(
-                image_shape=original.shape,
-                person_boxes=boxes,
-                padding_percent=self._padding_slider.value(),
-                watermark_boxes=watermark_boxes if wm_mode == "auto" else None,
-                watermark_percent=self._wm_slider.value() if wm_mode == "manual" else 0,
-            )
         self._preview.set_preview(
             original, cropped, boxes, filename, watermark_boxes, crop_region
         )
 
     def _on_batch_finished(self, summary: dict) -> None:
+        # Letzten gepufferten Stand anzeigen, bevor die Summary ihn ueberschreibt
+        self._flush_ui_state()
+        self._ui_update_timer.stop()
         self._start_btn.setEnabled(True)
         self._stop_btn.setEnabled(False)
         self._progress_card.set_stats(summary)
@@ -715,20 +945,41 @@ class MainWindow(QMainWindow):
         self._save_settings()
 
     def _on_error(self, message: str) -> None:
+        self._ui_update_timer.stop()
+        self._pending_progress = None
+        self._pending_stats = None
         self._start_btn.setEnabled(True)
         self._stop_btn.setEnabled(False)
         QMessageBox.critical(self, "Fehler", message)
         self._eta_label.setText(f"Fehler: {message}")
 
-    def _get_preview_detectors(self) -> tuple[PersonDetector, WatermarkDetector | None]:
+    def _get_preview_detectors(
+        self,
+    ) -> "tuple[PersonDetector, WatermarkDetector | None]":
         """Gibt vorgeladene Detektoren zurück (oder Lazy-Init als Fallback).
 
         Returns preloaded detectors, or falls back to lazy init if preload failed.
         """
-        # Warten falls Preload noch läuft / Wait if preload is still running
-        if self._model_loader and self._model_loader.isRunning():
+        from src.core.detector import PersonDetector
+        from src.core.watermark import WatermarkDetector
+
+        # Warten falls Preload noch läuft, Event-Loop läuft dabei weiter (max 10s)
+        # Wait if preload is still running while keeping the UI responsive (max 10s)
+        loader = self._model_loader
+        if loader and loader.isRunning():
             self._eta_label.setText("Warte auf Modell...")
-            self._model_loader.wait(10000)  # max 10s
+            loop = QEventLoop(self)
+            loader.model_ready.connect(loop.quit, _QUEUED)
+            loader.error_occurred.connect(loop.quit, _QUEUED)
+            loader.finished.connect(loop.quit, _QUEUED)
+            QTimer.singleShot(10000, loop.quit)
+            if loader.isRunning():
+                self._waiting_for_models = True
+                try:
+                    loop.exec()
+                finally:
+                    self._waiting_for_models = False
+            loop.deleteLater()
 
         # Preloaded Detektoren nutzen / Use preloaded detectors
         if self._preview_detector is not None:
@@ -746,10 +997,9 @@ class MainWindow(QMainWindow):
                 detail = self._preview_detector.last_error or "Unbekannter Fehler"
                 logger.error("Preview-Detector konnte nicht geladen werden: %s", detail)
 
-        wm_idx = self._wm_mode.currentIndex()
         wm_detector = None
-        if wm_idx == 1:  # Auto
-            wm_type = ["logo", "text"][self._wm_type_combo.currentIndex()]
+        if self._wm_mode_str == "auto":
+            wm_type = _WM_TYPES[self._wm_type_combo.currentIndex()]
             if self._preview_wm_detector is not None:
                 self._preview_wm_detector.set_confidence(self._wm_confidence_spin.value())
                 self._preview_wm_detector.set_gpu(self._gpu_check.isChecked())
@@ -778,13 +1028,52 @@ class MainWindow(QMainWindow):
         """Lädt die Vorschau für ein bestimmtes Bild (asynchron mit Fortschritt)."""
         if not self._image_paths or index < 0 or index >= len(self._image_paths):
             return
+        if self._waiting_for_models:
+            # Äußerer Aufruf lädt nach dem Warten den zuletzt gewählten Index
+            # The outer call loads the latest requested index after the wait
+            self._deferred_preview_index = index
+            return
 
-        # Falls bereits ein Preview-Thread läuft, abbrechen
-        if self._preview_thread and self._preview_thread.isRunning():
-            self._preview_thread.wait(2000)
+        # Laufenden Preview-Task abbrechen, ohne den GUI-Thread zu blockieren
+        # Cancel any in-flight preview task without blocking the GUI thread
+        self._preview_cancel_event.set()
 
         path = self._image_paths[index]
         filename = Path(path).name
+
+        # Bereits gerenderte Vorschau → sofort anzeigen, keine Erkennung nötig
+        # Already rendered preview → show immediately, no detection needed
+        self._preview_cache_key = self._preview_cache_key_for(path)
+        cached = self._preview.show_cached(self._preview_cache_key)
+        # Nur mit passenden Boxen übernehmen, sonst regulär neu laden
+        # Only use it with matching detections, otherwise load normally
+        if cached is not None and cached[1] is not None and cached[1][0] == path:
+            status, (_path, person_boxes, wm_boxes) = cached
+            # Vollbild ist nicht gecacht; _recompute_preview_only lädt es bei Bedarf
+            # Full image is not cached; _recompute_preview_only loads it on demand
+            self._preview_detections = (path, None, person_boxes, wm_boxes)
+            self._preview_signals = None  # Signale eines laufenden Tasks ignorieren
+            self._preview.set_current_index(index)
+            self._eta_label.setText(status)
+            self._restore_preview_controls()
+            self._prefetch_neighbours(index)
+            return
+
+        # Vorab geladenes Nachbarbild → ohne erneute Erkennung anzeigen
+        # Prefetched neighbour → show without running detection again
+        prefetched = self._prefetch_cache.pop(self._preview_cache_key, None)
+        if prefetched is not None:
+            self._preview_signals = None
+            # Index des Aufrufers statt des beim Prefetch gemerkten verwenden
+            # Use the caller's index, not the one recorded at prefetch time
+            self._show_preview_result(index, *prefetched[1:])
+            return
+
+        # Noch laufenden Prefetch dieses Bildes übernehmen, andere abbrechen
+        # Adopt a still running prefetch of this image, cancel the others
+        pending = self._prefetch_pending.pop(self._preview_cache_key, None)
+        self._cancel_prefetch()
+
         self._eta_label.setText(f"Lade Vorschau: {filename}...")
 
         # UI für Ladevorgang vorbereiten
@@ -793,59 +1082,215 @@ class MainWindow(QMainWindow):
         self._progress_bar.setMaximum(0)  # Indeterminate / pulsierend
         self._progress_bar.setFormat("Vorschau wird geladen...")
 
+        if pending is not None:
+            # Ergebnis kommt weiter über _on_prefetch_done, das an die Anzeige
+            # weiterleitet — auch wenn der Task schon vor der Übernahme emittiert hat
+            # The result keeps arriving via _on_prefetch_done, which forwards it
+            # to the display — even if the task emitted before it was adopted
+            signals, self._preview_cancel_event = pending
+            self._preview_signals = signals
+            signals.progress.connect(self._on_preview_progress, _QUEUED)
+            return
+
         # Detektoren vorbereiten (Lazy-Init, synchron — nur beim ersten Mal langsam)
         person_detector, wm_detector = self._get_preview_detectors()
+        if self._load_deferred_preview():
+            return
+        self._preview_cancel_event = threading.Event()
+        signals = self._start_preview_task(
+            index, person_detector, wm_detector, self._preview_cancel_event
+        )
+        self._preview_signals = signals
+        signals.progress.connect(self._on_preview_progress, _QUEUED)
+        signals.preview_done.connect(self._on_preview_load_done, _QUEUED)
+        signals.error_occurred.connect(self._on_preview_load_error, _QUEUED)
+
+    def _load_deferred_preview(self) -> bool:
+        """Lädt einen während des Modell-Wartens angeforderten Index; True wenn ja."""
+        index = self._deferred_preview_index
+        if index is None:
+            return False
+        self._deferred_preview_index = None
+        self._load_preview_for_index(index)
+        return True
 
-        wm_idx = self._wm_mode.currentIndex()
-        wm_mode = ["manual", "auto", "disabled"][wm_idx]
-
-        self._preview_thread = PreviewLoadThread(
-            image_path=path,
+    def _start_preview_task(
+        self,
+        index: int,
+        person_detector: "PersonDetector",
+        wm_detector: "WatermarkDetector | None",
+        cancel_event: threading.Event,
+        priority: int = 0,
+    ) -> "PreviewLoadSignals":
+        """Startet einen PreviewLoadTask mit den aktuellen Einstellungen."""
+        from src.core.processor import PreviewLoadTask
+
+        task = PreviewLoadTask(
+            image_path=self._image_paths[index],
             index=index,
             person_detector=person_detector,
             wm_detector=wm_detector,
-            wm_mode=wm_mode,
+            wm_mode=self._wm_mode_str,
             padding_percent=self._padding_slider.value(),
             wm_percent=self._wm_slider.value(),
+            renderer=partial(render_preview, max_size=self._preview.preview_max_size()),
             person_detection_enabled=self._person_detect_check.isChecked(),
-            parent=self,
+            cancel_event=cancel_event,
+        )
+        self._preview_pool.start(task, priority)
+        return task.signals
+
+    def _prefetch_neighbours(self, index: int) -> None:
+        """Lädt Vorschau und Erkennung für index±1 spekulativ im Hintergrund.
+
+        Prefetch-Tasks laufen mit niedriger Priorität im selben Pool; das Ergebnis
+        landet nur im Prefetch-Cache und wird erst bei Navigation angezeigt.
+        """
+        if self._preview_detector is None:
+            return
+        person_detector, wm_detector = self._get_preview_detectors()
+        if self._load_deferred_preview():
+            return
+        for neighbour in (index + 1, index - 1):
+            if not 0 <= neighbour < len(self._image_paths):
+                continue
+            key = self._preview_cache_key_for(self._image_paths[neighbour])
+            if (
+                key in self._prefetch_cache
+                or key in self._prefetch_pending
+                or self._preview.is_cached(key)
+            ):
+                continue
+            cancel_event = threading.Event()
+            signals = self._start_preview_task(
+                neighbour, person_detector, wm_detector, cancel_event, priority=-1
+            )
+            signals.preview_done.connect(self._on_prefetch_done, _QUEUED)
+            signals.error_occurred.connect(self._on_prefetch_error, _QUEUED)
+            self._prefetch_pending[key] = (signals, cancel_event)
+
+    def _is_adopted_prefetch(self) -> bool:
+        """True, wenn das Signal vom als aktuelle Vorschau übernommenen Prefetch stammt."""
+        return self._preview_signals is not None and self.sender() is self._preview_signals
+
+    def _pop_prefetch_sender(self) -> tuple | None:
+        """Entfernt den sendenden Prefetch-Task aus der Warteliste; gibt seinen Key zurück."""
+        sender = self.sender()
+        for key, (signals, _event) in self._prefetch_pending.items():
+            if signals is sender:
+                del self._prefetch_pending[key]
+                return key
+        return None
+
+    def _on_prefetch_done(self, *result) -> None:
+        """Legt ein vorab geladenes Ergebnis im Prefetch-Cache ab.
+
+        Results of a prefetch adopted by _load_preview_for_index are shown
+        directly instead.
+        """
+        if self._is_adopted_prefetch():
+            self._show_preview_result(*result)
+            return
+        key = self._pop_prefetch_sender()
+        if key is None:
+            return  # übernommen oder abgebrochen / adopted or cancelled
+        self._prefetch_cache[key] = result
+        self._prefetch_cache.move_to_end(key)
+        if len(self._prefetch_cache) > self.PREFETCH_CACHE_SIZE:
+            self._prefetch_cache.popitem(last=False)
+
+    def _on_prefetch_error(self, message: str) -> None:
+        if self._is_adopted_prefetch():
+            self._on_preview_load_error(message)
+            return
+        if self._pop_prefetch_sender() is not None:
+            logger.debug("Prefetch fehlgeschlagen: %s", message)
+
+    def _cancel_prefetch(self) -> None:
+        """Bricht alle noch laufenden Prefetch-Tasks ab."""
+        for _signals, cancel_event in self._prefetch_pending.values():
+            cancel_event.set()
+        self._prefetch_pending.clear()
+
+    def _invalidate_prefetch(self) -> None:
+        """Verwirft vorab geladene Ergebnisse (Einstellungen haben sich geändert)."""
+        self._cancel_prefetch()
+        self._prefetch_cache.clear()
+
+    def _preview_cache_key_for(self, path: str) -> tuple:
+        """Cache-Schlüssel einer Vorschau: Bild, Zielgröße und Crop-Einstellungen."""
+        return (
+            path,
+            self._preview.preview_max_size(),
+            self._wm_mode_str,
+            self._padding_slider.value(),
+            self._wm_slider.value(),
         )
-        self._preview_thread.progress.connect(self._on_preview_progress)
-        self._preview_thread.preview_done.connect(self._on_preview_load_done)
-        self._preview_thread.error_occurred.connect(self._on_preview_load_error)
-        self._preview_thread.start()
+
+    def _is_stale_preview_signal(self) -> bool:
+        """True, wenn das Signal von einem bereits ersetzten Preview-Task stammt."""
+        sender = self.sender()
+        return sender is not None and sender is not self._preview_signals
 
     def _on_preview_progress(self, step: int, total: int, description: str) -> None:
         """Aktualisiert Fortschrittsbalken während Preview-Laden."""
-        self._progress_bar.setMaximum(total)
+        if self._is_stale_preview_signal():
+            return
+        # Höchstens ~30 Updates/s; der letzte Schritt wird immer angezeigt
+        # At most ~30 updates/s; the final step is always shown
+        now = time.monotonic()
+        if step < total and now - self._last_preview_progress < self.PREVIEW_PROGRESS_INTERVAL:
+            return
+        self._last_preview_progress = now
+        if self._progress_bar.maximum() != total:
+            self._progress_bar.setMaximum(total)
         self._progress_bar.setValue(step)
         self._progress_bar.setFormat(f"Vorschau: %v/%m — {description}")
         self._eta_label.setText(description)
 
     def _on_preview_load_done(
-        self, index: int, original, cropped, person_boxes: list, wm_boxes: list, filename: str
+        self,
+        index: int,
+        original,
+        rendered,
+        person_boxes: list,
+        wm_boxes: list,
+        filename: str,
+        crop_region,
     ) -> None:
-        """Wird aufgerufen wenn der Preview-Thread fertig ist.
+        """Wird aufgerufen wenn der Preview-Task fertig ist.
 
-        Called when preview thread finishes. Shows selection dialog if
-        multiple detections found.
+        Called when preview thread finishes; results of superseded tasks
+        are dropped, everything else goes to _show_preview_result.
         """
-        # Crop-Region berechnen fuer Overlay (auch ohne Person wenn WM vorhanden)
-        # Calculate crop region for overlay (also without person when WM present)
-        wm_idx = self._wm_mode.currentIndex()
-        wm_mode = ["manual", "auto", "disabled"][wm_idx]
-        wm_pct = self._wm_slider.value() if wm_mode == "manual" else 0
-        crop_region = CropEngine.calculate_crop_region(
-            image_shape=original.shape,
-            person_boxes=person_boxes,
-            padding_percent=self._padding_slider.value(),
-            watermark_boxes=wm_boxes if wm_mode == "auto" else None,
-            watermark_percent=wm_pct,
+        if self._is_stale_preview_signal():
+            return
+        self._show_preview_result(
+            index, original, rendered, person_boxes, wm_boxes, filename, crop_region
         )
 
+    def _show_preview_result(
+        self,
+        index: int,
+        original,
+        rendered,
+        person_boxes: list,
+        wm_boxes: list,
+        filename: str,
+        crop_region,
+    ) -> None:
+        """Zeigt ein fertiges Preview-Ergebnis an (Task oder Prefetch-Cache).
+
+        Shows selection dialog if multiple detections found. Crop region,
+        scaling and overlays are computed by the worker; only the pixmap
+        upload happens here.
+        """
+        self._preview_detections = (
+            self._image_paths[index], original, person_boxes, wm_boxes
+        )
         self._preview.set_current_index(index)
-        self._preview.set_preview(
-            original, cropped, person_boxes, filename, wm_boxes, crop_region
+        self._preview.set_rendered_preview(
+            rendered, original, person_boxes, filename, wm_boxes
         )
 
         # Status-Info
@@ -858,12 +1303,12 @@ class MainWindow(QMainWindow):
             info_parts = ["Keine Erkennung"]
         self._eta_label.setText(f"{filename}: {', '.join(info_parts)}")
 
-        # UI wiederherstellen / Restore UI
-        self._preview_btn.setEnabled(True)
-        self._preview_btn.setText("👁  Vorschau laden")
-        self._progress_bar.setMaximum(len(self._image_paths))
-        self._progress_bar.setValue(0)
-        self._progress_bar.setFormat("%p% — %v/%m Bilder")
+        # Gerenderte Vorschau für erneutes Anzeigen merken / keep for revisits
+        if self._preview_cache_key is not None:
+            self._cache_current_preview(self._preview_cache_key)
+
+        self._restore_preview_controls()
+        self._prefetch_neighbours(index)
 
         # Bei Mehrfach-Erkennung → Auswahl-Dialog öffnen
         # Multi-detection → open selection dialog
@@ -876,11 +1321,15 @@ class MainWindow(QMainWindow):
             )
 
     def _on_preview_load_error(self, message: str) -> None:
-        """Wird aufgerufen wenn der Preview-Thread einen Fehler hat."""
+        """Wird aufgerufen wenn der Preview-Task einen Fehler hat."""
+        if self._is_stale_preview_signal():
+            return
         logger.error("Preview-Fehler: %s", message)
         self._eta_label.setText(f"Fehler: {message}")
+        self._restore_preview_controls()
 
-        # UI wiederherstellen
+    def _restore_preview_controls(self) -> None:
+        """Setzt Button und Fortschrittsbalken nach dem Preview-Laden zurück."""
         self._preview_btn.setEnabled(True)
         self._preview_btn.setText("👁  Vorschau laden")
         self._progress_bar.setMaximum(len(self._image_paths))
@@ -908,6 +1357,8 @@ class MainWindow(QMainWindow):
         Processing thread found no watermark in the first image via YOLO.
         Opens template marking dialog so user can manually select a region.
         """
+        from src.ui.template_dialog import WatermarkTemplateDialog
+
         filename = Path(path).name
         dialog = WatermarkTemplateDialog(
             image=image, filename=filename, parent=self
@@ -929,6 +1380,8 @@ class MainWindow(QMainWindow):
         Batch thread needs user selection for multi-detection.
         Opens modal dialog, then resumes thread with result.
         """
+        from src.ui.selection_dialog import DetectionSelectionDialog
+
         filename = Path(path).name
         dialog = DetectionSelectionDialog(
             image=image,
@@ -966,6 +1419,8 @@ class MainWindow(QMainWindow):
 
         Shows selection dialog in preview mode and updates preview with result.
         """
+        from src.ui.selection_dialog import DetectionSelectionDialog
+
         dialog = DetectionSelectionDialog(
             image=image,
             person_boxes=person_boxes,
@@ -981,31 +1436,92 @@ class MainWindow(QMainWindow):
 
             # Crop-Region mit ausgewählten Boxen neu berechnen
             # Recalculate crop region with selected boxes only
-            wm_idx = self._wm_mode.currentIndex()
-            wm_mode = ["manual", "auto", "disabled"][wm_idx]
+            self._show_cropped_preview(
+                image, result.selected_persons, result.selected_watermarks, filename
+            )
+            if (
+                self._preview_detections is not None
+                and Path(self._preview_detections[0]).name == filename
+            ):
+                self._preview_detections = (
+                    self._preview_detections[0], image,
+                    result.selected_persons, result.selected_watermarks,
+                )
+            # Auswahl ersetzt die gecachte Vorschau dieses Bildes
+            # The selection replaces this image's cached preview
+            key = self._preview_cache_key
+            if key is not None and Path(key[0]).name == filename:
+                self._cache_current_preview(key)
+
+    def _show_cropped_preview(
+        self, image, person_boxes: list, wm_boxes: list, filename: str
+    ) -> None:
+        """Schneidet mit den aktuellen Slider-Werten zu und zeigt die Vorschau an."""
+        from src.core.cropper import CropEngine
+
+        wm_mode = self._wm_mode_str
+        wm_pct = self._wm_slider.value() if wm_mode == "manual" else 0
+        crop_region = None
+        cropped = None
+        if person_boxes or wm_boxes or wm_pct > 0:
             crop_region = CropEngine.calculate_crop_region(
                 image_shape=image.shape,
-                person_boxes=result.selected_persons,
+                person_boxes=person_boxes,
                 padding_percent=self._padding_slider.value(),
-                watermark_boxes=result.selected_watermarks if wm_mode == "auto" else None,
-                watermark_percent=self._wm_slider.value() if wm_mode == "manual" else 0,
+                watermark_boxes=wm_boxes if wm_mode == "auto" else None,
+                watermark_percent=wm_pct,
             )
-
-            cropped = None
             if crop_region:
-                cropped = CropEngine.crop_image(image, crop_region)
+                cropped = CropEngine.crop_view(image, crop_region)
 
-            self._preview.set_preview(
-                image, cropped, result.selected_persons,
-                filename, result.selected_watermarks, crop_region,
-            )
+        self._preview.set_preview(
+            image, cropped, person_boxes, filename, wm_boxes, crop_region,
+        )
+
+    def _recompute_preview_only(self) -> None:
+        """Aktualisiert den Zuschnitt nach Slider-Änderung mit den letzten Boxen.
+
+        Recomputes the crop from the cached detections; no inference runs.
+        The preview task only sends the full-res image for multi-detections,
+        so it is read from disk here on the first slider change.
+        """
+        detections = self._preview_detections
+        if detections is None or not self._preview_btn.isEnabled():
+            return  # keine Vorschau oder Laden läuft / nothing shown or loading
+        path, image, person_boxes, wm_boxes = detections
+        index = self._preview._current_index
+        if not 0 <= index < len(self._image_paths):
+            return
+        if self._image_paths[index] != path:
+            # Boxen gehören zu einem anderen Bild → aktuelles Bild neu laden
+            # Detections belong to another image → reload the current one
+            self._load_preview_for_index(index)
+            return
+        if image is None:
+            image = FileManager.load_image(path)
+            if image is None:
+                return
+            self._preview_detections = (path, image, person_boxes, wm_boxes)
+        self._show_cropped_preview(image, person_boxes, wm_boxes, Path(path).name)
+        self._preview_cache_key = self._preview_cache_key_for(path)
+        self._cache_current_preview(self._preview_cache_key)
+
+    def _cache_current_preview(self, key: tuple) -> None:
+        """Cacht die angezeigte Vorschau samt Pfad und Boxen (ohne Vollbild)."""
+        detections = self._preview_detections
+        entry = None
+        if detections is not None and detections[0] == key[0]:
+            path, _image, person_boxes, wm_boxes = detections
+            entry = (path, person_boxes, wm_boxes)
+        self._preview.cache_current(key, self._eta_label.text(), entry)
 
     def closeEvent(self, event) -> None:
         self._save_settings()
         if self._model_loader and self._model_loader.isRunning():
             self._model_loader.wait(3000)
-        if self._preview_thread and self._preview_thread.isRunning():
-            self._preview_thread.wait(2000)
+        self._preview_cancel_event.set()
+        self._cancel_prefetch()
+        self._preview_pool.waitForDone(2000)
         if self._processing_thread and self._processing_thread.isRunning():
             self._processing_thread.cancel()
             self._processing_thread.wait(3000)
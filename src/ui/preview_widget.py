@@ -1,9 +1,26 @@
 """Split-View Vorschau (Vorher/Nachher) mit Detection-Overlay und Navigation."""
 
+import sys
+import threading
+import weakref
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any
+
 import cv2
 import numpy as np
-from PyQt6.QtCore import Qt, QPoint, pyqtSignal
-from PyQt6.QtGui import QImage, QPixmap, QPainter, QPen, QColor, QFont
+from PyQt6 import sip
+from PyQt6.QtCore import Qt, QPoint, QRect, QRectF, QTimer, pyqtSignal
+from PyQt6.QtGui import (
+    QAction,
+    QColor,
+    QFont,
+    QImage,
+    QPainter,
+    QPainterPath,
+    QPen,
+    QPixmap,
+)
 from PyQt6.QtWidgets import (
     QFrame,
     QHBoxLayout,
@@ -13,34 +30,225 @@ from PyQt6.QtWidgets import (
 )
 
 from src.core.cropper import CropRegion
-from src.core.detector import BoundingBox
+from src.core.detector import BoundingBox, BoundingBoxes
+from src.ui._overlay_native import scale_boxes
 from src.ui.widgets import StyledButton
 
 
-def numpy_to_qpixmap(image: np.ndarray, max_size: int = 800) -> QPixmap:
-    """Konvertiert ein BGR NumPy-Array in ein QPixmap."""
-    rgb = cv2.cvtColor(image, cv2.COLOR_BGR2RGB)
-    h, w, ch = rgb.shape
+# Wiederverwendeter Zielpuffer für cv2.resize, einer pro Thread (GUI + Preview-Worker)
+# Reused cv2.resize destination buffer, one per thread (GUI + preview worker)
+_scratch = threading.local()
+
+
+def _scratch_bgr(h: int, w: int) -> np.ndarray:
+    """Liefert eine (h, w, 3)-View auf den Scratch-Puffer dieses Threads."""
+    buf = getattr(_scratch, "buf", None)
+    if buf is None or buf.shape[0] < h or buf.shape[1] < w:
+        old_h, old_w = buf.shape[:2] if buf is not None else (0, 0)
+        buf = np.empty((max(h, old_h), max(w, old_w), 3), dtype=np.uint8)
+        _scratch.buf = buf
+    return buf[:h, :w]
+
+
+def _scaled_bgr(
+    image: np.ndarray, max_size: int, interpolation: int = cv2.INTER_AREA
+) -> tuple[np.ndarray, float]:
+    """Verkleinert auf max_size (längste Kante); gibt (Array, Skalierung) zurück.
+
+    Das verkleinerte Array liegt im Scratch-Puffer des Threads und ist nur bis
+    zum nächsten Aufruf gültig → sofort in ein QImage/QPixmap übernehmen.
+    """
+    h, w = image.shape[:2]
+    if max(h, w) <= max_size:
+        return image, 1.0
+    scale = max_size / max(h, w)
+    new_w, new_h = int(w * scale), int(h * scale)
+    dst = _scratch_bgr(new_h, new_w)
+    return cv2.resize(image, (new_w, new_h), dst=dst, interpolation=interpolation), scale
+
+
+def _packed_rows(image: np.ndarray) -> np.ndarray:
+    """Gibt das Array zurück, wenn die Pixel jeder Zeile dicht liegen, sonst eine Kopie."""
+    if image.strides[1:] == (3, 1):
+        return image
+    return np.ascontiguousarray(image)
+
+
+def _bgr_view(bgr: np.ndarray) -> QImage:
+    """BGR888-QImage direkt auf dem Puffer eines BGR-Arrays (siehe _packed_rows).
+
+    Kopiert nichts: ``bgr`` muss leben, bis das QImage kopiert, konvertiert
+    (convertToFormat) oder per QPixmap.fromImage hochgeladen wurde. Zeilen
+    dürfen einen größeren Stride haben (Views auf Scratch-Puffer/Ausschnitte).
+    """
+    h, w = bgr.shape[:2]
+    return QImage(
+        sip.voidptr(bgr.ctypes.data), w, h, bgr.strides[0], QImage.Format.Format_BGR888
+    )
+
+
+# Format_RGB32 ist 0xffRRGGBB pro uint32 → auf Little-Endian liegen die Bytes als BGRX
+# Format_RGB32 is 0xffRRGGBB per uint32 → little-endian bytes are laid out as BGRX
+_BGRX_IS_RGB32 = sys.byteorder == "little"
+
+
+def _bgr_to_rgb32(bgr: np.ndarray) -> QImage:
+    """Schreibt ein BGR-Array per cv2 direkt in ein eigenes RGB32-QImage (Little-Endian).
+
+    RGB32 ist das native Pixmap-Format der Raster-Engine: fromImage übernimmt
+    es ohne Konvertierung (teilt ggf. den Speicher, daher gehört er dem QImage),
+    drawPixmap nimmt den opaken 32-Bit-Blit.
+    """
+    h, w = bgr.shape[:2]
+    qimage = QImage(w, h, QImage.Format.Format_RGB32)
+    ptr = qimage.bits()
+    ptr.setsize(qimage.sizeInBytes())
+    bgrx = np.ndarray(
+        (h, w, 4), dtype=np.uint8, buffer=ptr, strides=(qimage.bytesPerLine(), 4, 1)
+    )
+    cv2.cvtColor(bgr, cv2.COLOR_BGR2BGRA, dst=bgrx)
+    return qimage
+
+
+def _bgr_to_qimage(
+    image: np.ndarray, image_format: QImage.Format | None = None
+) -> QImage:
+    """Kopiert ein BGR-Array in ein eigenständiges QImage.
+
+    Mit ``image_format`` übernimmt die Formatkonvertierung das Kopieren,
+    sonst wird das BGR888-Bild einmal kopiert.
+    """
+    bgr = _packed_rows(image)
+    view = _bgr_view(bgr)
+    if image_format is None:
+        return view.copy()
+    return view.convertToFormat(image_format)
+
+
+def numpy_to_qimage(
+    image: np.ndarray, max_size: int = 800, interpolation: int = cv2.INTER_AREA
+) -> QImage:
+    """Konvertiert ein BGR NumPy-Array in ein eigenständiges QImage (thread-sicher).
+
+    Erst verkleinern, dann als BGR888 an Qt übergeben: keine Farbkonvertierung
+    auf dem vollaufgelösten Bild. / Downscale first and hand BGR888 to Qt, so no
+    colour pass touches the full-resolution image.
+    """
+    return _bgr_to_qimage(_scaled_bgr(image, max_size, interpolation)[0])
+
+
+def numpy_to_qpixmap(
+    image: np.ndarray, max_size: int = 800, interpolation: int = cv2.INTER_AREA
+) -> QPixmap:
+    """Konvertiert ein BGR NumPy-Array in ein QPixmap.
+
+    QPixmap.fromImage legt eigenen Pixmap-Speicher an; das Array muss nur bis
+    dahin leben, ein vorheriges QImage.copy() ist unnötig. cv2 erweitert auf
+    BGRX (ein SIMD-Durchlauf) statt Qts langsamerer BGR888→RGB32-Konvertierung.
+    """
+    bgr = _scaled_bgr(image, max_size, interpolation)[0]
+    if _BGRX_IS_RGB32:
+        return QPixmap.fromImage(_bgr_to_rgb32(bgr))
+    bgr = _packed_rows(bgr)
+    return QPixmap.fromImage(_bgr_view(bgr))
+
+
+# (id(image), shape, dtype, max_size, interpolation) → (weakref, skaliertes Pixmap)
+# Der weakref stellt sicher, dass eine wiederverwendete id() nicht trifft
+# The weakref guards against a recycled id() of a freed array
+_PIXMAP_CACHE_SIZE = 8
+_pixmap_cache: OrderedDict[tuple, tuple[weakref.ref, QPixmap]] = OrderedDict()
 
-    if max(h, w) > max_size:
-        scale = max_size / max(h, w)
-        new_w, new_h = int(w * scale), int(h * scale)
-        rgb = cv2.resize(rgb, (new_w, new_h), interpolation=cv2.INTER_AREA)
-        h, w = new_h, new_w
 
-    bytes_per_line = ch * w
-    qimage = QImage(rgb.data, w, h, bytes_per_line, QImage.Format.Format_RGB888)
-    return QPixmap.fromImage(qimage.copy())
+def cached_qpixmap(
+    image: np.ndarray, max_size: int = 800, interpolation: int = cv2.INTER_AREA
+) -> QPixmap:
+    """Wie numpy_to_qpixmap, für dasselbe Array (z. B. erneut geöffnete Dialoge) gecacht.
+
+    Nur im GUI-Thread aufrufen (QPixmap).
+    """
+    key = (id(image), image.shape, image.dtype.str, max_size, interpolation)
+    entry = _pixmap_cache.get(key)
+    if entry is not None and entry[0]() is image:
+        _pixmap_cache.move_to_end(key)
+        return entry[1]
+    pixmap = numpy_to_qpixmap(image, max_size=max_size, interpolation=interpolation)
+    _pixmap_cache[key] = (weakref.ref(image), pixmap)
+    _pixmap_cache.move_to_end(key)
+    if len(_pixmap_cache) > _PIXMAP_CACHE_SIZE:
+        _pixmap_cache.popitem(last=False)
+    return pixmap
+
+
+def _scale_boxes(
+    coords: np.ndarray | list[tuple[int, int, int, int]], scale_x: float, scale_y: float
+) -> np.ndarray:
+    """Skaliert (x1, y1, x2, y2)-Koordinaten in einem Schritt auf Pixmap-Größe.
+
+    float64 + Abschneiden entspricht exakt dem bisherigen int(v * scale).
+    """
+    arr = np.array(coords, dtype=np.float64).reshape(-1, 4)
+    return scale_boxes(arr, float(scale_x), float(scale_y))
+
+
+def box_rects(
+    boxes: list[BoundingBox] | None, scale_x: float, scale_y: float
+) -> list[QRect]:
+    """Skaliert Boxen einmal auf Anzeige-Koordinaten (ein QRect pro Box).
+
+    Für Overlays und Hit-Tests wiederverwendbar.
+    """
+    if not boxes:
+        return []
+    scaled = _scale_boxes(BoundingBoxes.from_list(boxes).coords, scale_x, scale_y)
+    return [QRect(x1, y1, x2 - x1, y2 - y1) for x1, y1, x2, y2 in scaled.tolist()]
+
+
+def _make_pen(color: QColor, dashed: bool = False) -> QPen:
+    pen = QPen(color)
+    pen.setWidth(2)
+    if dashed:
+        pen.setStyle(Qt.PenStyle.DashLine)
+    return pen
+
+
+# Overlay-Stifte und -Farben sind konstant → einmal anlegen statt pro Aufruf
+# Overlay pens and colours are constant → build once instead of per call
+_DIM_COLOR = QColor(0, 0, 0, 120)
+_CROP_PEN = _make_pen(QColor(46, 204, 113, 230), dashed=True)
+_CROP_LABEL_PEN = QPen(QColor(46, 204, 113, 255))
+_PERSON_PEN = _make_pen(QColor(168, 85, 247, 200))
+_LABEL_PEN = QPen(QColor(255, 255, 255, 220))
+_WM_PEN = _make_pen(QColor(231, 76, 60, 220), dashed=True)
+_WM_LABEL_PEN = QPen(QColor(231, 76, 60, 255))
+
+# QFont braucht eine QApplication → erst beim ersten Zeichnen erzeugen
+# QFont needs a QApplication → create lazily on first draw
+_OVERLAY_FONT: QFont | None = None
+
+
+def _get_overlay_font() -> QFont:
+    global _OVERLAY_FONT
+    if _OVERLAY_FONT is None:
+        _OVERLAY_FONT = QFont("Lexend", 10, QFont.Weight.Bold)
+    return _OVERLAY_FONT
 
 
 def draw_all_overlays(
-    pixmap: QPixmap,
+    pixmap: QPixmap | QImage,
     image_shape: tuple[int, ...],
     person_boxes: list[BoundingBox] | None = None,
     watermark_boxes: list[BoundingBox] | None = None,
     crop_region: CropRegion | None = None,
-) -> QPixmap:
-    """Zeichnet alle Overlays auf ein QPixmap: Personen, Watermarks, Crop-Region."""
+) -> QPixmap | QImage:
+    """Zeichnet alle Overlays auf ein QPixmap/QImage: Personen, Watermarks, Crop-Region.
+
+    Mit QImage auch außerhalb des GUI-Threads nutzbar. Ohne Boxen und Crop-Region
+    wird die Eingabe unverändert (ohne Kopie) zurückgegeben.
+    """
+    if not person_boxes and not watermark_boxes and crop_region is None:
+        return pixmap
+
     result = pixmap.copy()
     painter = QPainter(result)
     painter.setRenderHint(QPainter.RenderHint.Antialiasing)
@@ -49,87 +257,149 @@ def draw_all_overlays(
     scale_x = result.width() / orig_w
     scale_y = result.height() / orig_h
 
-    font = QFont("Lexend", 10, QFont.Weight.Bold)
-    painter.setFont(font)
+    painter.setFont(_get_overlay_font())
 
     # --- Crop-Region: halbtransparente Abdunklung außerhalb ---
     if crop_region:
-        cx1 = int(crop_region.x1 * scale_x)
-        cy1 = int(crop_region.y1 * scale_y)
-        cx2 = int(crop_region.x2 * scale_x)
-        cy2 = int(crop_region.y2 * scale_y)
-
-        # Dunkle Bereiche außerhalb des Crops
-        dim = QColor(0, 0, 0, 120)
-        painter.fillRect(0, 0, result.width(), cy1, dim)                          # oben
-        painter.fillRect(0, cy2, result.width(), result.height() - cy2, dim)      # unten
-        painter.fillRect(0, cy1, cx1, cy2 - cy1, dim)                             # links
-        painter.fillRect(cx2, cy1, result.width() - cx2, cy2 - cy1, dim)          # rechts
+        cx1, cy1, cx2, cy2 = _scale_boxes(
+            [(crop_region.x1, crop_region.y1, crop_region.x2, crop_region.y2)],
+            scale_x,
+            scale_y,
+        )[0].tolist()
+
+        # Dunkle Bereiche außerhalb des Crops: ein Fill (Bild minus Crop)
+        # Dim outside the crop in one fill (image minus crop)
+        outside = QPainterPath()
+        outside.addRect(QRectF(0, 0, result.width(), result.height()))
+        inside = QPainterPath()
+        inside.addRect(QRectF(cx1, cy1, cx2 - cx1, cy2 - cy1))
+        painter.fillPath(outside.subtracted(inside), _DIM_COLOR)
 
         # Crop-Rahmen (grün, gestrichelt)
-        crop_pen = QPen(QColor(46, 204, 113, 230))
-        crop_pen.setWidth(2)
-        crop_pen.setStyle(Qt.PenStyle.DashLine)
-        painter.setPen(crop_pen)
+        painter.setPen(_CROP_PEN)
         painter.drawRect(cx1, cy1, cx2 - cx1, cy2 - cy1)
 
         # Label
-        painter.setPen(QColor(46, 204, 113, 255))
+        painter.setPen(_CROP_LABEL_PEN)
         crop_w = crop_region.x2 - crop_region.x1
         crop_h = crop_region.y2 - crop_region.y1
         painter.drawText(QPoint(cx1 + 4, cy1 - 6), f"Zuschnitt {crop_w}x{crop_h}")
 
     # --- Person-Boxen (lila) ---
     if person_boxes:
-        pen = QPen(QColor(168, 85, 247, 200))
-        pen.setWidth(2)
-        painter.setPen(pen)
-
-        for box in person_boxes:
-            x1 = int(box.x1 * scale_x)
-            y1 = int(box.y1 * scale_y)
-            x2 = int(box.x2 * scale_x)
-            y2 = int(box.y2 * scale_y)
-            painter.drawRect(x1, y1, x2 - x1, y2 - y1)
-
-            painter.setPen(QColor(255, 255, 255, 220))
-            painter.drawText(QPoint(x1 + 4, y1 - 6), f"Person {box.confidence:.0%}")
-            painter.setPen(pen)
+        rects = box_rects(person_boxes, scale_x, scale_y)
+        # Erst alle Rahmen, dann alle Labels: ein Pen-Wechsel pro Liste
+        # All rects first, then all labels: one pen switch per list
+        painter.setPen(_PERSON_PEN)
+        for rect in rects:
+            painter.drawRect(rect)
+        painter.setPen(_LABEL_PEN)
+        for rect, box in zip(rects, person_boxes):
+            painter.drawText(QPoint(rect.x() + 4, rect.y() - 6), f"Person {box.confidence:.0%}")
 
     # --- Watermark-Boxen (rot, gestrichelt) ---
     if watermark_boxes:
-        pen = QPen(QColor(231, 76, 60, 220))
-        pen.setWidth(2)
-        pen.setStyle(Qt.PenStyle.DashLine)
-        painter.setPen(pen)
-
-        for box in watermark_boxes:
-            x1 = int(box.x1 * scale_x)
-            y1 = int(box.y1 * scale_y)
-            x2 = int(box.x2 * scale_x)
-            y2 = int(box.y2 * scale_y)
-            painter.drawRect(x1, y1, x2 - x1, y2 - y1)
-
-            painter.setPen(QColor(231, 76, 60, 255))
-            painter.drawText(QPoint(x1 + 4, y1 - 6), f"Watermark {box.confidence:.0%}")
-            painter.setPen(pen)
+        rects = box_rects(watermark_boxes, scale_x, scale_y)
+        painter.setPen(_WM_PEN)
+        for rect in rects:
+            painter.drawRect(rect)
+        painter.setPen(_WM_LABEL_PEN)
+        for rect, box in zip(rects, watermark_boxes):
+            painter.drawText(QPoint(rect.x() + 4, rect.y() - 6), f"Watermark {box.confidence:.0%}")
 
     painter.end()
     return result
 
 
+_PREVIEW_FORMAT = QImage.Format.Format_RGB32
+
+
+@dataclass
+class RenderedPreview:
+    """Fertig skalierte Vorher/Nachher-Bilder inkl. Overlays."""
+
+    before: QImage
+    after: QImage | None
+    original_shape: tuple[int, ...]
+    cropped_shape: tuple[int, ...] | None = None
+
+
+def render_preview(
+    original: np.ndarray,
+    cropped: np.ndarray | None,
+    boxes: list[BoundingBox] | None,
+    watermark_boxes: list[BoundingBox] | None,
+    crop_region: CropRegion | None,
+    max_size: int,
+    interpolation: int = cv2.INTER_AREA,
+) -> RenderedPreview:
+    """Skaliert und zeichnet die Vorschau als QImages (auch im Worker-Thread nutzbar).
+
+    RGB32 entspricht dem Pixmap-Format: QPainter zeichnet identisch zum
+    QPixmap-Pfad und QPixmap.fromImage muss im GUI-Thread nichts konvertieren.
+
+    Hat der Zuschnitt dieselbe längste Kante wie das Original (z.B. nur unten
+    ein Wasserzeichen-Streifen entfernt), ist die Skalierung identisch und das
+    Nachher-Bild wird aus dem bereits verkleinerten Original geschnitten.
+    """
+    scaled, scale = _scaled_bgr(original, max_size, interpolation)
+    before = _bgr_to_qimage(scaled, _PREVIEW_FORMAT)
+    if boxes or watermark_boxes or crop_region is not None:
+        before = draw_all_overlays(
+            before,
+            original.shape,
+            person_boxes=boxes,
+            watermark_boxes=watermark_boxes,
+            crop_region=crop_region,
+        )
+    after = None
+    cropped_shape = None
+    if cropped is not None:
+        if crop_region is not None and max(cropped.shape[:2]) == max(original.shape[:2]):
+            sy1, sy2 = int(crop_region.y1 * scale), int(crop_region.y2 * scale)
+            sx1, sx2 = int(crop_region.x1 * scale), int(crop_region.x2 * scale)
+            after_bgr = scaled[sy1:sy2, sx1:sx2]
+        else:
+            after_bgr = _scaled_bgr(cropped, max_size, interpolation)[0]
+        after = _bgr_to_qimage(after_bgr, _PREVIEW_FORMAT)
+        cropped_shape = cropped.shape
+    return RenderedPreview(before, after, original.shape, cropped_shape)
+
+
 class PreviewWidget(QWidget):
     """Vorher/Nachher Preview-Widget mit Detection-Overlay und Bild-Navigation."""
 
     # Signal: User will Bild X sehen (index)
     preview_requested = pyqtSignal(int)
 
+    # Max. Anzahl gecachter Vorschauen (je zwei Pixmaps)
+    PIXMAP_CACHE_SIZE = 32
+    # Verzögerung bis zum hochwertigen Neu-Rendern nach einer schnellen Vorschau
+    REFINE_DELAY_MS = 150
+
     def __init__(self, parent=None):
         super().__init__(parent)
         self._current_index = 0
         self._total_images = 0
         self._original_image = None
         self._original_shape = None
+        # Schlüssel (vom Aufrufer) → (vorher, nachher, Labeltexte, Status)
+        # Caller-supplied key → displayed pixmaps, label texts and status text
+        self._pixmap_cache: OrderedDict[
+            tuple, tuple[QPixmap, QPixmap | None, str, str, str, str]
+        ] = OrderedDict()
+        # Schnell (INTER_NEAREST) anzeigen, nach kurzer Ruhe mit INTER_AREA verfeinern
+        # Show fast (INTER_NEAREST) first, refine with INTER_AREA once idle
+        self._refine_args: tuple | None = None
+        self._refine_timer = QTimer(self)
+        self._refine_timer.setSingleShot(True)
+        self._refine_timer.timeout.connect(self._refine_preview)
+        # Navigations-Actions, damit das Hauptfenster Shortcuts daran binden kann
+        # Navigation actions so the main window can bind shortcuts to them
+        self.prev_action = QAction("Vorheriges Bild", self)
+        self.prev_action.triggered.connect(self._go_prev)
+        self.next_action = QAction("Nächstes Bild", self)
+        self.next_action.triggered.connect(self._go_next)
         self._setup_ui()
 
     def _setup_ui(self) -> None:
@@ -273,27 +543,82 @@ class PreviewWidget(QWidget):
         watermark_boxes: list[BoundingBox] | None = None,
         crop_region: CropRegion | None = None,
     ) -> None:
-        """Setzt das Vorher/Nachher-Preview mit allen Overlays."""
+        """Setzt das Vorher/Nachher-Preview mit allen Overlays.
+
+        Rendert zuerst schnell (Nearest-Neighbour) und plant ein hochwertiges
+        Neu-Rendern nach REFINE_DELAY_MS; schnelle Folgeaufrufe (Batch-Vorschau)
+        verschieben es nur.
+        """
+        rendered = render_preview(
+            original, cropped, boxes, watermark_boxes, crop_region,
+            max_size=self.preview_max_size(),
+            interpolation=cv2.INTER_NEAREST,
+        )
+        self.set_rendered_preview(rendered, original, boxes, filename, watermark_boxes)
+        self._refine_args = (
+            original, cropped, boxes, filename, watermark_boxes, crop_region
+        )
+        self._refine_timer.start(self.REFINE_DELAY_MS)
+
+    def _refine_preview(self) -> None:
+        """Rendert die zuletzt schnell gezeigte Vorschau mit INTER_AREA neu."""
+        args = self._refine_args
+        if args is None:
+            return
+        original, cropped, boxes, filename, watermark_boxes, crop_region = args
+        fast_before = self._before_image.pixmap()
+        rendered = render_preview(
+            original, cropped, boxes, watermark_boxes, crop_region,
+            max_size=self.preview_max_size(),
+        )
+        self.set_rendered_preview(rendered, original, boxes, filename, watermark_boxes)
+
+        # Gecachte Schnell-Version dieser Vorschau ersetzen
+        # Replace a cached fast version of this preview
+        if fast_before is None:
+            return
+        fast_key = fast_before.cacheKey()
+        for key, entry in self._pixmap_cache.items():
+            if entry[0].cacheKey() == fast_key:
+                after = self._after_image.pixmap()
+                self._pixmap_cache[key] = (
+                    self._before_image.pixmap(),
+                    after if after is not None and not after.isNull() else None,
+                    *entry[2:],
+                )
+                break
+
+    def _cancel_refine(self) -> None:
+        self._refine_timer.stop()
+        self._refine_args = None
+
+    def preview_max_size(self) -> int:
+        """Zielgröße (längste Kante) für Vorschaubilder."""
+        return max(200, self._before_image.width() - 20)
+
+    def set_rendered_preview(
+        self,
+        rendered: RenderedPreview,
+        original: np.ndarray | None = None,
+        boxes: list[BoundingBox] | None = None,
+        filename: str = "",
+        watermark_boxes: list[BoundingBox] | None = None,
+    ) -> None:
+        """Zeigt bereits gerenderte Vorschaubilder an (nur noch QPixmap-Upload)."""
+        self._cancel_refine()
         self._original_image = original
-        self._original_shape = original.shape
+        self._original_shape = rendered.original_shape
 
         if filename:
             self._info.setText(filename)
 
         # Original mit allen Overlays
-        max_w = max(200, self._before_image.width() - 20)
-        orig_pixmap = numpy_to_qpixmap(original, max_size=max_w)
-        orig_pixmap = draw_all_overlays(
-            orig_pixmap, original.shape,
-            person_boxes=boxes,
-            watermark_boxes=watermark_boxes,
-            crop_region=crop_region,
-        )
-        self._before_image.setPixmap(orig_pixmap)
+        self._before_image.setPixmap(QPixmap.fromImage(rendered.before))
         self._before_image.setText("")
 
         # Info-Label
-        parts = [f"Original ({original.shape[1]}x{original.shape[0]})"]
+        orig_h, orig_w = rendered.original_shape[:2]
+        parts = [f"Original ({orig_w}x{orig_h})"]
         if boxes:
             parts.append(f"{len(boxes)} Person(en)")
         if watermark_boxes:
@@ -301,19 +626,72 @@ class PreviewWidget(QWidget):
         self._before_label.setText(" | ".join(parts))
 
         # Cropped
-        if cropped is not None:
-            crop_pixmap = numpy_to_qpixmap(cropped, max_size=max_w)
-            self._after_image.setPixmap(crop_pixmap)
+        if rendered.after is not None and rendered.cropped_shape is not None:
+            self._after_image.setPixmap(QPixmap.fromImage(rendered.after))
             self._after_image.setText("")
-            self._after_label.setText(
-                f"Zugeschnitten ({cropped.shape[1]}x{cropped.shape[0]})"
-            )
+            crop_h, crop_w = rendered.cropped_shape[:2]
+            self._after_label.setText(f"Zugeschnitten ({crop_w}x{crop_h})")
         else:
             self._after_image.setText("Keine Person erkannt")
             self._after_image.setPixmap(QPixmap())
             self._after_label.setText("Zugeschnitten")
 
+    def cache_current(self, key: tuple, status: str = "", detections: Any = None) -> None:
+        """Merkt sich die aktuell angezeigte Vorschau unter ``key``.
+
+        ``detections`` wird unverändert mitgespeichert und von show_cached
+        zurückgegeben (z.B. Pfad und Boxen für spätere Slider-Änderungen).
+        """
+        before = self._before_image.pixmap()
+        if before is None or before.isNull():
+            return
+        after = self._after_image.pixmap()
+        self._pixmap_cache[key] = (
+            before,
+            after if after is not None and not after.isNull() else None,
+            self._before_label.text(),
+            self._after_label.text(),
+            self._info.text(),
+            status,
+            detections,
+        )
+        self._pixmap_cache.move_to_end(key)
+        if len(self._pixmap_cache) > self.PIXMAP_CACHE_SIZE:
+            self._pixmap_cache.popitem(last=False)
+
+    def is_cached(self, key: tuple) -> bool:
+        return key in self._pixmap_cache
+
+    def show_cached(self, key: tuple) -> tuple[str, Any] | None:
+        """Zeigt eine gecachte Vorschau an; gibt (Status-Text, Detections) zurück oder None."""
+        entry = self._pixmap_cache.get(key)
+        if entry is None:
+            return None
+        self._pixmap_cache.move_to_end(key)
+        self._cancel_refine()
+        before, after, before_text, after_text, info_text, status, detections = entry
+        self._before_image.setPixmap(before)
+        self._before_image.setText("")
+        self._before_label.setText(before_text)
+        if after is not None:
+            self._after_image.setPixmap(after)
+            self._after_image.setText("")
+        else:
+            self._after_image.setText("Keine Person erkannt")
+            self._after_image.setPixmap(QPixmap())
+        self._after_label.setText(after_text)
+        self._info.setText(info_text)
+        # Array ist nicht gecacht / the source array is not cached
+        self._original_image = None
+        return status, detections
+
+    def invalidate_cache(self) -> None:
+        """Verwirft alle gecachten Vorschauen (z.B. nach Änderung der Einstellungen)."""
+        self._pixmap_cache.clear()
+
     def clear(self) -> None:
+        self._cancel_refine()
+        self.invalidate_cache()
         self._show_placeholder()
         self._info.setText("")
         self._original_image = None
@@ -9,15 +9,17 @@ from dataclasses import dataclass, field
 
 import cv2
 import numpy as np
-from PyQt6.QtCore import Qt, pyqtSignal
+from PyQt6.QtCore import QPoint, QRect, QSize, Qt, QTimer, pyqtSignal
 from PyQt6.QtGui import (
     QColor,
     QFont,
-    QImage,
+    QFontMetrics,
     QMouseEvent,
     QPainter,
     QPen,
     QPixmap,
+    QStaticText,
+    QTransform,
 )
 from PyQt6.QtWidgets import (
     QCheckBox,
@@ -34,6 +36,7 @@ from PyQt6.QtWidgets import (
 )
 
 from src.core.detector import BoundingBox
+from src.ui.preview_widget import box_rects, cached_qpixmap
 
 
 @dataclass
@@ -41,6 +44,7 @@ class SelectionResult:
     """Ergebnis der Benutzer-Auswahl im Dialog.
 
     Result of user selection in the detection dialog.
+    Die Box-Listen werden nur gelesen und dürfen die Eingabelisten teilen.
     """
 
     selected_persons: list[BoundingBox] = field(default_factory=list)
@@ -57,20 +61,194 @@ PERSON_COLOR_DIM = QColor(168, 85, 247, 60)  # halbtransparent / dimmed
 WM_COLOR = QColor(231, 76, 60, 220)          # rot / red
 WM_COLOR_DIM = QColor(231, 76, 60, 60)       # halbtransparent / dimmed
 SELECTED_BG = QColor(168, 85, 247, 30)       # Checkbox-Hintergrund / bg
+LABEL_COLOR = QColor(255, 255, 255, 230)     # Label-Text / label text
+LABEL_COLOR_DIM = QColor(255, 255, 255, 80)
+LABEL_BG = QColor(0, 0, 0, 160)              # Label-Hintergrund / label bg
+LABEL_BG_DIM = QColor(0, 0, 0, 60)
+
+# Einmal beim Import gebaut, für alle Dialoge geteilt
+# Built once at import time and shared by every dialog
+_DIALOG_STYLESHEET = """
+QDialog {
+    background-color: #0f0f1e;
+}
+QLabel {
+    color: #c0c0e0;
+    font-family: 'Lexend', 'Segoe UI', sans-serif;
+    font-size: 13px;
+}
+QLabel#dialog-title {
+    font-size: 16px;
+    font-weight: 700;
+    color: #ffffff;
+}
+QLabel#dialog-subtitle {
+    font-size: 12px;
+    color: #8888aa;
+}
+QCheckBox {
+    color: #e0e0e0;
+    font-family: 'Lexend', 'Segoe UI', sans-serif;
+    font-size: 13px;
+    spacing: 8px;
+    padding: 6px 8px;
+    border-radius: 6px;
+}
+QCheckBox:hover {
+    background: rgba(168, 85, 247, 0.1);
+}
+QCheckBox::indicator {
+    width: 20px; height: 20px;
+    border-radius: 4px;
+    border: 2px solid rgba(255, 255, 255, 0.2);
+    background: rgba(20, 20, 40, 0.8);
+}
+QCheckBox::indicator:checked {
+    background: qlineargradient(x1:0, y1:0, x2:1, y2:1,
+        stop:0 #6c5ce7, stop:1 #a855f7);
+    border: 2px solid #6c5ce7;
+}
+QPushButton {
+    font-family: 'Lexend', 'Segoe UI', sans-serif;
+    font-size: 13px;
+    font-weight: 600;
+    border: none;
+    border-radius: 8px;
+    padding: 10px 20px;
+    color: white;
+    min-height: 20px;
+}
+QPushButton#primary {
+    background: qlineargradient(x1:0, y1:0, x2:1, y2:1,
+        stop:0 #6c5ce7, stop:1 #a855f7);
+}
+QPushButton#primary:hover {
+    background: qlineargradient(x1:0, y1:0, x2:1, y2:1,
+        stop:0 #7c6cf7, stop:1 #b865ff);
+}
+QPushButton#secondary {
+    background: rgba(60, 60, 90, 0.6);
+    border: 1px solid rgba(255, 255, 255, 0.1);
+}
+QPushButton#secondary:hover {
+    background: rgba(80, 80, 110, 0.7);
+}
+QPushButton#skip {
+    background: rgba(231, 76, 60, 0.3);
+    border: 1px solid rgba(231, 76, 60, 0.4);
+}
+QPushButton#skip:hover {
+    background: rgba(231, 76, 60, 0.5);
+}
+QGroupBox {
+    background-color: rgba(30, 30, 55, 0.6);
+    border: 1px solid rgba(255, 255, 255, 0.08);
+    border-radius: 12px;
+    padding: 16px;
+    padding-top: 28px;
+    margin-top: 8px;
+    font-family: 'Lexend', 'Segoe UI', sans-serif;
+    font-size: 13px;
+    font-weight: 600;
+    color: #b0b0d0;
+}
+QGroupBox::title {
+    subcontrol-origin: margin;
+    subcontrol-position: top left;
+    padding: 4px 12px;
+}
+QComboBox {
+    background: rgba(20, 20, 40, 0.8);
+    border: 1px solid rgba(255, 255, 255, 0.1);
+    border-radius: 8px;
+    padding: 8px 12px;
+    color: #e0e0e0;
+    font-size: 13px;
+    min-width: 100px;
+}
+QComboBox QAbstractItemView {
+    background: #1a1a2e;
+    border: 1px solid rgba(255, 255, 255, 0.1);
+    selection-background-color: #6c5ce7;
+    color: #e0e0e0;
+}
+QScrollArea { border: none; background: transparent; }
+"""
+
+
+def _box_pen(color: QColor, width: int, dashed: bool = False) -> QPen:
+    pen = QPen(color)
+    pen.setWidth(width)
+    if dashed:
+        pen.setStyle(Qt.PenStyle.DashLine)
+    return pen
+
+
+# Unter halber Größe braucht es INTER_AREA gegen Aliasing, darüber reicht INTER_LINEAR
+# Below half size INTER_AREA avoids aliasing, above it INTER_LINEAR is enough
+_AREA_BELOW_SCALE = 0.5
+
 
+def _thumbnail_interpolation(image: np.ndarray, max_size: int) -> int:
+    """Interpolation passend zum Verkleinerungsfaktor des Dialog-Bilds."""
+    scale = max_size / max(image.shape[:2])
+    return cv2.INTER_AREA if scale < _AREA_BELOW_SCALE else cv2.INTER_LINEAR
 
-def _numpy_to_qpixmap(image: np.ndarray, max_size: int = 700) -> QPixmap:
-    """BGR NumPy → QPixmap (skaliert). / BGR NumPy → QPixmap (scaled)."""
-    rgb = cv2.cvtColor(image, cv2.COLOR_BGR2RGB)
-    h, w, ch = rgb.shape
-    if max(h, w) > max_size:
-        scale = max_size / max(h, w)
-        new_w, new_h = int(w * scale), int(h * scale)
-        rgb = cv2.resize(rgb, (new_w, new_h), interpolation=cv2.INTER_AREA)
-        h, w = new_h, new_w
-    bytes_per_line = ch * w
-    qimage = QImage(rgb.data, w, h, bytes_per_line, QImage.Format.Format_RGB888)
-    return QPixmap.fromImage(qimage.copy())
+
+def _rects_to_xyxy(rects: list[QRect]) -> np.ndarray:
+    """(N, 4) int32-Array (x1, y1, x2, y2) für vektorisierte Hit-Tests."""
+    return np.array(
+        [(r.x(), r.y(), r.x() + r.width(), r.y() + r.height()) for r in rects],
+        dtype=np.int32,
+    ).reshape(-1, 4)
+
+
+def _last_hit(xyxy: np.ndarray, mx: float, my: float) -> int | None:
+    """Index der obersten (letzten) Box, die (mx, my) enthält, sonst None."""
+    hits = (
+        (xyxy[:, 0] <= mx) & (mx <= xyxy[:, 2]) & (xyxy[:, 1] <= my) & (my <= xyxy[:, 3])
+    )
+    indices = np.flatnonzero(hits)
+    return int(indices[-1]) if indices.size else None
+
+
+class _HitGrid:
+    """Gleichmäßiges Raster über dem Pixmap: Zelle → Indizes überlappender Boxen.
+
+    Ein Klick prüft nur die Boxen seiner Zelle statt aller Boxen. Die Indizes
+    bleiben aufsteigend sortiert, damit die zuletzt gezeichnete Box gewinnt.
+    """
+
+    CELLS = 16
+
+    def __init__(self, xyxy: np.ndarray, width: int, height: int):
+        self._xyxy = xyxy
+        self._cell_w = max(width, 1) / self.CELLS
+        self._cell_h = max(height, 1) / self.CELLS
+        cells: list[list[int]] = [[] for _ in range(self.CELLS * self.CELLS)]
+        for i, (x1, y1, x2, y2) in enumerate(xyxy.tolist()):
+            cx1, cy1 = self._cell(x1, y1)
+            cx2, cy2 = self._cell(x2, y2)
+            for cy in range(cy1, cy2 + 1):
+                row = cy * self.CELLS
+                for cx in range(cx1, cx2 + 1):
+                    cells[row + cx].append(i)
+        self._cells = [np.array(c, dtype=np.intp) for c in cells]
+
+    def _cell(self, x: float, y: float) -> tuple[int, int]:
+        last = self.CELLS - 1
+        cx = min(max(int(x / self._cell_w), 0), last)
+        cy = min(max(int(y / self._cell_h), 0), last)
+        return cx, cy
+
+    def hit(self, mx: float, my: float) -> int | None:
+        """Index der obersten Box unter (mx, my), sonst None."""
+        cx, cy = self._cell(mx, my)
+        candidates = self._cells[cy * self.CELLS + cx]
+        if not candidates.size:
+            return None
+        i = _last_hit(self._xyxy[candidates], mx, my)
+        return int(candidates[i]) if i is not None else None
 
 
 class InteractiveDetectionWidget(QWidget):
@@ -91,6 +269,36 @@ class InteractiveDetectionWidget(QWidget):
         self._wm_boxes: list[BoundingBox] = []
         self._person_selected: list[bool] = []
         self._wm_selected: list[bool] = []
+        # Boxen in Pixmap-Koordinaten, einmal pro Bild berechnet (Zeichnen + Klicks)
+        # Boxes in pixmap coordinates, computed once per image (painting + clicks)
+        self._person_rects: list[QRect] = []
+        self._wm_rects: list[QRect] = []
+        self._person_grid: _HitGrid | None = None
+        self._wm_grid: _HitGrid | None = None
+        # Stifte und Schrift einmal anlegen statt pro paintEvent
+        # Build pens and font once instead of per paintEvent
+        self._font = QFont("Lexend", 11, QFont.Weight.Bold)
+        self._font_metrics = QFontMetrics(self._font)
+        # Labels ändern sich nur in set_data → Layout + Maße vorberechnen
+        # Labels only change in set_data → precompute layout + metrics
+        # (Text, Hintergrund-Rechteck, Textposition) je Box
+        # (text, background rect, text position) per box
+        self._person_labels: list[tuple[QStaticText, QRect, QPoint]] = []
+        self._wm_labels: list[tuple[QStaticText, QRect, QPoint]] = []
+        # Box + Label + Stiftbreite: Bereich für gezielte update(rect)-Aufrufe
+        # Box + label + pen width: region for targeted update(rect) calls
+        self._person_areas: list[QRect] = []
+        self._wm_areas: list[QRect] = []
+        # Gesammelter Neuzeichnen-Bereich, einmal pro Event-Loop-Durchlauf geleert
+        # Accumulated dirty region, flushed once per event-loop pass
+        self._dirty_rect = QRect()
+        self._update_pending = False
+        self._pen_person_on = _box_pen(PERSON_COLOR, 3)
+        self._pen_person_off = _box_pen(PERSON_COLOR_DIM, 1)
+        self._pen_wm_on = _box_pen(WM_COLOR, 3, dashed=True)
+        self._pen_wm_off = _box_pen(WM_COLOR_DIM, 1, dashed=True)
+        self._pen_label_on = QPen(LABEL_COLOR)
+        self._pen_label_off = QPen(LABEL_COLOR_DIM)
         self.setMinimumSize(400, 300)
         self.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Expanding)
         self.setCursor(Qt.CursorShape.PointingHandCursor)
@@ -108,19 +316,94 @@ class InteractiveDetectionWidget(QWidget):
         self._wm_selected = [True] * len(wm_boxes)
 
         max_size = min(700, self.width() - 20) if self.width() > 220 else 700
-        self._pixmap = _numpy_to_qpixmap(image, max_size=max_size)
+        self._pixmap = cached_qpixmap(
+            image, max_size, _thumbnail_interpolation(image, max_size)
+        )
+        sx = self._pixmap.width() / image.shape[1]
+        sy = self._pixmap.height() / image.shape[0]
+        self._person_rects = box_rects(person_boxes, sx, sy)
+        self._wm_rects = box_rects(wm_boxes, sx, sy)
+        pw, ph = self._pixmap.width(), self._pixmap.height()
+        self._person_grid = _HitGrid(_rects_to_xyxy(self._person_rects), pw, ph)
+        self._wm_grid = _HitGrid(_rects_to_xyxy(self._wm_rects), pw, ph)
+        self._person_labels = self._make_labels("P", person_boxes, self._person_rects)
+        self._wm_labels = self._make_labels("W", wm_boxes, self._wm_rects)
+        self._person_areas = self._paint_areas(self._person_rects, self._person_labels)
+        self._wm_areas = self._paint_areas(self._wm_rects, self._wm_labels)
         self.setMinimumSize(self._pixmap.width(), self._pixmap.height())
         self.update()
 
+    def pixmap_size(self) -> QSize:
+        """Größe des angezeigten Bilds (leer ohne Daten)."""
+        return self._pixmap.size() if self._pixmap is not None else QSize()
+
+    def _make_labels(
+        self, prefix: str, boxes: list[BoundingBox], rects: list[QRect]
+    ) -> list[tuple[QStaticText, QRect, QPoint]]:
+        """Nummer + Konfidenz je Box als QStaticText samt Hintergrund und Position.
+
+        Label sitzt über der Box, am oberen Bildrand innerhalb. drawStaticText
+        positioniert oben links, daher Grundlinie minus Ascent.
+        """
+        fm = self._font_metrics
+        ascent = fm.ascent()
+        labels = []
+        for i, (box, rect) in enumerate(zip(boxes, rects)):
+            text = f"{prefix}{i + 1} {box.confidence:.0%}"
+            static = QStaticText(text)
+            static.setTextFormat(Qt.TextFormat.PlainText)
+            static.prepare(QTransform(), self._font)
+            text_rect = fm.boundingRect(text)
+            # Personen-Labels richten sich nach der Texthöhe, Watermarks nach der Zeilenhöhe
+            # Person labels follow the text height, watermarks the line height
+            label_h = text_rect.height() if prefix == "P" else fm.height()
+            bg_y = rect.y() - 4 - label_h
+            if bg_y < 0:
+                bg_y = rect.y() + 4
+            bg_rect = QRect(
+                rect.x() + 2, bg_y, text_rect.width() + 8, text_rect.height() + 4
+            )
+            text_pos = QPoint(rect.x() + 6, bg_y + text_rect.height() - ascent)
+            labels.append((static, bg_rect, text_pos))
+        return labels
+
+    @staticmethod
+    def _paint_areas(
+        rects: list[QRect], labels: list[tuple[QStaticText, QRect, QPoint]]
+    ) -> list[QRect]:
+        # 3 px Stift + Antialiasing / 3 px pen + antialiasing
+        return [
+            rect.united(bg_rect).adjusted(-3, -3, 3, 3)
+            for rect, (_static, bg_rect, _pos) in zip(rects, labels)
+        ]
+
     def set_person_selected(self, index: int, selected: bool) -> None:
-        if 0 <= index < len(self._person_selected):
+        # Unverändert (z. B. Rückmeldung der Checkbox nach Klick) → kein Neuzeichnen
+        # Unchanged (e.g. checkbox echo after a click) → no repaint
+        if 0 <= index < len(self._person_selected) and self._person_selected[index] != selected:
             self._person_selected[index] = selected
-            self.update()
+            self._schedule_update(self._person_areas[index])
 
     def set_wm_selected(self, index: int, selected: bool) -> None:
-        if 0 <= index < len(self._wm_selected):
+        if 0 <= index < len(self._wm_selected) and self._wm_selected[index] != selected:
             self._wm_selected[index] = selected
-            self.update()
+            self._schedule_update(self._wm_areas[index])
+
+    def _schedule_update(self, area: QRect) -> None:
+        """Sammelt Bereiche; viele Umschaltungen ergeben ein update()."""
+        # Unsichtbar: show() zeichnet ohnehin komplett / hidden: show() repaints fully
+        if not self.isVisible():
+            return
+        self._dirty_rect = self._dirty_rect.united(area)
+        if not self._update_pending:
+            self._update_pending = True
+            QTimer.singleShot(0, self._flush_update)
+
+    def _flush_update(self) -> None:
+        self._update_pending = False
+        dirty, self._dirty_rect = self._dirty_rect, QRect()
+        if not dirty.isNull():
+            self.update(dirty)
 
     def paintEvent(self, event) -> None:
         if self._pixmap is None:
@@ -128,69 +411,71 @@ class InteractiveDetectionWidget(QWidget):
         painter = QPainter(self)
         painter.setRenderHint(QPainter.RenderHint.Antialiasing)
         painter.drawPixmap(0, 0, self._pixmap)
-
-        orig_h, orig_w = self._image_shape[:2]
-        sx = self._pixmap.width() / orig_w
-        sy = self._pixmap.height() / orig_h
-        font = QFont("Lexend", 11, QFont.Weight.Bold)
-        painter.setFont(font)
-
-        # Personen zeichnen / Draw person boxes
-        for i, box in enumerate(self._person_boxes):
-            selected = self._person_selected[i]
-            color = PERSON_COLOR if selected else PERSON_COLOR_DIM
-            pen = QPen(color)
-            pen.setWidth(3 if selected else 1)
-            painter.setPen(pen)
-            x1, y1 = int(box.x1 * sx), int(box.y1 * sy)
-            x2, y2 = int(box.x2 * sx), int(box.y2 * sy)
-            painter.drawRect(x1, y1, x2 - x1, y2 - y1)
-
-            # Nummer + Konfidenz / Number + confidence
-            label = f"P{i + 1} {box.confidence:.0%}"
-            painter.setPen(QColor(255, 255, 255, 230 if selected else 80))
-            bg_rect = painter.fontMetrics().boundingRect(label)
-            bg_rect.moveTopLeft(painter.fontMetrics().boundingRect(label).topLeft())
-            bg_x = x1 + 4
-            bg_y = y1 - 4 - bg_rect.height()
-            if bg_y < 0:
-                bg_y = y1 + 4
-            painter.fillRect(
-                bg_x - 2, bg_y, bg_rect.width() + 8, bg_rect.height() + 4,
-                QColor(0, 0, 0, 160 if selected else 60),
-            )
-            painter.drawText(bg_x + 2, bg_y + bg_rect.height(), label)
-
+        painter.setFont(self._font)
+        # Nur Boxen im neu zu zeichnenden Bereich / only boxes in the dirty region
+        dirty = event.rect() if event is not None else self.rect()
+
+        # Personen zeichnen: Rahmen je Zustand gesammelt, dann Labels
+        # Draw person boxes: rects batched per state, then labels
+        self._draw_boxes(
+            painter, dirty, self._person_rects, self._person_selected,
+            self._person_labels, self._person_areas,
+            self._pen_person_on, self._pen_person_off,
+        )
         # Watermarks zeichnen / Draw watermark boxes
-        for i, box in enumerate(self._wm_boxes):
-            selected = self._wm_selected[i]
-            color = WM_COLOR if selected else WM_COLOR_DIM
-            pen = QPen(color)
-            pen.setWidth(3 if selected else 1)
-            pen.setStyle(Qt.PenStyle.DashLine)
-            painter.setPen(pen)
-            x1, y1 = int(box.x1 * sx), int(box.y1 * sy)
-            x2, y2 = int(box.x2 * sx), int(box.y2 * sy)
-            painter.drawRect(x1, y1, x2 - x1, y2 - y1)
-
-            label = f"W{i + 1} {box.confidence:.0%}"
-            painter.setPen(QColor(255, 255, 255, 230 if selected else 80))
-            bg_y = y1 - 4 - painter.fontMetrics().height()
-            if bg_y < 0:
-                bg_y = y1 + 4
-            fm_rect = painter.fontMetrics().boundingRect(label)
-            painter.fillRect(
-                x1 + 2, bg_y, fm_rect.width() + 8, fm_rect.height() + 4,
-                QColor(0, 0, 0, 160 if selected else 60),
-            )
-            painter.drawText(x1 + 6, bg_y + fm_rect.height(), label)
-
+        self._draw_boxes(
+            painter, dirty, self._wm_rects, self._wm_selected,
+            self._wm_labels, self._wm_areas,
+            self._pen_wm_on, self._pen_wm_off,
+        )
         painter.end()
 
+    def _draw_boxes(
+        self,
+        painter: QPainter,
+        dirty: QRect,
+        rects: list[QRect],
+        selected: list[bool],
+        labels: list[tuple[QStaticText, QRect, QPoint]],
+        areas: list[QRect],
+        pen_on: QPen,
+        pen_off: QPen,
+    ) -> None:
+        visible = [i for i, area in enumerate(areas) if area.intersects(dirty)]
+        self._draw_rects(
+            painter, [rects[i] for i in visible], [selected[i] for i in visible],
+            pen_on, pen_off,
+        )
+        for i in visible:
+            static, bg_rect, text_pos = labels[i]
+            painter.fillRect(bg_rect, LABEL_BG if selected[i] else LABEL_BG_DIM)
+            painter.setPen(self._pen_label_on if selected[i] else self._pen_label_off)
+            painter.drawStaticText(text_pos, static)
+
+    @staticmethod
+    def _draw_rects(
+        painter: QPainter,
+        rects: list[QRect],
+        selected: list[bool],
+        pen_on: QPen,
+        pen_off: QPen,
+    ) -> None:
+        """Zeichnet ausgewählte und abgewählte Rahmen mit je einem drawRects-Aufruf."""
+        on = [rect for rect, sel in zip(rects, selected) if sel]
+        off = [rect for rect, sel in zip(rects, selected) if not sel]
+        if off:
+            painter.setPen(pen_off)
+            painter.drawRects(off)
+        if on:
+            painter.setPen(pen_on)
+            painter.drawRects(on)
+
     def mousePressEvent(self, event: QMouseEvent | None) -> None:
         if (
             event is None
             or self._pixmap is None
+            or self._person_grid is None
+            or self._wm_grid is None
             or event.button() != Qt.MouseButton.LeftButton
         ):
             return
@@ -198,32 +483,21 @@ class InteractiveDetectionWidget(QWidget):
         pos = event.position()
         mx, my = pos.x(), pos.y()
 
-        orig_h, orig_w = self._image_shape[:2]
-        sx = self._pixmap.width() / orig_w
-        sy = self._pixmap.height() / orig_h
-
-        # Prüfe Personen-Boxen (umgekehrt: obere zuerst)
-        # Check person boxes (reverse: front-most first)
-        for i in range(len(self._person_boxes) - 1, -1, -1):
-            box = self._person_boxes[i]
-            x1, y1 = int(box.x1 * sx), int(box.y1 * sy)
-            x2, y2 = int(box.x2 * sx), int(box.y2 * sy)
-            if x1 <= mx <= x2 and y1 <= my <= y2:
-                self._person_selected[i] = not self._person_selected[i]
-                self.box_toggled.emit(i, True, self._person_selected[i])
-                self.update()
-                return
+        # Prüfe Personen-Boxen (obere = zuletzt gezeichnete zuerst)
+        # Check person boxes (front-most = last drawn wins)
+        i = self._person_grid.hit(mx, my)
+        if i is not None:
+            self._person_selected[i] = not self._person_selected[i]
+            self.box_toggled.emit(i, True, self._person_selected[i])
+            self._schedule_update(self._person_areas[i])
+            return
 
         # Prüfe Watermark-Boxen / Check watermark boxes
-        for i in range(len(self._wm_boxes) - 1, -1, -1):
-            box = self._wm_boxes[i]
-            x1, y1 = int(box.x1 * sx), int(box.y1 * sy)
-            x2, y2 = int(box.x2 * sx), int(box.y2 * sy)
-            if x1 <= mx <= x2 and y1 <= my <= y2:
-                self._wm_selected[i] = not self._wm_selected[i]
-                self.box_toggled.emit(i, False, self._wm_selected[i])
-                self.update()
-                return
+        i = self._wm_grid.hit(mx, my)
+        if i is not None:
+            self._wm_selected[i] = not self._wm_selected[i]
+            self.box_toggled.emit(i, False, self._wm_selected[i])
+            self._schedule_update(self._wm_areas[i])
 
 
 class DetectionSelectionDialog(QDialog):
@@ -233,6 +507,10 @@ class DetectionSelectionDialog(QDialog):
     or watermarks are found. Shows interactive image + checkbox list.
     """
 
+    # Bis zu dieser Bildgröße ohne QScrollArea einbetten
+    # Embed without a QScrollArea up to this image size
+    INLINE_IMAGE_MAX = QSize(700, 600)
+
     def __init__(
         self,
         image: np.ndarray,
@@ -250,118 +528,10 @@ class DetectionSelectionDialog(QDialog):
 
         self.setWindowTitle(f"Erkennung auswählen — {filename}" if filename else "Erkennung auswählen")
         self.setMinimumSize(900, 600)
-        self.setStyleSheet(self._dialog_style())
+        self.setStyleSheet(_DIALOG_STYLESHEET)
 
         self._setup_ui(image, person_boxes, wm_boxes, filename)
 
-    def _dialog_style(self) -> str:
-        return """
-        QDialog {
-            background-color: #0f0f1e;
-        }
-        QLabel {
-            color: #c0c0e0;
-            font-family: 'Lexend', 'Segoe UI', sans-serif;
-            font-size: 13px;
-        }
-        QLabel#dialog-title {
-            font-size: 16px;
-            font-weight: 700;
-            color: #ffffff;
-        }
-        QLabel#dialog-subtitle {
-            font-size: 12px;
-            color: #8888aa;
-        }
-        QCheckBox {
-            color: #e0e0e0;
-            font-family: 'Lexend', 'Segoe UI', sans-serif;
-            font-size: 13px;
-            spacing: 8px;
-            padding: 6px 8px;
-            border-radius: 6px;
-        }
-        QCheckBox:hover {
-            background: rgba(168, 85, 247, 0.1);
-        }
-        QCheckBox::indicator {
-            width: 20px; height: 20px;
-            border-radius: 4px;
-            border: 2px solid rgba(255, 255, 255, 0.2);
-            background: rgba(20, 20, 40, 0.8);
-        }
-        QCheckBox::indicator:checked {
-            background: qlineargradient(x1:0, y1:0, x2:1, y2:1,
-                stop:0 #6c5ce7, stop:1 #a855f7);
-            border: 2px solid #6c5ce7;
-        }
-        QPushButton {
-            font-family: 'Lexend', 'Segoe UI', sans-serif;
-            font-size: 13px;
-            font-weight: 600;
-            border: none;
-            border-radius: 8px;
-            padding: 10px 20px;
-            color: white;
-            min-height: 20px;
-        }
-        QPushButton#primary {
-            background: qlineargradient(x1:0, y1:0, x2:1, y2:1,
-                stop:0 #6c5ce7, stop:1 #a855f7);
-        }
-        QPushButton#primary:hover {
-            background: qlineargradient(x1:0, y1:0, x2:1, y2:1,
-                stop:0 #7c6cf7, stop:1 #b865ff);
-        }
-        QPushButton#secondary {
-            background: rgba(60, 60, 90, 0.6);
-            border: 1px solid rgba(255, 255, 255, 0.1);
-        }
-        QPushButton#secondary:hover {
-            background: rgba(80, 80, 110, 0.7);
-        }
-        QPushButton#skip {
-            background: rgba(231, 76, 60, 0.3);
-            border: 1px solid rgba(231, 76, 60, 0.4);
-        }
-        QPushButton#skip:hover {
-            background: rgba(231, 76, 60, 0.5);
-        }
-        QGroupBox {
-            background-color: rgba(30, 30, 55, 0.6);
-            border: 1px solid rgba(255, 255, 255, 0.08);
-            border-radius: 12px;
-            padding: 16px;
-            padding-top: 28px;
-            margin-top: 8px;
-            font-family: 'Lexend', 'Segoe UI', sans-serif;
-            font-size: 13px;
-            font-weight: 600;
-            color: #b0b0d0;
-        }
-        QGroupBox::title {
-            subcontrol-origin: margin;
-            subcontrol-position: top left;
-            padding: 4px 12px;
-        }
-        QComboBox {
-            background: rgba(20, 20, 40, 0.8);
-            border: 1px solid rgba(255, 255, 255, 0.1);
-            border-radius: 8px;
-            padding: 8px 12px;
-            color: #e0e0e0;
-            font-size: 13px;
-            min-width: 100px;
-        }
-        QComboBox QAbstractItemView {
-            background: #1a1a2e;
-            border: 1px solid rgba(255, 255, 255, 0.1);
-            selection-background-color: #6c5ce7;
-            color: #e0e0e0;
-        }
-        QScrollArea { border: none; background: transparent; }
-        """
-
     def _setup_ui(
         self,
         image: np.ndarray,
@@ -397,11 +567,21 @@ class DetectionSelectionDialog(QDialog):
         self._detection_widget.set_data(image, person_boxes, wm_boxes)
         self._detection_widget.box_toggled.connect(self._on_box_toggled_from_image)
 
-        img_scroll = QScrollArea()
-        img_scroll.setWidget(self._detection_widget)
-        img_scroll.setWidgetResizable(False)
-        img_scroll.setMinimumWidth(450)
-        content.addWidget(img_scroll, 3)
+        # Passt das Bild, entfällt der Viewport der QScrollArea beim Neuzeichnen
+        # If the image fits, repaints skip the QScrollArea viewport
+        pixmap_size = self._detection_widget.pixmap_size()
+        if (
+            pixmap_size.width() <= self.INLINE_IMAGE_MAX.width()
+            and pixmap_size.height() <= self.INLINE_IMAGE_MAX.height()
+        ):
+            self._detection_widget.setMinimumWidth(max(450, pixmap_size.width()))
+            content.addWidget(self._detection_widget, 3)
+        else:
+            img_scroll = QScrollArea()
+            img_scroll.setWidget(self._detection_widget)
+            img_scroll.setWidgetResizable(False)
+            img_scroll.setMinimumWidth(450)
+            content.addWidget(img_scroll, 3)
 
         # Checkbox-Liste / Checkbox list
         list_widget = QWidget()
@@ -527,8 +707,8 @@ class DetectionSelectionDialog(QDialog):
 
     def _on_keep_all(self) -> None:
         self._result = SelectionResult(
-            selected_persons=list(self._person_boxes),
-            selected_watermarks=list(self._wm_boxes),
+            selected_persons=self._person_boxes,
+            selected_watermarks=self._wm_boxes,
             apply_rule=self._get_rule(),
         )
         self.accept()
@@ -4,13 +4,12 @@ Dialog zur manuellen Markierung eines Watermarks im ersten Bild.
 Der markierte Bereich wird als Template fuer Template-Matching gespeichert.
 """
 
-import cv2
 import numpy as np
 from PyQt6.QtCore import Qt, QPoint, QRect
 from PyQt6.QtGui import (
     QColor,
     QFont,
-    QImage,
+    QFontMetrics,
     QMouseEvent,
     QPainter,
     QPen,
@@ -27,6 +26,7 @@ from PyQt6.QtWidgets import (
 )
 
 from src.core.detector import BoundingBox
+from src.ui.preview_widget import cached_qpixmap
 
 
 # --- Farben / Colors ---
@@ -34,20 +34,6 @@ SELECTION_COLOR = QColor(231, 76, 60, 200)  # Rot / Red
 SELECTION_FILL = QColor(231, 76, 60, 40)    # Halbtransparent / Semi-transparent
 
 
-def _numpy_to_qpixmap(image: np.ndarray, max_size: int = 800) -> QPixmap:
-    """BGR NumPy -> QPixmap (skaliert). / BGR NumPy -> QPixmap (scaled)."""
-    rgb = cv2.cvtColor(image, cv2.COLOR_BGR2RGB)
-    h, w, ch = rgb.shape
-    if max(h, w) > max_size:
-        scale = max_size / max(h, w)
-        new_w, new_h = int(w * scale), int(h * scale)
-        rgb = cv2.resize(rgb, (new_w, new_h), interpolation=cv2.INTER_AREA)
-        h, w = new_h, new_w
-    bytes_per_line = ch * w
-    qimage = QImage(rgb.data, w, h, bytes_per_line, QImage.Format.Format_RGB888)
-    return QPixmap.fromImage(qimage.copy())
-
-
 class RectangleSelectorWidget(QWidget):
     """Widget zum Zeichnen eines Auswahlrechtecks auf einem Bild.
 
@@ -63,6 +49,14 @@ class RectangleSelectorWidget(QWidget):
         self._start_point = QPoint()
         self._end_point = QPoint()
         self._selection: QRect | None = None
+        # Zuletzt gezeichneter Auswahlbereich (Rahmen + Größenlabel) für update(rect)
+        # Last painted selection area (frame + size label) for update(rect)
+        self._last_area = QRect()
+        self._label_font = QFont("Lexend", 9)
+        self._label_metrics = QFontMetrics(self._label_font)
+        self._pen = QPen(SELECTION_COLOR)
+        self._pen.setWidth(2)
+        self._pen.setStyle(Qt.PenStyle.DashLine)
         self.setMinimumSize(400, 300)
         self.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Expanding)
         self.setCursor(Qt.CursorShape.CrossCursor)
@@ -70,12 +64,21 @@ class RectangleSelectorWidget(QWidget):
     def set_image(self, image: np.ndarray, max_size: int = 800) -> None:
         """Setzt das Hintergrundbild. / Sets the background image."""
         self._original_shape = (image.shape[0], image.shape[1])
-        self._pixmap = _numpy_to_qpixmap(image, max_size=max_size)
+        self._pixmap = cached_qpixmap(image, max_size=max_size)
         self.setMinimumSize(self._pixmap.width(), self._pixmap.height())
         self.setMaximumSize(self._pixmap.width(), self._pixmap.height())
+        # Pixmap deckt das Widget komplett ab → kein Hintergrund nötig
+        # The pixmap covers the whole widget → no background fill needed
+        self.setAttribute(Qt.WidgetAttribute.WA_OpaquePaintEvent)
         self._selection = None
+        self._last_area = QRect()
         self.update()
 
+    def clear_selection(self) -> None:
+        """Entfernt die Auswahl. / Clears the selection."""
+        self._selection = None
+        self._update_selection()
+
     def get_selection_box(self) -> BoundingBox | None:
         """Gibt die Auswahl als BoundingBox in Originalkoordinaten zurueck.
 
@@ -99,31 +102,57 @@ class RectangleSelectorWidget(QWidget):
 
         return BoundingBox(x1=x1, y1=y1, x2=x2, y2=y2, confidence=1.0)
 
+    def _visible_rect(self) -> QRect | None:
+        """Das zu zeichnende Auswahlrechteck (None, wenn zu klein)."""
+        rect = None
+        if self._drawing:
+            rect = QRect(self._start_point, self._end_point).normalized()
+        elif self._selection is not None:
+            rect = self._selection.normalized()
+        if rect and rect.width() > 2 and rect.height() > 2:
+            return rect
+        return None
+
+    def _update_selection(self) -> None:
+        """Zeichnet nur alten + neuen Auswahlbereich neu statt des ganzen Widgets.
+
+        Repaints only the old and new selection area instead of the whole widget.
+        """
+        area = QRect()
+        rect = self._visible_rect()
+        if rect is not None:
+            fm = self._label_metrics
+            label = f"{rect.width()} x {rect.height()}"
+            label_rect = QRect(
+                rect.x() + 4, rect.y() - 6 - fm.ascent(),
+                fm.horizontalAdvance(label), fm.height(),
+            )
+            # Stiftbreite 2 + Antialiasing / pen width 2 + antialiasing
+            area = rect.united(label_rect).adjusted(-3, -3, 3, 3)
+        dirty = area.united(self._last_area)
+        self._last_area = area
+        if not dirty.isEmpty():
+            self.update(dirty)
+
     def paintEvent(self, event) -> None:
         if self._pixmap is None:
             return
         painter = QPainter(self)
         painter.setRenderHint(QPainter.RenderHint.Antialiasing)
-        painter.drawPixmap(0, 0, self._pixmap)
+        # Nur den beschädigten Ausschnitt des Hintergrunds blitten
+        # Blit only the damaged part of the background
+        damage = event.rect().intersected(self._pixmap.rect())
+        painter.drawPixmap(damage, self._pixmap, damage)
 
         # Aktive Auswahl zeichnen / Draw active selection
-        rect = None
-        if self._drawing:
-            rect = QRect(self._start_point, self._end_point).normalized()
-        elif self._selection is not None:
-            rect = self._selection.normalized()
-
-        if rect and rect.width() > 2 and rect.height() > 2:
-            pen = QPen(SELECTION_COLOR)
-            pen.setWidth(2)
-            pen.setStyle(Qt.PenStyle.DashLine)
-            painter.setPen(pen)
+        rect = self._visible_rect()
+        if rect is not None:
+            painter.setPen(self._pen)
             painter.setBrush(SELECTION_FILL)
             painter.drawRect(rect)
 
             # Groessenanzeige / Size indicator
-            font = QFont("Lexend", 9)
-            painter.setFont(font)
+            painter.setFont(self._label_font)
             painter.setPen(QColor(255, 255, 255, 220))
             label = f"{rect.width()} x {rect.height()}"
             painter.drawText(rect.x() + 4, rect.y() - 6, label)
@@ -138,7 +167,7 @@ class RectangleSelectorWidget(QWidget):
             self._start_point = event.pos()
             self._end_point = event.pos()
             self._selection = None
-            self.update()
+            self._update_selection()
 
     def mouseMoveEvent(self, event: QMouseEvent | None) -> None:
         if event is None:
@@ -147,8 +176,13 @@ class RectangleSelectorWidget(QWidget):
             # Clamp innerhalb des Bildes / Clamp within image bounds
             x = max(0, min(event.pos().x(), self._pixmap.width() - 1))
             y = max(0, min(event.pos().y(), self._pixmap.height() - 1))
-            self._end_point = QPoint(x, y)
-            self.update()
+            end_point = QPoint(x, y)
+            # Gleicher Pixel (Jitter, Klemmung am Rand) → nichts neu zu zeichnen
+            # Same pixel (jitter, clamped at the edge) → nothing to repaint
+            if end_point == self._end_point:
+                return
+            self._end_point = end_point
+            self._update_selection()
 
     def mouseReleaseEvent(self, event: QMouseEvent | None) -> None:
         if event is None:
@@ -158,7 +192,7 @@ class RectangleSelectorWidget(QWidget):
             rect = QRect(self._start_point, self._end_point).normalized()
             if rect.width() > 5 and rect.height() > 5:
                 self._selection = rect
-            self.update()
+            self._update_selection()
 
 
 class WatermarkTemplateDialog(QDialog):
@@ -227,8 +261,7 @@ class WatermarkTemplateDialog(QDialog):
 
     def _on_reset(self) -> None:
         """Setzt die Auswahl zurueck. / Resets the selection."""
-        self._selector._selection = None
-        self._selector.update()
+        self._selector.clear_selection()
 
     def _on_apply(self) -> None:
         """Uebernimmt die Auswahl. / Applies the selection."""
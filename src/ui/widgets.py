@@ -1,6 +1,8 @@
 """Wiederverwendbare UI-Komponenten für die Smart Image Cropper App."""
 
-from PyQt6.QtCore import Qt, pyqtSignal
+from PyQt6.QtCore import QEvent, QObject, QRectF, Qt, pyqtSignal
+from PyQt6.QtGui import QPainter
+from PyQt6.QtSvg import QSvgRenderer
 from PyQt6.QtWidgets import (
     QFrame,
     QHBoxLayout,
@@ -28,6 +30,26 @@ class StyledButton(QPushButton):
         self.setCursor(Qt.CursorShape.PointingHandCursor)
 
 
+class SvgLogo(QWidget):
+    """Zeichnet einen bereits geparsten QSvgRenderer (kein erneutes XML-Parsing)."""
+
+    def __init__(self, renderer: QSvgRenderer, parent=None):
+        super().__init__(parent)
+        self._renderer = renderer
+
+    def paintEvent(self, event) -> None:
+        painter = QPainter(self)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        # Seitenverhaeltnis beibehalten, im Widget zentrieren
+        # Keep aspect ratio, center inside the widget
+        size = self._renderer.defaultSize().toSizeF()
+        size.scale(self.width(), self.height(), Qt.AspectRatioMode.KeepAspectRatio)
+        x = (self.width() - size.width()) / 2
+        y = (self.height() - size.height()) / 2
+        self._renderer.render(painter, QRectF(x, y, size.width(), size.height()))
+        painter.end()
+
+
 class StyledSlider(QWidget):
     """Slider mit Label und Wert-Anzeige."""
 
@@ -183,6 +205,11 @@ class ProgressCard(QFrame):
         )
         self._progress_fill.setFixedWidth(0)
         layout.addWidget(self._progress_bar)
+        # Balkenbreite nur bei Resize abfragen, nicht bei jedem Fortschritt
+        # Query the bar width on resize only, not on every progress update
+        self._bar_pixels = 0
+        self._progress = (0, 0)
+        self._progress_bar.installEventFilter(self)
 
         # Stats-Zeile
         stats_row = QHBoxLayout()
@@ -208,11 +235,30 @@ class ProgressCard(QFrame):
 
         layout.addLayout(stats_row)
 
+    def eventFilter(self, obj: QObject | None, event: QEvent | None) -> bool:
+        if (
+            obj is self._progress_bar
+            and event is not None
+            and event.type() == QEvent.Type.Resize
+        ):
+            self._bar_pixels = self._progress_bar.width()
+            self._update_fill()
+        return super().eventFilter(obj, event)
+
+    def _update_fill(self) -> None:
+        current, total = self._progress
+        if total > 0:
+            bar_width = max(0, self._bar_pixels * current // total)
+            # setFixedWidth löst ein Relayout aus → nur bei Änderung
+            # setFixedWidth triggers a relayout → only when it changes
+            if bar_width != self._progress_fill.width():
+                self._progress_fill.setFixedWidth(bar_width)
+
     def set_progress(self, current: int, total: int, filename: str = "") -> None:
         if total > 0:
-            pct = int(current / total * 100)
-            bar_width = int(self._progress_bar.width() * current / total)
-            self._progress_fill.setFixedWidth(max(0, bar_width))
+            self._progress = (current, total)
+            self._update_fill()
+            pct = current * 100 // total
             self._status_label.setText(
                 f"{current}/{total} ({pct}%) — {filename}"
             )
@@ -2,6 +2,8 @@
 
 import json
 import os
+from collections.abc import Mapping
+from types import MappingProxyType
 from typing import Any
 
 from src.utils.logger import get_logger
@@ -39,6 +41,8 @@ class ConfigManager:
     def __init__(self, config_path: str = "config/settings.json"):
         self._config_path = config_path
         self._config: dict[str, Any] = {}
+        # Ungespeicherte Änderungen seit dem letzten save() / unsaved changes
+        self._dirty = False
         self._load()
 
     def _load(self) -> None:
@@ -50,18 +54,27 @@ class ConfigManager:
                     saved = json.load(f)
                 self._config.update(saved)
                 logger.info("Konfiguration geladen: %s", self._config_path)
-            except (json.JSONDecodeError, OSError) as e:
+            except json.JSONDecodeError as e:
+                # Defekte Datei beim nächsten save() mit den Defaults überschreiben
+                # Rewrite the corrupt file with the defaults on the next save()
+                self._dirty = True
+                logger.warning("Fehler beim Laden der Konfiguration: %s", e)
+            except OSError as e:
                 logger.warning("Fehler beim Laden der Konfiguration: %s", e)
         else:
+            self._dirty = True
             self.save()
             logger.info("Default-Konfiguration erstellt: %s", self._config_path)
 
     def save(self) -> None:
-        """Speichert die aktuelle Konfiguration."""
+        """Speichert die aktuelle Konfiguration (nur wenn sich etwas geändert hat)."""
+        if not self._dirty:
+            return
         os.makedirs(os.path.dirname(self._config_path), exist_ok=True)
         try:
             with open(self._config_path, "w", encoding="utf-8") as f:
                 json.dump(self._config, f, indent=4, ensure_ascii=False)
+            self._dirty = False
         except OSError as e:
             logger.error("Fehler beim Speichern der Konfiguration: %s", e)
 
@@ -69,7 +82,15 @@ class ConfigManager:
         return self._config.get(key, default)
 
     def set(self, key: str, value: Any) -> None:
-        self._config[key] = value
+        if key not in self._config or self._config[key] != value:
+            self._config[key] = value
+            self._dirty = True
+
+    def update(self, values: dict[str, Any]) -> None:
+        """Uebernimmt mehrere Werte auf einmal (ohne zu speichern)."""
+        for key, value in values.items():
+            self.set(key, value)
 
-    def get_all(self) -> dict[str, Any]:
-        return dict(self._config)
+    def get_all(self) -> Mapping[str, Any]:
+        """Schreibgeschützte Sicht auf die Konfiguration (keine Kopie)."""
+        return MappingProxyType(self._config)
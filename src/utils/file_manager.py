@@ -1,6 +1,9 @@
 """Datei-Scanning & IO mit cv2.imencode für zuverlässiges Speichern."""
 
+import logging
 import os
+import threading
+from collections.abc import Callable, Iterator
 from pathlib import Path
 
 import cv2
@@ -16,18 +19,81 @@ SUPPORTED_FORMATS = {".jpg", ".jpeg", ".png", ".bmp", ".webp"}
 class FileManager:
     """Verwaltet Datei-Scanning und Bild-IO."""
 
+    # Fortschritts-Callback von scan_directory alle N gefundenen Bilder
+    SCAN_PROGRESS_BATCH = 500
+
+    # Bereits angelegte Zielordner: makedirs nur beim ersten Bild pro Ordner
+    # Output folders already created: makedirs only for the first image per folder
+    _ensured_dirs: set[str] = set()
+    _ensured_dirs_lock = threading.Lock()
+
+    @staticmethod
+    def _ensure_dir(directory: str) -> None:
+        """os.makedirs(exist_ok=True), pro Ordner nur einmal je Prozess."""
+        if directory in FileManager._ensured_dirs:
+            return
+        with FileManager._ensured_dirs_lock:
+            os.makedirs(directory, exist_ok=True)
+            FileManager._ensured_dirs.add(directory)
+
     @staticmethod
-    def scan_directory(directory: str, formats: set[str] | None = None) -> list[str]:
-        """Scannt ein Verzeichnis nach unterstützten Bilddateien."""
+    def iter_directory(
+        directory: str, formats: set[str] | None = None
+    ) -> Iterator[os.DirEntry[str]]:
+        """Liefert unterstützte Bilddateien eines Verzeichnisses lazy (unsortiert).
+
+        Hält nur den aktuellen Eintrag im Speicher; für Aufrufer, die keine
+        Sortierung brauchen oder nur die ersten N (heapq.nsmallest) wollen.
+        """
         if not os.path.isdir(directory):
             logger.warning("Verzeichnis nicht gefunden: %s", directory)
-            return []
+            return
+
+        # Endungen ohne Punkt: Vergleich per rpartition statt Path(...).suffix je Eintrag
+        # Suffixes without the dot: compare via rpartition instead of Path(...).suffix
+        suffixes = {s.lstrip(".") for s in formats or SUPPORTED_FORMATS}
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                stem, dot, ext = entry.name.rpartition(".")
+                # Erst die Endung (reiner String-Test), dann is_file() (ggf. stat)
+                # Suffix first (pure string test), then is_file() (may stat)
+                if stem and ext.lower() in suffixes and entry.is_file():
+                    yield entry
 
-        fmt = formats or SUPPORTED_FORMATS
-        files = []
-        for entry in sorted(os.scandir(directory), key=lambda e: e.name.lower()):
-            if entry.is_file() and Path(entry.name).suffix.lower() in fmt:
-                files.append(entry.path)
+    @staticmethod
+    def scan_directory(
+        directory: str,
+        formats: set[str] | None = None,
+        progress_callback: Callable[[int], None] | None = None,
+        case_sensitive_sort: bool = False,
+    ) -> list[str]:
+        """Scannt ein Verzeichnis nach unterstützten Bilddateien (nach Name sortiert).
+
+        ``progress_callback`` erhält alle SCAN_PROGRESS_BATCH Treffer die
+        bisherige Anzahl (für Fortschrittsanzeigen bei großen Ordnern).
+        ``case_sensitive_sort`` sortiert nach Byte-Reihenfolge der Pfade und
+        spart den kleingeschriebenen Sortierschlüssel pro Datei.
+        """
+        paths: list[str] = []
+        names: list[str] = []
+        for entry in FileManager.iter_directory(directory, formats):
+            paths.append(entry.path)
+            if not case_sensitive_sort:
+                names.append(entry.name.lower())
+            if (
+                progress_callback is not None
+                and len(paths) % FileManager.SCAN_PROGRESS_BATCH == 0
+            ):
+                progress_callback(len(paths))
+
+        if case_sensitive_sort:
+            # Gleiches Verzeichnis-Präfix → Pfad-Reihenfolge = Namens-Reihenfolge
+            # Shared directory prefix → path order equals name order
+            paths.sort()
+            files = paths
+        else:
+            order = sorted(range(len(paths)), key=names.__getitem__)
+            files = [paths[i] for i in order]
 
         logger.info("%d Bilder gefunden in: %s", len(files), directory)
         return files
@@ -36,7 +102,9 @@ class FileManager:
     def load_image(path: str) -> np.ndarray | None:
         """Lädt ein Bild als BGR NumPy-Array."""
         try:
-            data = np.fromfile(path, dtype=np.uint8)
+            # Ein read() in ein bytes-Objekt, NumPy-View ohne Kopie darauf
+            # One read() into a bytes object, zero-copy NumPy view on top
+            data = np.frombuffer(Path(path).read_bytes(), dtype=np.uint8)
             img = cv2.imdecode(data, cv2.IMREAD_COLOR)
             if img is None:
                 logger.warning("Bild konnte nicht dekodiert werden: %s", path)
@@ -51,46 +119,94 @@ class FileManager:
         output_path: str,
         quality: int = 95,
     ) -> bool:
-        """Speichert ein Bild mit cv2.imencode + nativer File-IO."""
+        """Speichert ein Bild mit cv2.imwrite bzw. cv2.imencode + nativer File-IO.
+
+        cv2.imwrite kann unter Windows keine Nicht-ASCII-Pfade öffnen; nur dann
+        wird über imencode + open() geschrieben.
+        """
         ext = Path(output_path).suffix.lower()
+        if ext in (".jpg", ".jpeg"):
+            params = [cv2.IMWRITE_JPEG_QUALITY, quality]
+            encode_ext = ".jpg"
+        elif ext == ".png":
+            params = [cv2.IMWRITE_PNG_COMPRESSION, 6]
+            encode_ext = ".png"
+        elif ext == ".webp":
+            params = [cv2.IMWRITE_WEBP_QUALITY, quality]
+            encode_ext = ".webp"
+        else:
+            params = []
+            encode_ext = ext
+        directory = os.path.dirname(output_path)
         try:
-            if ext in (".jpg", ".jpeg"):
-                params = [cv2.IMWRITE_JPEG_QUALITY, quality]
-                success, buf = cv2.imencode(".jpg", image, params)
-            elif ext == ".png":
-                params = [cv2.IMWRITE_PNG_COMPRESSION, 6]
-                success, buf = cv2.imencode(".png", image, params)
-            elif ext == ".webp":
-                params = [cv2.IMWRITE_WEBP_QUALITY, quality]
-                success, buf = cv2.imencode(".webp", image, params)
-            else:
-                success, buf = cv2.imencode(ext, image)
-
-            if not success:
-                logger.error("imencode fehlgeschlagen: %s", output_path)
-                return False
-
-            os.makedirs(os.path.dirname(output_path), exist_ok=True)
-            with open(output_path, "wb") as f:
-                f.write(buf.tobytes())
-
-            file_size = os.path.getsize(output_path)
-            if file_size == 0:
-                logger.error("Leere Datei geschrieben: %s", output_path)
+            FileManager._ensure_dir(directory)
+            error = FileManager._write_image(image, output_path, params, encode_ext)
+            if error is not None and directory and not os.path.isdir(directory):
+                # Zielordner wurde während des Batches gelöscht → neu anlegen, einmal erneut
+                # Output folder was deleted mid-batch → recreate it and retry once
+                with FileManager._ensured_dirs_lock:
+                    FileManager._ensured_dirs.discard(directory)
+                FileManager._ensure_dir(directory)
+                error = FileManager._write_image(image, output_path, params, encode_ext)
+            if error is not None:
+                logger.error("%s: %s", error, output_path)
                 return False
-
-            logger.debug("Gespeichert: %s (%d bytes)", output_path, file_size)
             return True
 
         except Exception as e:
             logger.error("Fehler beim Speichern: %s — %s", output_path, e)
             return False
 
+    @staticmethod
+    def _write_image(
+        image: np.ndarray, output_path: str, params: list[int], encode_ext: str
+    ) -> str | None:
+        """Kodiert und schreibt ein Bild; gibt bei Fehler die Ursache zurück, sonst None."""
+        # ASCII-Pfad: ein C-Aufruf (Encoding + Schreiben) ohne Python-Puffer
+        # ASCII path: one C call (encode + write) without a Python-side buffer
+        if output_path.isascii():
+            if not cv2.imwrite(output_path, image, params):
+                return "imwrite fehlgeschlagen"
+            # Pro Bild: Argumente nur bei aktivem DEBUG anfassen
+            # Per image: only touch the arguments when DEBUG is enabled
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Gespeichert: %s", output_path)
+            return None
+
+        success, buf = cv2.imencode(encode_ext, image, params)
+        if not success:
+            return "imencode fehlgeschlagen"
+        # Leeres Ergebnis vor dem Schreiben erkennen statt per getsize() danach
+        # Catch an empty result before writing instead of a getsize() afterwards
+        if buf is None or buf.size == 0:
+            return "Leeres Encoding, nichts geschrieben"
+
+        try:
+            with open(output_path, "wb") as f:
+                # Zusammenhängendes uint8-Array → direkt schreiben, ohne bytes-Kopie
+                # Contiguous uint8 array → write directly, without a bytes copy
+                written = f.write(memoryview(buf))
+        except OSError as e:
+            return f"Datei nicht schreibbar ({e})"
+        if written != buf.size:
+            return f"Unvollständig geschrieben ({written} von {buf.size} bytes)"
+
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Gespeichert: %s (%d bytes)", output_path, buf.size)
+        return None
+
     @staticmethod
     def ensure_output_dir(directory: str) -> bool:
-        """Erstellt das Output-Verzeichnis falls nötig."""
+        """Erstellt das Output-Verzeichnis falls nötig.
+
+        Wird pro Batch aufgerufen und vergisst dabei die bekannten Ordner,
+        falls seitdem welche gelöscht wurden.
+        """
         try:
-            os.makedirs(directory, exist_ok=True)
+            with FileManager._ensured_dirs_lock:
+                FileManager._ensured_dirs.clear()
+                os.makedirs(directory, exist_ok=True)
+                FileManager._ensured_dirs.add(directory)
             return True
         except OSError as e:
             logger.error("Kann Verzeichnis nicht erstellen: %s — %s", directory, e)
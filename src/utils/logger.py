@@ -1,9 +1,11 @@
 """Logging-Setup mit Rotation."""
 
+import atexit
 import logging
 import os
+import queue
 import sys
-from logging.handlers import RotatingFileHandler
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 
 
 def setup_logging(log_dir: str = "logs", level: int = logging.INFO) -> logging.Logger:
@@ -31,13 +33,23 @@ def setup_logging(log_dir: str = "logs", level: int = logging.INFO) -> logging.L
         datefmt="%Y-%m-%d %H:%M:%S",
     )
     file_handler.setFormatter(file_fmt)
-    logger.addHandler(file_handler)
 
     console_handler = logging.StreamHandler()
     console_handler.setLevel(logging.WARNING)
     console_fmt = logging.Formatter("[%(levelname)s] %(message)s")
     console_handler.setFormatter(console_fmt)
-    logger.addHandler(console_handler)
+
+    # Datei/Konsole schreibt ein Hintergrund-Thread; Worker stellen nur in die Queue
+    # A background thread writes file/console; workers only enqueue records
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    logger.addHandler(QueueHandler(log_queue))
+    listener = QueueListener(
+        log_queue, file_handler, console_handler, respect_handler_level=True
+    )
+    listener.start()
+    # Beim Beenden restliche Einträge schreiben / flush remaining records on exit
+    atexit.register(listener.stop)
+    logger.queue_listener = listener  # type: ignore[attr-defined]
 
     return logger
 
@@ -6,6 +6,10 @@ import time
 class StatsCollector:
     """Sammelt Statistiken während der Bildverarbeitung."""
 
+    # Gewicht des neuesten Bild-Intervalls im gleitenden Mittel
+    # Weight of the newest per-image interval in the moving average
+    SPEED_EMA_ALPHA = 0.1
+
     def __init__(self):
         self.reset()
 
@@ -16,31 +20,61 @@ class StatsCollector:
         self.errors: int = 0
         self.persons_found: int = 0
         self.watermarks_found: int = 0
-        self._start_time: float = 0.0
-        self._end_time: float = 0.0
+        # Monotone Uhr: Systemzeit-Korrekturen (NTP) ergeben keine negative Dauer
+        # Monotonic clock: wall-clock adjustments (NTP) cannot make elapsed negative
+        self._start_time: float | None = None
+        self._end_time: float | None = None
+        # EMA der Sekunden pro Bild (None bis zum ersten tick)
+        # EMA of seconds per image (None until the first tick)
+        self._ema_interval: float | None = None
+        self._last_tick: float | None = None
 
     def start(self) -> None:
-        self._start_time = time.time()
-        self._end_time = 0.0
+        self._start_time = time.monotonic()
+        self._end_time = None
+        self._ema_interval = None
+        self._last_tick = self._start_time
+
+    def tick(self) -> None:
+        """Nach jedem abgearbeiteten Bild (auch übersprungen/Fehler) aufrufen."""
+        now = time.monotonic()
+        if self._last_tick is not None:
+            dt = now - self._last_tick
+            if self._ema_interval is None:
+                self._ema_interval = dt
+            else:
+                a = self.SPEED_EMA_ALPHA
+                self._ema_interval = (1 - a) * self._ema_interval + a * dt
+        self._last_tick = now
 
     def stop(self) -> None:
-        self._end_time = time.time()
+        self._end_time = time.monotonic()
 
     @property
     def elapsed(self) -> float:
-        if self._start_time == 0:
+        if self._start_time is None:
             return 0.0
-        end = self._end_time if self._end_time > 0 else time.time()
+        end = self._end_time if self._end_time is not None else time.monotonic()
         return end - self._start_time
 
     @property
-    def speed(self) -> float:
-        """Bilder pro Sekunde."""
+    def average_speed(self) -> float:
+        """Erfolgreich verarbeitete Bilder pro Sekunde über den ganzen Batch."""
         elapsed = self.elapsed
         if elapsed <= 0 or self.processed == 0:
             return 0.0
         return self.processed / elapsed
 
+    @property
+    def speed(self) -> float:
+        """Aktuelle Bilder pro Sekunde (gleitendes Mittel der letzten Intervalle).
+
+        Ohne tick()-Daten: Durchschnitt über den ganzen Batch.
+        """
+        if self._ema_interval is None or self._ema_interval <= 0:
+            return self.average_speed
+        return 1.0 / self._ema_interval
+
     @property
     def success_rate(self) -> float:
         """Erfolgsrate in Prozent."""
@@ -64,6 +98,6 @@ class StatsCollector:
             "persons_found": self.persons_found,
             "watermarks_found": self.watermarks_found,
             "elapsed": round(self.elapsed, 1),
-            "speed": round(self.speed, 2),
+            "speed": round(self.average_speed, 2),
             "success_rate": round(self.success_rate, 1),
         }
@@ -105,6 +105,21 @@ class TestCropEngine:
         assert result.x2 <= 1000
         assert result.y2 <= 800
 
+    def test_region_uses_python_ints(self):
+        """Koordinaten aus dem Array-Kernel sind plain ints (für Qt/Slicing)."""
+        boxes = [
+            BoundingBox(100, 100, 300, 500, 0.9),
+            BoundingBox(500, 150, 700, 550, 0.8),
+        ]
+        wm_boxes = [BoundingBox(0, 300, 120, 340, 0.7)]
+        result = self.engine.calculate_crop_region(
+            self.image_shape, boxes, padding_percent=10, watermark_boxes=wm_boxes
+        )
+        assert result is not None
+        assert result.x1 == 120
+        for v in (result.x1, result.y1, result.x2, result.y2):
+            assert type(v) is int
+
     def test_crop_image(self):
         """Tatsächliches Zuschneiden eines Arrays."""
         img = np.zeros((800, 1000, 3), dtype=np.uint8)
@@ -114,3 +129,40 @@ class TestCropEngine:
         cropped = self.engine.crop_image(img, region)
         assert cropped.shape == (500, 200, 3)
         assert np.all(cropped == 255)
+
+    def test_crop_view_shares_memory(self):
+        """crop_view liefert denselben Ausschnitt ohne Kopie."""
+        img = np.zeros((800, 1000, 3), dtype=np.uint8)
+        region = CropRegion(200, 100, 400, 600)
+        view = self.engine.crop_view(img, region)
+        assert view.shape == (500, 200, 3)
+        assert np.shares_memory(view, img)
+        assert np.array_equal(view, self.engine.crop_image(img, region))
+
+    def test_crop_into_reuses_buffer(self):
+        """crop_into füllt den übergebenen Puffer statt neu zu allozieren."""
+        img = np.arange(100 * 120 * 3, dtype=np.uint8).reshape(100, 120, 3)
+        out = np.empty((40, 30, 3), dtype=np.uint8)
+        for region in (CropRegion(10, 20, 40, 60), CropRegion(50, 0, 80, 40)):
+            result = self.engine.crop_into(img, region, out)
+            assert result is out
+            assert np.array_equal(out, self.engine.crop_image(img, region))
+
+    def test_crop_images_batch_views(self):
+        """Mehrere Regionen als Views, über den Bildrand hinaus geklemmt."""
+        img = np.arange(100 * 120 * 3, dtype=np.uint8).reshape(100, 120, 3)
+        regions = [CropRegion(10, 20, 50, 60), CropRegion(-5, 90, 130, 120)]
+        views = self.engine.crop_images_batch(img, regions)
+        assert views[0].shape == (40, 40, 3)
+        assert views[1].shape == (10, 120, 3)
+        assert all(np.shares_memory(v, img) for v in views)
+        assert np.array_equal(views[0], self.engine.crop_image(img, regions[0]))
+
+    def test_crop_images_batch_copy(self):
+        """copy=True liefert unabhängige Kopien mit gleichem Inhalt."""
+        img = np.arange(100 * 120 * 3, dtype=np.uint8).reshape(100, 120, 3)
+        regions = [CropRegion(10, 20, 50, 60), CropRegion(0, 0, 120, 5)]
+        crops = self.engine.crop_images_batch(img, regions, copy=True)
+        for crop, region in zip(crops, regions):
+            assert not np.shares_memory(crop, img)
+            assert np.array_equal(crop, self.engine.crop_view(img, region))
@@ -5,7 +5,7 @@ import os
 import numpy as np
 import pytest
 
-from src.core.detector import BoundingBox, PersonDetector
+from src.core.detector import BoundingBox, BoundingBoxes, PersonDetector
 
 
 class TestBoundingBox:
@@ -21,6 +21,33 @@ class TestBoundingBox:
         assert box.confidence == 0.73
 
 
+class TestBoundingBoxes:
+    def test_roundtrip(self):
+        """Liste → Struct-of-Arrays → Liste bleibt unverändert."""
+        boxes = [BoundingBox(10, 20, 110, 220, 0.95), BoundingBox(5, 6, 7, 8, 0.5)]
+        soa = BoundingBoxes.from_list(boxes)
+        assert soa.coords.shape == (2, 4)
+        assert len(soa) == 2
+        assert soa[1] == boxes[1]
+        assert soa.to_list() == boxes
+        assert list(soa) == boxes
+
+    def test_from_arrays_truncates(self):
+        """Float-Koordinaten werden wie int() abgeschnitten."""
+        soa = BoundingBoxes.from_arrays(
+            np.array([[10.9, 20.2, 110.7, 220.99]], dtype=np.float32),
+            np.array([0.5], dtype=np.float32),
+        )
+        box = soa[0]
+        assert (box.x1, box.y1, box.x2, box.y2) == (10, 20, 110, 220)
+        assert type(box.x1) is int
+        assert box.confidence == 0.5
+
+    def test_empty(self):
+        assert len(BoundingBoxes.from_list(None)) == 0
+        assert BoundingBoxes.from_list([]).to_list() == []
+
+
 class TestPersonDetector:
     def test_init(self):
         detector = PersonDetector(
@@ -31,6 +58,26 @@ class TestPersonDetector:
         assert detector._confidence == 0.6
         assert detector._use_gpu is False
 
+    def test_half_default_when_gpu(self):
+        """FP16 ist standardmaessig an und wirkt nur auf CUDA."""
+        calls = []
+
+        def model(source, **kwargs):
+            calls.append((kwargs["device"], kwargs.get("half")))
+            return []
+
+        detector = PersonDetector(use_gpu=True)
+        assert detector._half is True
+        detector._model = model
+        detector.detect(np.zeros((100, 100, 3), dtype=np.uint8))
+        detector.set_gpu(False)
+        detector.detect(np.zeros((100, 100, 3), dtype=np.uint8))
+        assert calls == [("cuda", True), ("cpu", False)]
+
+    def test_half_disabled(self):
+        detector = PersonDetector(use_gpu=True, half=False)
+        assert detector._half is False
+
     def test_set_confidence(self):
         detector = PersonDetector()
         detector.set_confidence(0.8)
@@ -45,6 +92,19 @@ class TestPersonDetector:
         detector = PersonDetector(model_path="nonexistent/model.pt")
         assert detector.load_model() is False
 
+    def test_model_cache_reuses_instance(self, tmp_path, monkeypatch):
+        """Detektoren mit gleichem Pfad und Device teilen sich das Model."""
+        model_file = tmp_path / "model.pt"
+        model_file.write_bytes(b"")
+        model = object()
+        monkeypatch.setattr(
+            PersonDetector, "_model_cache", {(str(model_file), "cpu"): model}
+        )
+        a = PersonDetector(model_path=str(model_file), use_gpu=False)
+        b = PersonDetector(model_path=str(model_file), use_gpu=False)
+        assert a.load_model() is True and b.load_model() is True
+        assert a._model is model and b._model is model
+
     @pytest.mark.skipif(
         not os.path.exists("models/yolov8n.pt"),
         reason="YOLO model nicht vorhanden",
@@ -63,6 +123,74 @@ class TestPersonDetector:
         boxes = detector.detect(img)
         assert isinstance(boxes, list)
 
+    def test_warmup_runs(self):
+        """Warm-up schickt den Dummy-Frame durch das Model."""
+        shapes = []
+
+        def model(source, **kwargs):
+            shapes.append(source.shape)
+            return []
+
+        detector = PersonDetector(use_gpu=False)
+        detector._model = model
+        detector._warmup()
+        size = PersonDetector.WARMUP_SIZE
+        assert shapes and all(shape == (size, size, 3) for shape in shapes)
+
+    def test_warmup_failure_is_not_fatal(self):
+        """Ein fehlschlagender Warm-up darf load_model nicht abbrechen."""
+        calls = []
+
+        def failing_model(*args, **kwargs):
+            calls.append(kwargs.get("device"))
+            raise RuntimeError("kein CUDA")
+
+        detector = PersonDetector(use_gpu=False)
+        detector._model = failing_model
+        detector._warmup()
+        assert calls == ["cpu"]
+
+    def test_detect_batch_one_result_per_image(self):
+        """Ein Forward-Pass fuer alle Bilder, eine Box-Liste pro Bild."""
+        calls = []
+
+        class _Tensor:
+            def __init__(self, array):
+                self.array = array
+
+            def cpu(self):
+                return self
+
+            def numpy(self):
+                return self.array
+
+        class _Result:
+            def __init__(self, xyxy, conf):
+                self.boxes = _Boxes(_Tensor(xyxy), _Tensor(conf))
+
+        class _Boxes:
+            def __init__(self, xyxy, conf):
+                self.xyxy = xyxy
+                self.conf = conf
+
+        def fake_model(source, **kwargs):
+            calls.append(source)
+            return [
+                _Result(np.array([[1.7, 2.2, 30.9, 40.0]]), np.array([0.9])),
+                _Result(np.empty((0, 4)), np.empty(0)),
+            ]
+
+        detector = PersonDetector(use_gpu=False)
+        detector._model = fake_model
+        images = [np.zeros((100, 100, 3), dtype=np.uint8) for _ in range(3)]
+        result = detector.detect_batch(images)
+
+        assert len(calls) == 1 and calls[0] is images
+        assert result == [[BoundingBox(1, 2, 30, 40, 0.9)], [], []]
+
+    def test_detect_batch_empty(self):
+        assert PersonDetector(model_path="nonexistent.pt").detect_batch([]) == []
+
     def test_detect_without_model(self):
         """Detect ohne geladenes Model bei fehlendem Pfad gibt leere Liste."""
         detector = PersonDetector(model_path="nonexistent.pt")
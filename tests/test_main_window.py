@@ -0,0 +1,208 @@
+"""Unit Tests fuer die Vorschau-Navigation im MainWindow (offscreen)."""
+
+import os
+import threading
+import time
+
+import cv2
+import numpy as np
+import pytest
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+QtWidgets = pytest.importorskip("PyQt6.QtWidgets")
+QtCore = pytest.importorskip("PyQt6.QtCore")
+
+from src.core.detector import BoundingBox  # noqa: E402
+from src.core.processor import DirectoryScanSignals, PreviewLoadSignals  # noqa: E402
+from src.ui.main_window import _QUEUED, MainWindow  # noqa: E402
+from src.ui.preview_widget import render_preview  # noqa: E402
+from src.utils.config import ConfigManager  # noqa: E402
+
+
+class _FakeDetector:
+    """Detektor-Attrappe: kein Model, keine Erkennung."""
+
+    last_error = None
+
+    def detect(self, image):
+        return []
+
+    def set_confidence(self, confidence):
+        pass
+
+    def set_gpu(self, use_gpu):
+        pass
+
+
+class _SlowLoader(QtCore.QThread):
+    """Modell-Loader-Attrappe, die kurz laeuft und dann Detektoren meldet."""
+
+    model_ready = QtCore.pyqtSignal(object, object)
+    error_occurred = QtCore.pyqtSignal(str)
+
+    def run(self):
+        time.sleep(0.3)
+        self.model_ready.emit(_FakeDetector(), None)
+
+
+@pytest.fixture(scope="module")
+def app():
+    return QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
+
+
+@pytest.fixture
+def window(app, tmp_path):
+    config = ConfigManager(str(tmp_path / "settings.json"))
+    win = MainWindow(config, preloaded_detectors=(_FakeDetector(), None))
+    win._image_paths = [str(tmp_path / f"bild{i}.jpg") for i in range(3)]
+    win._preview.set_image_count(3)
+    yield win
+    win._cancel_prefetch()
+    win.close()
+
+
+def _prefetched_result(window, index):
+    """Ergebnis-Tupel wie von PreviewLoadSignals.preview_done."""
+    original = np.zeros((120, 160, 3), dtype=np.uint8)
+    boxes = [BoundingBox(10, 10, 60, 80, 0.9)]
+    rendered = render_preview(original, None, boxes, [], None, 100)
+    return (index, None, rendered, boxes, [], f"bild{index}.jpg", None)
+
+
+class TestPreviewPrefetch:
+    """Tests fuer vorab geladene Nachbar-Vorschauen."""
+
+    def test_navigate_onto_prefetched_index_shows_preview(self, window):
+        """Next auf ein vorab geladenes Bild zeigt das Ergebnis sofort an."""
+        key = window._preview_cache_key_for(window._image_paths[1])
+        window._prefetch_cache[key] = _prefetched_result(window, 1)
+
+        # Navigation laeuft ueber den Slot (sender() ist gesetzt)
+        # Navigation goes through the slot, so sender() is set
+        window._preview._go_next()
+
+        assert key not in window._prefetch_cache
+        assert window._preview_detections is not None
+        assert window._preview_detections[0] == window._image_paths[1]
+        assert window._eta_label.text() == "bild1.jpg: 1 Person(en)"
+
+    def test_prefetch_hit_uses_current_index(self, window):
+        """Ein Prefetch-Treffer wird unter dem aktuellen Index angezeigt."""
+        key = window._preview_cache_key_for(window._image_paths[2])
+        # Beim Prefetch stand das Bild noch auf Index 1 / was index 1 at prefetch time
+        window._prefetch_cache[key] = _prefetched_result(window, 1)
+        window._load_preview_for_index(2)
+
+        assert window._preview._current_index == 2
+        assert window._preview_detections[0] == window._image_paths[2]
+
+    def test_rescan_invalidates_prefetch(self, window):
+        """Ein neuer Scan verwirft vorab geladene Ergebnisse."""
+        key = window._preview_cache_key_for(window._image_paths[1])
+        window._prefetch_cache[key] = _prefetched_result(window, 1)
+        window._apply_scan_result(list(window._image_paths))
+        assert not window._prefetch_cache
+
+    def test_adopted_prefetch_finished_before_adoption(self, app, window):
+        """Ein Prefetch, der schon vor der Übernahme emittiert hat, wird angezeigt."""
+        signals = PreviewLoadSignals()
+        signals.preview_done.connect(window._on_prefetch_done, _QUEUED)
+        key = window._preview_cache_key_for(window._image_paths[1])
+        window._prefetch_pending[key] = (signals, threading.Event())
+
+        # Ergebnis liegt bereits in der Event-Queue / result already queued
+        signals.preview_done.emit(*_prefetched_result(window, 1))
+        window._preview._go_next()
+        assert window._preview_signals is signals
+        app.processEvents()
+
+        assert window._preview_detections is not None
+        assert window._preview_detections[0] == window._image_paths[1]
+        assert window._preview_btn.isEnabled()
+
+
+class TestPreviewCache:
+    """Tests fuer bereits gerenderte (gecachte) Vorschauen."""
+
+    def test_slider_change_after_returning_to_cached_preview(self, window, monkeypatch):
+        """Slider nach Rückkehr auf eine gecachte Vorschau schneidet dieses Bild neu zu."""
+        for path in window._image_paths:
+            cv2.imwrite(path, np.zeros((120, 160, 3), dtype=np.uint8))
+        monkeypatch.setattr(window, "_prefetch_neighbours", lambda index: None)
+        for index in (0, 1):
+            key = window._preview_cache_key_for(window._image_paths[index])
+            window._prefetch_cache[key] = _prefetched_result(window, index)
+            window._load_preview_for_index(index)
+
+        window._load_preview_for_index(0)  # aus dem Pixmap-Cache / from the pixmap cache
+        assert window._preview_detections[0] == window._image_paths[0]
+
+        cropped = []
+        monkeypatch.setattr(
+            window, "_show_cropped_preview", lambda *args: cropped.append(args[3])
+        )
+        window._padding_slider.setValue(window._padding_slider.value() + 5)
+        window._recompute_preview_only()
+        assert cropped == ["bild0.jpg"]
+
+
+class TestPreviewModelWait:
+    """Tests fuer Navigation waehrend auf die Modelle gewartet wird."""
+
+    def test_navigation_during_wait_loads_latest_index(self, window, monkeypatch):
+        """Prev/Next waehrend der Warte-Loop: nur der zuletzt gewählte Index lädt."""
+        started = []
+
+        def fake_start(index, *args, **kwargs):
+            started.append(index)
+            return PreviewLoadSignals()
+
+        monkeypatch.setattr(window, "_start_preview_task", fake_start)
+        monkeypatch.setattr(window, "_prefetch_neighbours", lambda index: None)
+        window._preview_detector = None
+        loader = _SlowLoader()
+        loader.model_ready.connect(window._on_models_loaded)
+        window._model_loader = loader
+        loader.start()
+
+        # Zwei Klicks auf Next, waehrend die Warte-Loop laeuft
+        # Two Next clicks while the wait loop is running
+        QtCore.QTimer.singleShot(50, window._preview._go_next)
+        QtCore.QTimer.singleShot(100, window._preview._go_next)
+        window._load_preview_for_index(0)
+        loader.wait()
+
+        assert started == [2]
+        assert window._deferred_preview_index is None
+
+
+class TestDirectoryScan:
+    """Tests fuer den asynchronen Ordner-Scan."""
+
+    def test_stale_scan_of_same_directory_ignored(self, window, tmp_path):
+        """Ein älterer Scan desselben Ordners landet nicht unter dem neuen Key."""
+        key = (str(tmp_path), 2)
+        current = DirectoryScanSignals()
+        stale = DirectoryScanSignals()
+        for signals in (current, stale):
+            signals.scan_complete.connect(window._on_scan_complete)
+        window._scan_pending_key = key
+        window._scan_signals = current
+
+        stale.scan_complete.emit(str(tmp_path), ["alt.jpg"])
+        assert key not in window._scan_cache
+
+        current.scan_complete.emit(str(tmp_path), ["neu.jpg"])
+        assert window._scan_cache[key] == ["neu.jpg"]
+        assert window._image_paths == ["neu.jpg"]
+
+    def test_scan_resets_navigation(self, app, window, tmp_path):
+        """Während des Scans zeigt die Navigation keine alten Bilder mehr an."""
+        (tmp_path / "a.jpg").write_bytes(b"")
+        window._scan_images(str(tmp_path))
+        assert window._image_paths == []
+        assert window._preview._total_images == 0
+
+        QtCore.QThreadPool.globalInstance().waitForDone()
+        app.processEvents()
+        assert window._preview._total_images == 1
@@ -1,11 +1,15 @@
 """Unit Tests fuer WatermarkDetector und TemplateWatermarkMatcher."""
 
+import logging
+import threading
+
 import cv2
 import numpy as np
 import pytest
 
-from src.core.detector import BoundingBox
+from src.core.detector import BoundingBox, BoundingBoxes
 from src.core.watermark import (
+    BatchCoalescer,
     TemplateWatermarkMatcher,
     WatermarkDetector,
     _compute_iou,
@@ -77,6 +81,36 @@ class TestDeduplicateBoxes:
         result = _deduplicate_boxes(boxes, iou_threshold=0.5)
         assert len(result) == 2
 
+    def test_contained_box_removed(self):
+        """Kleine Box in grosser Box gilt trotz niedriger IoU als Duplikat."""
+        boxes = [
+            BoundingBox(0, 0, 200, 200, 0.9),
+            BoundingBox(10, 10, 60, 60, 0.8),
+        ]
+        result = _deduplicate_boxes(boxes, iou_threshold=0.5)
+        assert result == [boxes[0]]
+
+    def test_sorted_by_confidence_stable(self):
+        """Ergebnis nach Confidence absteigend, Gleichstand in Eingabe-Reihenfolge."""
+        boxes = [
+            BoundingBox(0, 0, 10, 10, 0.5),
+            BoundingBox(100, 0, 110, 10, 0.9),
+            BoundingBox(200, 0, 210, 10, 0.5),
+        ]
+        result = _deduplicate_boxes(boxes)
+        assert result == [boxes[1], boxes[0], boxes[2]]
+
+    def test_struct_of_arrays_input(self):
+        """BoundingBoxes-Container liefert dasselbe Ergebnis wie die Liste."""
+        boxes = [
+            BoundingBox(0, 0, 100, 100, 0.7),
+            BoundingBox(5, 5, 105, 105, 0.9),
+            BoundingBox(300, 300, 400, 400, 0.5),
+        ]
+        packed = BoundingBoxes.from_list(boxes)
+        assert _deduplicate_boxes(packed) == _deduplicate_boxes(boxes)
+        assert _deduplicate_boxes(BoundingBoxes.from_list(boxes[:1])) == boxes[:1]
+
 
 class TestWatermarkDetectorFilters:
     """Tests fuer die Plausibilitaetsfilter des WatermarkDetectors."""
@@ -142,9 +176,54 @@ class TestWatermarkDetectorFilters:
         box = BoundingBox(0, 900, 500, 1000, 0.8)  # 50000 / 1000000 = 5%
         assert self.detector._is_plausible_watermark(box, 1000, 1000) is True
 
+    def test_plausible_mask_matches_scalar(self):
+        """Vektorisierte Masken entsprechen den Einzel-Praedikaten."""
+        boxes = [
+            BoundingBox(100, 900, 300, 980, 0.8),
+            BoundingBox(400, 400, 600, 600, 0.8),
+            BoundingBox(0, 0, 600, 600, 0.8),
+            BoundingBox(900, 400, 990, 600, 0.8),
+            BoundingBox(10, 400, 20, 900, 0.8),
+        ]
+        coords = BoundingBoxes.from_list(boxes).coords
+        for strict in (True, False):
+            self.detector._strict_filter = strict
+            assert self.detector._edge_mask(coords, 1000, 1000).tolist() == [
+                self.detector._is_edge_region(b, 1000, 1000) for b in boxes
+            ]
+            assert self.detector._plausible_mask(coords, 1000, 1000).tolist() == [
+                self.detector._is_plausible_watermark(b, 1000, 1000) for b in boxes
+            ]
+
+    def test_filter_plausible_debug_logs_rejections(self, caplog):
+        """Unter DEBUG entscheidet dieselbe Maske, pro Ablehnung eine Log-Zeile."""
+        boxes = BoundingBoxes.from_list([
+            BoundingBox(100, 900, 300, 980, 0.8),
+            BoundingBox(400, 400, 600, 600, 0.8),
+            BoundingBox(0, 0, 600, 600, 0.8),
+            BoundingBox(10, 400, 20, 900, 0.8),
+        ])
+        expected = self.detector._filter_plausible(boxes, 1000, 1000).coords.tolist()
+
+        caplog.set_level(logging.DEBUG, logger="SmartImageCropper")
+        kept = self.detector._filter_plausible(boxes, 1000, 1000)
+        assert kept.coords.tolist() == expected == [[100, 900, 300, 980]]
+        reasons = [r.getMessage() for r in caplog.records if "gefiltert" in r.getMessage()]
+        assert len(reasons) == 3
+        assert "nicht am Rand" in reasons[0]
+        assert "zu gross" in reasons[1]
+        assert "Seitenverhaeltnis" in reasons[2]
+
+    def test_detect_tiny_image_skips_inference(self):
+        """Thumbnails unter MIN_INFER_AREA werden ohne Model-Laden uebersprungen."""
+        img = np.zeros((150, 150, 3), dtype=np.uint8)
+        assert self.detector.detect(img) == []
+        assert self.detector._model is None
+        assert self.detector.last_error is None
+
     def test_detect_without_model_returns_empty(self):
         """Detect ohne geladenes Model bei fehlendem Pfad gibt leere Liste."""
-        img = np.zeros((100, 100, 3), dtype=np.uint8)
+        img = np.zeros((300, 300, 3), dtype=np.uint8)
         result = self.detector.detect(img)
         assert result == []
 
@@ -175,6 +254,12 @@ class TestPreprocessForDetection:
         result_std = np.std(cv2.cvtColor(result, cv2.COLOR_BGR2GRAY).astype(float))
         assert result_std >= orig_std
 
+    def test_high_contrast_skipped(self):
+        """Kontrastreiche Bilder werden unveraendert (dasselbe Objekt) zurueckgegeben."""
+        img = np.zeros((200, 200, 3), dtype=np.uint8)
+        img[:, 100:] = 255
+        assert WatermarkDetector._preprocess_for_detection(img) is img
+
 
 class TestTemplateWatermarkMatcher:
     """Tests fuer den Template-Matcher."""
@@ -224,6 +309,23 @@ class TestTemplateWatermarkMatcher:
         )
         assert found_near, f"Logo nicht an erwarteter Position gefunden: {boxes}"
 
+    def test_pyramid_matches_full_resolution(self):
+        """Grob-zu-fein-Suche liefert dieselben Treffer wie die Vollsuche."""
+        rng = np.random.default_rng(0)
+        img = cv2.GaussianBlur(
+            rng.integers(0, 255, (400, 600), dtype=np.uint8), (0, 0), 3
+        )
+        logo = cv2.GaussianBlur(
+            rng.integers(0, 255, (60, 120), dtype=np.uint8), (0, 0), 2
+        )
+        img[330:390, 470:590] = logo
+
+        full = self.matcher._match_at_scales(img, logo, 400, 600, 0.6)
+        coarse = self.matcher._match_at_scales(img, logo, 400, 600, 0.6, pyramid=True)
+        key = sorted((b.x1, b.y1, b.x2, b.y2) for b in full)
+        assert key
+        assert sorted((b.x1, b.y1, b.x2, b.y2) for b in coarse) == key
+
     def test_no_match_on_blank(self):
         """Kein Match auf komplett schwarzem Bild mit weissem Template."""
         img = np.zeros((400, 600, 3), dtype=np.uint8)
@@ -265,9 +367,140 @@ class TestWatermarkDetectorInit:
         d.set_enhanced_detection(True)
         assert d._enhanced_detection is True
 
+    def test_cpu_model_falls_back_without_int8(self):
+        """Ohne INT8-ONNX-Datei wird das regulaere Modell genutzt."""
+        d = WatermarkDetector(model_path="nonexistent.pt", use_gpu=False)
+        sentinel = object()
+        d._model = sentinel
+        assert d._get_cpu_model() is sentinel
+
     def test_template_matcher_property(self):
         d = WatermarkDetector(model_path="x.pt", use_gpu=False)
         assert d.template_matcher is None
         matcher = TemplateWatermarkMatcher()
         d.template_matcher = matcher
         assert d.template_matcher is matcher
+
+
+class _FakeTensor:
+    """Minimaler Tensor-Ersatz mit .cpu().numpy() / Minimal tensor stand-in."""
+
+    def __init__(self, data):
+        self._data = np.asarray(data)
+
+    def cpu(self):
+        return self
+
+    def numpy(self):
+        return self._data
+
+
+class _FakeBoxes:
+    def __init__(self, xyxy, conf):
+        self.xyxy = _FakeTensor(xyxy)
+        self.conf = _FakeTensor(conf)
+
+    def __len__(self):
+        return len(self.conf.numpy())
+
+
+class _FakeResult:
+    def __init__(self, xyxy, conf):
+        self.boxes = _FakeBoxes(xyxy, conf)
+
+
+class TestResultsToArrays:
+    """Tests fuer die SoA-Umwandlung der YOLO-Ergebnisse."""
+
+    def test_empty_results(self):
+        xyxy, confs = WatermarkDetector._results_to_arrays([])
+        assert xyxy.shape == (0, 4)
+        assert confs.shape == (0,)
+
+    def test_concatenates_results(self):
+        results = [
+            _FakeResult([[1.7, 2.2, 30.9, 40.1]], [0.8]),
+            _FakeResult(np.zeros((0, 4)), np.zeros((0,))),
+            _FakeResult([[5, 6, 7, 8], [9, 10, 11, 12]], [0.5, 0.4]),
+        ]
+        xyxy, confs = WatermarkDetector._results_to_arrays(results)
+        assert xyxy.dtype == np.int32
+        assert xyxy.tolist() == [[1, 2, 30, 40], [5, 6, 7, 8], [9, 10, 11, 12]]
+        assert confs.tolist() == pytest.approx([0.8, 0.5, 0.4])
+
+
+class _FakeModel:
+    """YOLO-Ersatz, der immer dieselben Ergebnisse liefert."""
+
+    def __init__(self, results):
+        self._results = results
+
+    def __call__(self, source, **kwargs):
+        return self._results
+
+
+class TestYoloPipeline:
+    """Tests fuer den Weg von YOLO-Ergebnissen zu BoundingBox-Listen."""
+
+    def setup_method(self):
+        self.detector = WatermarkDetector(
+            model_path="nonexistent.pt", confidence=0.3, use_gpu=False
+        )
+
+    def test_run_batch_returns_arrays_per_image(self):
+        self.detector._model = _FakeModel([_FakeResult([[1, 2, 30, 40]], [0.8])])
+        images = [np.zeros((4, 4, 3), dtype=np.uint8)] * 2
+        per_image = self.detector._run_batch(images, (0.3, False))
+        assert [len(boxes) for boxes in per_image] == [1, 0]
+        assert isinstance(per_image[1], BoundingBoxes)
+
+    def test_detect_keeps_only_plausible(self):
+        """Nur die plausible Box am Rand kommt als BoundingBox zurueck."""
+        self.detector._model = _FakeModel([
+            _FakeResult([[100, 900, 300, 980], [400, 400, 600, 600]], [0.8, 0.9])
+        ])
+        result = self.detector.detect(np.zeros((1000, 1000, 3), dtype=np.uint8))
+        assert [(b.x1, b.y1, b.x2, b.y2) for b in result] == [(100, 900, 300, 980)]
+
+    def test_bottom_zoom_maps_back_to_image(self):
+        """Boxen aus dem 3x-Zoom landen im unteren Streifen des Originals."""
+        self.detector._model = _FakeModel([_FakeResult([[300, 150, 901, 300]], [0.5])])
+        image = np.zeros((1000, 1000, 3), dtype=np.uint8)
+        result = self.detector._detect_bottom_text_zoomed(image)
+        assert [(b.x1, b.y1, b.x2, b.y2) for b in result] == [(100, 900, 300, 950)]
+
+
+class TestBatchCoalescer:
+    """Tests fuer das Micro-Batching paralleler Inferenz-Anfragen."""
+
+    def test_results_dispatched_per_caller(self):
+        batch_sizes = []
+
+        def run_batch(images, key):
+            batch_sizes.append(len(images))
+            return [int(img[0, 0, 0]) + key for img in images]
+
+        coalescer = BatchCoalescer(run_batch, max_batch=8, max_latency=0.05)
+        results = {}
+
+        def worker(value):
+            img = np.full((4, 4, 3), value, dtype=np.uint8)
+            results[value] = coalescer.submit(img, 100)
+
+        threads = [threading.Thread(target=worker, args=(v,)) for v in range(6)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join(timeout=5)
+
+        assert results == {v: v + 100 for v in range(6)}
+        assert sum(batch_sizes) == 6
+        assert max(batch_sizes) > 1
+
+    def test_exception_propagates(self):
+        def run_batch(images, key):
+            raise RuntimeError("boom")
+
+        coalescer = BatchCoalescer(run_batch)
+        with pytest.raises(RuntimeError):
+            coalescer.submit(np.zeros((4, 4, 3), dtype=np.uint8), None)